@@ -0,0 +1,133 @@
+"""
+챗봇 대화 세션 서비스
+
+튜터가 이전 대화를 기억하도록 세션별 대화 상태를 서버 메모리에 보관합니다.
+- Ollama가 돌려준 context(토큰 배열)를 다음 턴에 그대로 넘겨, 매 턴 새 사용자 메시지만 평가되게 함
+- context가 없거나(Gemini 응답, 모델 변경) 상한을 넘으면 최근 N턴만 담은 프롬프트로 다시 시작
+- 세션 TTL, 전체 세션 수 상한, 세션당 보관 턴 수 상한
+"""
+
+import os
+import time
+import uuid
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+CHAT_SESSION_TTL = int(os.getenv("CHAT_SESSION_TTL", "1800"))                # 마지막 턴 이후 보관 시간(초)
+CHAT_SESSION_MAX = int(os.getenv("CHAT_SESSION_MAX", "500"))                 # 보관할 최대 세션 수
+CHAT_SESSION_MAX_TURNS = int(os.getenv("CHAT_SESSION_MAX_TURNS", "20"))      # 세션당 보관 턴 수
+CHAT_SESSION_WINDOW = int(os.getenv("CHAT_SESSION_WINDOW", "6"))             # context 재구성 시 포함할 최근 턴 수
+CHAT_SESSION_MAX_CONTEXT = int(os.getenv("CHAT_SESSION_MAX_CONTEXT", "6000"))  # 이어 쓸 context 최대 토큰 수
+
+
+class ChatSession:
+    __slots__ = ("id", "model", "context", "turns", "updated_at", "lock")
+
+    def __init__(self, session_id: str):
+        self.id = session_id
+        self.model: Optional[str] = None
+        self.context: Optional[List[int]] = None
+        self.turns: List[Tuple[str, str]] = []
+        self.updated_at = time.time()
+        self.lock = asyncio.Lock()
+
+
+class ChatSessionStore:
+    def __init__(
+        self,
+        ttl: int = CHAT_SESSION_TTL,
+        max_sessions: int = CHAT_SESSION_MAX,
+        max_turns: int = CHAT_SESSION_MAX_TURNS,
+        window: int = CHAT_SESSION_WINDOW,
+        max_context: int = CHAT_SESSION_MAX_CONTEXT,
+    ):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self.max_turns = max_turns
+        self.window = window
+        self.max_context = max_context
+        self._sessions: "OrderedDict[str, ChatSession]" = OrderedDict()
+        self._stats = {"created": 0, "expired": 0, "evicted": 0, "continued": 0, "rebuilt": 0}
+
+    def _purge(self) -> None:
+        cutoff = time.time() - self.ttl
+        for session_id in [sid for sid, s in self._sessions.items() if s.updated_at < cutoff]:
+            self._sessions.pop(session_id, None)
+            self._stats["expired"] += 1
+        # 상한 초과 시 가장 오래 쓰지 않은 세션부터 삭제
+        while len(self._sessions) >= self.max_sessions:
+            self._sessions.popitem(last=False)
+            self._stats["evicted"] += 1
+
+    def get_or_create(self, session_id: Optional[str]) -> ChatSession:
+        """session_id가 없거나 만료되었으면 새 세션을 만든다"""
+        session = self._sessions.get(session_id) if session_id else None
+        if session is not None and session.updated_at >= time.time() - self.ttl:
+            self._sessions.move_to_end(session.id)
+            return session
+        self._purge()
+        session = ChatSession(uuid.uuid4().hex)
+        self._sessions[session.id] = session
+        self._stats["created"] += 1
+        return session
+
+    def reset(self, session_id: str) -> bool:
+        return self._sessions.pop(session_id, None) is not None
+
+    def build_prompt(self, session: ChatSession, system_prompt: str, message: str, model: str) -> Tuple[str, Optional[List[int]]]:
+        """
+        이번 턴의 (prompt, context) 반환
+
+        이어 쓸 수 있는 context가 있으면 새 질문만 보내고,
+        없으면 시스템 프롬프트 + 최근 window 턴 + 질문으로 프롬프트를 다시 만든다.
+        """
+        if session.context and session.model == model:
+            self._stats["continued"] += 1
+            return f"질문: {message}", session.context
+        if session.turns:
+            self._stats["rebuilt"] += 1
+        return self.full_prompt(session, system_prompt, message), None
+
+    def full_prompt(self, session: ChatSession, system_prompt: str, message: str) -> str:
+        """context를 쓸 수 없는 백엔드(Gemini)용: 최근 window 턴을 포함한 전체 프롬프트"""
+        history = "".join(
+            f"질문: {user}\n답변: {assistant}\n\n" for user, assistant in session.turns[-self.window:]
+        )
+        return f"{system_prompt}\n\n{history}질문: {message}"
+
+    def record(
+        self,
+        session: ChatSession,
+        message: str,
+        response: str,
+        model: str,
+        context: Optional[List[int]],
+    ) -> None:
+        """턴 결과 저장. context가 상한을 넘으면 버려서 다음 턴에 최근 턴만으로 다시 시작"""
+        session.turns.append((message, response))
+        del session.turns[:-self.max_turns]
+        if context and len(context) <= self.max_context:
+            session.context = list(context)
+        else:
+            session.context = None
+        session.model = model
+        session.updated_at = time.time()
+
+    def stats(self) -> Dict[str, Any]:
+        return dict(
+            self._stats,
+            active=len(self._sessions),
+            ttl_s=self.ttl,
+            max_sessions=self.max_sessions,
+            max_turns=self.max_turns,
+            window=self.window,
+            max_context_tokens=self.max_context,
+        )
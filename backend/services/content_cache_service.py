@@ -0,0 +1,180 @@
+"""
+LLM 응답 캐시 서비스
+
+콘텐츠 생성 API(/api/generate-content, /api/situational-content)의 최종 응답을
+SQLite에 저장해 같은 입력에 대한 재생성을 피합니다.
+- 키: 정규화된 프롬프트 입력 + 모델 + 백엔드 + 프롬프트 버전 태그의 SHA-256
+- 만료: TTL(초) 경과 시 조회 시점에 삭제
+- 용량: 전체 크기가 상한을 넘으면 마지막 접근이 오래된 항목부터 삭제 (LRU)
+- async 핸들러에서는 aget/aput을 사용 (SQLite I/O를 스레드에서 실행해 이벤트 루프를 막지 않음)
+"""
+
+import os
+import json
+import time
+import asyncio
+import sqlite3
+import hashlib
+import logging
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, Optional
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", "data/llm_cache.db")
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", str(7 * 24 * 3600)))
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", str(50 * 1024 * 1024)))
+
+
+def normalize_cache_input(value: Any) -> str:
+    """캐시 키용 입력 정규화 (NFC, 공백 축약, 소문자)"""
+    text = unicodedata.normalize("NFC", str(value or ""))
+    return " ".join(text.split()).lower()
+
+
+def make_cache_key(
+    endpoint: str,
+    inputs: Dict[str, Any],
+    model: str,
+    backend: str,
+    version: str,
+) -> str:
+    """엔드포인트/입력/모델/백엔드/프롬프트 버전으로 콘텐츠 주소(SHA-256) 생성"""
+    material = {
+        "endpoint": endpoint,
+        "inputs": {k: normalize_cache_input(v) for k, v in sorted(inputs.items())},
+        "model": model or "",
+        "backend": backend or "",
+        "version": version,
+    }
+    raw = json.dumps(material, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    def __init__(
+        self,
+        db_path: str = LLM_CACHE_PATH,
+        ttl: int = LLM_CACHE_TTL,
+        max_bytes: int = LLM_CACHE_MAX_BYTES,
+    ):
+        self.db_path = db_path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=5)
+
+    def _init_db(self):
+        """캐시 테이블 초기화"""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    endpoint TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_access ON llm_cache(last_access)")
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회. 없거나 만료되었으면 None"""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                value, created_at = row
+                if self.ttl > 0 and created_at + self.ttl < now:
+                    conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    conn.commit()
+                    return None
+                conn.execute(
+                    "UPDATE llm_cache SET last_access = ?, hits = hits + 1 WHERE key = ?",
+                    (now, key),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        try:
+            return json.loads(value)
+        except Exception:
+            return None
+
+    def put(self, key: str, value: Any, endpoint: str = "") -> None:
+        """캐시 저장 후 용량 상한을 넘으면 LRU 순으로 삭제"""
+        data = json.dumps(value, ensure_ascii=False)
+        size = len(data.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO llm_cache (key, endpoint, value, size, created_at, last_access, hits)
+                    VALUES (?, ?, ?, ?, ?, ?, 0)
+                    """,
+                    (key, endpoint, data, size, now, now),
+                )
+                self._evict(conn)
+                conn.commit()
+            finally:
+                conn.close()
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """get의 비동기 버전 (스레드에서 실행)"""
+        return await asyncio.to_thread(self.get, key)
+
+    async def aput(self, key: str, value: Any, endpoint: str = "") -> None:
+        """put의 비동기 버전 (스레드에서 실행)"""
+        await asyncio.to_thread(self.put, key, value, endpoint)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = conn.execute("SELECT key, size FROM llm_cache ORDER BY last_access ASC").fetchall()
+        victims = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM llm_cache WHERE key = ?", victims)
+        logger.info(f"LLM cache evicted {len(victims)} entries")
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 항목 수/총 크기/누적 히트"""
+        conn = self._connect()
+        try:
+            count, total, hits = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(hits), 0) FROM llm_cache"
+            ).fetchone()
+        finally:
+            conn.close()
+        return {"entries": count, "bytes": total, "hits": hits, "max_bytes": self.max_bytes, "ttl": self.ttl}
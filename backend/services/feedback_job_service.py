@@ -0,0 +1,136 @@
+"""
+백그라운드 피드백 작업 서비스
+
+점수 응답을 먼저 돌려주고 AI 피드백은 별도 작업으로 생성합니다.
+클라이언트는 작업 ID로 결과를 조회(polling)하거나 SSE로 완료 이벤트를 받습니다.
+- 메모리 저장, 완료 후 TTL이 지나면 삭제
+- 대기 중 작업도 FEEDBACK_JOB_PENDING_TTL이 지나면 취소, 최대 개수를 넘으면 오래된 작업부터 삭제
+- LLM 동시 실행 제한은 작업 내부의 llm_generate(admission)가 그대로 적용
+"""
+
+import os
+import time
+import uuid
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+FEEDBACK_JOB_TTL = int(os.getenv("FEEDBACK_JOB_TTL", "600"))        # 완료된 작업 보관 시간(초)
+FEEDBACK_JOB_PENDING_TTL = int(os.getenv("FEEDBACK_JOB_PENDING_TTL", "300"))  # 대기 중 작업 최대 실행 시간(초)
+FEEDBACK_JOB_MAX = int(os.getenv("FEEDBACK_JOB_MAX", "1000"))       # 보관할 최대 작업 수 (대기 중 포함)
+
+
+class FeedbackJobStore:
+    def __init__(
+        self,
+        ttl: int = FEEDBACK_JOB_TTL,
+        max_jobs: int = FEEDBACK_JOB_MAX,
+        pending_ttl: int = FEEDBACK_JOB_PENDING_TTL,
+    ):
+        self.ttl = ttl
+        self.max_jobs = max_jobs
+        self.pending_ttl = pending_ttl
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def _purge(self) -> None:
+        now = time.time()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job["status"] != "pending" and now - job["finished_at"] > self.ttl
+        ]
+        for job_id in expired:
+            self._jobs.pop(job_id, None)
+        # 너무 오래 걸리는 작업은 취소 (취소되면 failed로 끝나 위의 TTL로 삭제된다)
+        if self.pending_ttl > 0:
+            for job_id, task in list(self._tasks.items()):
+                job = self._jobs.get(job_id)
+                if job is not None and now - job["created_at"] > self.pending_ttl:
+                    logger.warning(f"feedback job {job_id} still pending after {self.pending_ttl}s, cancelling")
+                    task.cancel()
+        # 상한 초과 시 오래된 완료 작업부터, 그래도 넘으면 오래된 대기 작업까지 삭제
+        if len(self._jobs) >= self.max_jobs:
+            victims = sorted(
+                self._jobs.values(),
+                key=lambda job: (job["status"] == "pending", job["created_at"]),
+            )
+            for job in victims[: len(self._jobs) - self.max_jobs + 1]:
+                task = self._tasks.get(job["id"])
+                if task is not None:
+                    task.cancel()
+                self._jobs.pop(job["id"], None)
+
+    def submit(self, factory: Callable[[], Awaitable[Optional[str]]]) -> str:
+        """작업 등록 후 ID 반환. factory()의 결과(문자열 또는 None)가 피드백이 된다"""
+        self._purge()
+        job_id = uuid.uuid4().hex
+        self._jobs[job_id] = {
+            "id": job_id,
+            "status": "pending",
+            "ai_feedback": None,
+            "error": None,
+            "created_at": time.time(),
+            "finished_at": None,
+        }
+        task = asyncio.get_running_loop().create_task(self._run(job_id, factory))
+        # 시작 전에 취소된 작업은 _run이 실행되지 않으므로 정리는 완료 콜백에서 한다
+        task.add_done_callback(lambda _t: self._finish(job_id))
+        self._tasks[job_id] = task
+        return job_id
+
+    async def _run(self, job_id: str, factory: Callable[[], Awaitable[Optional[str]]]) -> None:
+        job = self._jobs[job_id]
+        try:
+            feedback = await factory()
+            job["ai_feedback"] = feedback
+            job["status"] = "done" if feedback else "empty"
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"feedback job {job_id} failed: {e}")
+            job["status"] = "failed"
+            job["error"] = str(e)
+
+    def _finish(self, job_id: str) -> None:
+        self._tasks.pop(job_id, None)
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        if job["status"] == "pending":
+            job["status"] = "failed"
+            job["error"] = "cancelled"
+        job["finished_at"] = time.time()
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        return {
+            "job_id": job_id,
+            "status": job["status"],
+            "ai_feedback": job["ai_feedback"],
+            "error": job["error"],
+            "elapsed": round((job["finished_at"] or time.time()) - job["created_at"], 3),
+        }
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """작업 완료(또는 timeout)까지 대기 후 상태 반환"""
+        task = self._tasks.get(job_id)
+        if task is not None:
+            try:
+                await asyncio.wait_for(asyncio.shield(task), timeout=timeout)
+            except (asyncio.TimeoutError, Exception):
+                pass
+        return self.get(job_id)
+
+    async def shutdown(self) -> None:
+        for task in list(self._tasks.values()):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
@@ -8,6 +8,8 @@ import json
 import base64
 import struct
 import os
+import sys
+from array import array
 from typing import Dict, Optional, Tuple
 import websockets
 from io import BytesIO
@@ -88,13 +90,45 @@ def convert_audio_to_pcm(audio_data: bytes, target_sample_rate: int = 8000) -> b
             raise ValueError(f"Audio conversion failed: {e}, {e2}")
 
 
-async def call_fluencypro_analyze(text: str, audio_data: bytes) -> Dict:
+def wav_to_pcm(wav_data: bytes, target_sample_rate: int = 8000) -> bytes:
+    """
+    이미 변환된 16-bit Mono WAV를 FluencyPro용 PCM으로 변환 (ffmpeg/pydub 재디코딩 없음)
+
+    샘플레이트가 목표의 정수배이면 인접 샘플 평균으로 다운샘플링한다 (16kHz -> 8kHz).
+    """
+    with wave.open(BytesIO(wav_data), "rb") as wf:
+        if wf.getnchannels() != 1 or wf.getsampwidth() != 2:
+            raise ValueError("WAV must be 16-bit mono")
+        rate = wf.getframerate()
+        frames = wf.readframes(wf.getnframes())
+
+    if rate == target_sample_rate:
+        return frames
+    if rate % target_sample_rate:
+        raise ValueError(f"Unsupported sample rate: {rate}")
+
+    factor = rate // target_sample_rate
+    samples = array("h")
+    samples.frombytes(frames[:len(frames) - len(frames) % 2])
+    if sys.byteorder != "little":
+        samples.byteswap()
+    out = array("h", (
+        sum(samples[i:i + factor]) // factor
+        for i in range(0, len(samples) - factor + 1, factor)
+    ))
+    if sys.byteorder != "little":
+        out.byteswap()
+    return out.tobytes()
+
+
+async def call_fluencypro_analyze(text: str, audio_data: bytes, pcm_data: Optional[bytes] = None) -> Dict:
     """
     FluencyPro API를 통한 유창성 분석
 
     Args:
         text: 평가 대상 한국어 문장
         audio_data: 음성 데이터 (bytes)
+        pcm_data: 이미 변환된 8kHz PCM (있으면 audio_data 변환 생략)
 
     Returns:
         Dict: 유창성 평가 결과
@@ -112,8 +146,9 @@ async def call_fluencypro_analyze(text: str, audio_data: bytes) -> Dict:
 
     try:
         # 1. 오디오를 8kHz PCM으로 변환
-        logger.info(f"Converting audio to PCM (8kHz, Mono, 16-bit)...")
-        pcm_data = convert_audio_to_pcm(audio_data, target_sample_rate=8000)
+        if pcm_data is None:
+            logger.info(f"Converting audio to PCM (8kHz, Mono, 16-bit)...")
+            pcm_data = convert_audio_to_pcm(audio_data, target_sample_rate=8000)
 
         # 2. WebSocket 연결
         logger.info(f"Connecting to FluencyPro: {FLUENCYPRO_WS_URL}")
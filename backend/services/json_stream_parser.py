@@ -0,0 +1,99 @@
+"""
+스트리밍 JSON 추출기
+
+LLM 토큰 스트림을 조각 단위로 받아, 균형 잡힌(balanced) 최상위 JSON 객체가
+완성되는 순간을 감지합니다. ```json 코드 블럭 안의 객체도 같은 방식으로 잡힙니다.
+필요한 키가 모두 있는 객체가 나오면 호출 측이 업스트림 스트림을 닫을 수 있습니다.
+"""
+
+import json
+from typing import Any, Dict, Iterable, Optional
+
+
+class StreamingJSONExtractor:
+    """
+    토큰 조각을 feed()로 누적하며 완성된 JSON 객체를 찾는 파서
+
+    Examples:
+        >>> ex = StreamingJSONExtractor(required_keys=("score",))
+        >>> ex.feed('Sure! ```json\\n{"sco')
+        >>> ex.feed('re": 90}\\n```')
+        {'score': 90}
+    """
+
+    def __init__(self, required_keys: Iterable[str] = ()):
+        self.required_keys = tuple(required_keys)
+        self.buffer = ""
+        self.result: Optional[Dict[str, Any]] = None
+        self._pos = 0          # 다음에 검사할 buffer 위치
+        self._start = -1       # 현재 후보 객체의 시작 위치 ('{')
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    @property
+    def done(self) -> bool:
+        return self.result is not None
+
+    def _reset_candidate(self, resume_at: int) -> None:
+        self._pos = resume_at
+        self._start = -1
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def _accept(self, candidate: str) -> bool:
+        try:
+            obj = json.loads(candidate)
+        except Exception:
+            return False
+        if not isinstance(obj, dict):
+            return False
+        if any(k not in obj for k in self.required_keys):
+            return False
+        self.result = obj
+        return True
+
+    def feed(self, piece: str) -> Optional[Dict[str, Any]]:
+        """토큰 조각 추가. 조건을 만족하는 객체가 완성되면 그 객체를 반환"""
+        if self.result is not None:
+            return self.result
+        if piece:
+            self.buffer += piece
+
+        buf = self.buffer
+        i = self._pos
+        while i < len(buf):
+            ch = buf[i]
+            if self._start < 0:
+                if ch == "{":
+                    self._start = i
+                    self._depth = 1
+                i += 1
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == "{":
+                self._depth += 1
+            elif ch == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    if self._accept(buf[self._start:i + 1]):
+                        self._pos = i + 1
+                        return self.result
+                    # 파싱 실패 또는 필수 키 누락: 후보 시작 다음 글자부터 다시 탐색
+                    self._reset_candidate(self._start + 1)
+                    i = self._pos
+                    continue
+            i += 1
+
+        self._pos = i
+        return None
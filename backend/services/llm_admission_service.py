@@ -0,0 +1,216 @@
+"""
+LLM 동시 실행 제어 서비스 (우선순위 admission)
+
+Ollama는 GPU 하나로 모든 요청을 처리하므로, 대화형 요청이 긴 콘텐츠 생성 뒤에서
+기다리지 않도록 우선순위 클래스별로 실행 슬롯을 배분합니다.
+- 우선순위: chatbot > feedback(발음 피드백) > content(콘텐츠 생성) > test > background
+- 전체 동시 실행 상한과 클래스별 동시 실행 상한
+- 대기열 길이 상한: 가득 차면 낮은 우선순위 대기자부터 LLMOverloadedError (HTTP 429 + Retry-After)
+- 대기열 깊이, 대기 시간(p50/p95/max) 통계
+"""
+
+import os
+import math
+import time
+import asyncio
+import logging
+import itertools
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Deque, Dict, List, Optional
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# 우선순위 순서 (앞쪽이 높음)
+PRIORITY_CLASSES = ("chatbot", "feedback", "content", "test", "background")
+
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "2"))
+LLM_QUEUE_MAX = int(os.getenv("LLM_QUEUE_MAX", "32"))
+LLM_QUEUE_TIMEOUT = float(os.getenv("LLM_QUEUE_TIMEOUT", "60"))
+
+_DEFAULT_CLASS_LIMITS = {"chatbot": 2, "feedback": 2, "content": 1, "test": 1, "background": 1}
+
+
+def _class_limit(name: str) -> int:
+    # 예: LLM_CONCURRENCY_CHATBOT=2
+    return int(os.getenv(f"LLM_CONCURRENCY_{name.upper()}", str(_DEFAULT_CLASS_LIMITS[name])))
+
+
+class LLMOverloadedError(RuntimeError):
+    """대기열이 가득 찼거나 대기 시간이 초과되어 요청을 받을 수 없음"""
+
+    def __init__(self, message: str, retry_after: int = 1):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class _Waiter:
+    __slots__ = ("cls", "rank", "seq", "future", "enqueued_at")
+
+    def __init__(self, cls: str, rank: int, seq: int, future: "asyncio.Future[None]"):
+        self.cls = cls
+        self.rank = rank
+        self.seq = seq
+        self.future = future
+        self.enqueued_at = time.monotonic()
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, int(math.ceil(pct / 100.0 * len(ordered))) - 1))
+    return ordered[idx]
+
+
+class AdmissionController:
+    def __init__(
+        self,
+        max_concurrency: int = LLM_MAX_CONCURRENCY,
+        queue_max: int = LLM_QUEUE_MAX,
+        queue_timeout: float = LLM_QUEUE_TIMEOUT,
+        class_limits: Optional[Dict[str, int]] = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.queue_max = queue_max
+        self.queue_timeout = queue_timeout
+        self.class_limits = class_limits or {name: _class_limit(name) for name in PRIORITY_CLASSES}
+        self._running: Dict[str, int] = {name: 0 for name in PRIORITY_CLASSES}
+        self._waiters: List[_Waiter] = []
+        self._seq = itertools.count()
+        self._avg_hold = 5.0  # 슬롯 점유 시간 지수 평균(초), Retry-After 추정용
+        self._waits: Dict[str, Deque[float]] = {name: deque(maxlen=200) for name in PRIORITY_CLASSES}
+        self._counters: Dict[str, Dict[str, int]] = {
+            name: {"admitted": 0, "rejected": 0, "timeouts": 0} for name in PRIORITY_CLASSES
+        }
+
+    @property
+    def running(self) -> int:
+        return sum(self._running.values())
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def _can_run(self, cls: str) -> bool:
+        return self.running < self.max_concurrency and self._running[cls] < self.class_limits.get(cls, 1)
+
+    def _retry_after(self) -> int:
+        slots = max(1, self.max_concurrency)
+        return max(1, int(math.ceil(self._avg_hold * (self.queue_depth + 1) / slots)))
+
+    def _grant(self, waiter_cls: str, enqueued_at: float) -> None:
+        self._running[waiter_cls] += 1
+        self._counters[waiter_cls]["admitted"] += 1
+        self._waits[waiter_cls].append(time.monotonic() - enqueued_at)
+
+    def _dispatch(self) -> None:
+        """빈 슬롯을 우선순위가 높은(동순위는 먼저 온) 대기자에게 배분"""
+        self._waiters.sort(key=lambda w: (w.rank, w.seq))
+        for waiter in list(self._waiters):
+            if self.running >= self.max_concurrency:
+                break
+            if waiter.future.done() or not self._can_run(waiter.cls):
+                continue
+            self._waiters.remove(waiter)
+            self._grant(waiter.cls, waiter.enqueued_at)
+            waiter.future.set_result(None)
+
+    async def acquire(self, cls: str) -> None:
+        """
+        실행 슬롯 획득 (필요하면 대기)
+
+        Raises:
+            LLMOverloadedError: 대기열이 가득 찼거나 queue_timeout 동안 슬롯을 얻지 못함
+        """
+        if cls not in self._running:
+            raise ValueError(f"Unknown priority class: {cls}")
+        rank = PRIORITY_CLASSES.index(cls)
+        # 같거나 높은 우선순위 대기자가 지금 실행 가능하면 새치기하지 않는다
+        ahead = any(w.rank <= rank and self._can_run(w.cls) for w in self._waiters)
+        if not ahead and self._can_run(cls):
+            self._grant(cls, time.monotonic())
+            return
+        if self.queue_depth >= self.queue_max and not self._shed_lower(rank):
+            self._counters[cls]["rejected"] += 1
+            raise LLMOverloadedError("LLM queue is full", retry_after=self._retry_after())
+
+        waiter = _Waiter(cls, rank, next(self._seq), asyncio.get_running_loop().create_future())
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._forget(waiter)
+            self._counters[cls]["timeouts"] += 1
+            raise LLMOverloadedError("LLM queue wait timed out", retry_after=self._retry_after())
+        except asyncio.CancelledError:
+            self._forget(waiter)
+            raise
+
+    def _shed_lower(self, rank: int) -> bool:
+        """대기열이 가득 찼을 때 더 낮은 우선순위의 가장 최근 대기자를 내보내 자리를 만든다"""
+        lower = [w for w in self._waiters if w.rank > rank]
+        if not lower:
+            return False
+        victim = max(lower, key=lambda w: (w.rank, w.seq))
+        self._waiters.remove(victim)
+        self._counters[victim.cls]["rejected"] += 1
+        victim.future.set_exception(LLMOverloadedError("LLM queue is full", retry_after=self._retry_after()))
+        return True
+
+    def _forget(self, waiter: _Waiter) -> None:
+        """대기를 포기한 요청 정리 (이미 슬롯을 받았다면 반납)"""
+        if waiter in self._waiters:
+            self._waiters.remove(waiter)
+            waiter.future.cancel()
+        elif waiter.future.done() and not waiter.future.cancelled():
+            self.release(waiter.cls)
+
+    def release(self, cls: str, held_for: Optional[float] = None) -> None:
+        self._running[cls] = max(0, self._running[cls] - 1)
+        if held_for is not None:
+            self._avg_hold = 0.8 * self._avg_hold + 0.2 * held_for
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, cls: str):
+        """async with admission.slot("chatbot"): ..."""
+        await self.acquire(cls)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.release(cls, time.monotonic() - started)
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        classes = {}
+        for name in PRIORITY_CLASSES:
+            waits = list(self._waits[name])
+            queued = [now - w.enqueued_at for w in self._waiters if w.cls == name]
+            classes[name] = {
+                "running": self._running[name],
+                "max_concurrency": self.class_limits.get(name, 1),
+                "waiting": len(queued),
+                "oldest_wait_s": round(max(queued), 3) if queued else 0.0,
+                "wait_p50_s": round(_percentile(waits, 50), 3),
+                "wait_p95_s": round(_percentile(waits, 95), 3),
+                "wait_max_s": round(max(waits), 3) if waits else 0.0,
+                **self._counters[name],
+            }
+        return {
+            "max_concurrency": self.max_concurrency,
+            "running": self.running,
+            "queue_depth": self.queue_depth,
+            "queue_max": self.queue_max,
+            "avg_hold_s": round(self._avg_hold, 3),
+            "classes": classes,
+        }
+
+
+# 프로세스 공용 컨트롤러
+admission = AdmissionController()
@@ -0,0 +1,148 @@
+"""
+LLM 성능 지표 서비스
+
+LLM 호출마다 Ollama가 돌려주는 실행 지표를 엔드포인트/모델별로 모아 둡니다.
+- total/load/prompt_eval/eval 시간(초)과 prompt_eval_count, eval_count
+- 호출 측 경과 시간(Gemini는 이것만), JSON 파싱 성공 여부, 실패 횟수
+- 최근 LLM_METRICS_WINDOW건 기준 p50/p95와 초당 토큰 수
+- JSON 조기 종료 호출은 done 청크가 없어 호출 측에서 잰 토큰 수/시간을 쓰며,
+  client_measured 건수로 따로 보여 줍니다
+엔드포인트 이름은 요청 미들웨어가 설정한 llm_endpoint(ContextVar)에서 가져옵니다.
+"""
+
+import os
+import math
+import time
+import logging
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, List, Optional
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+LLM_METRICS_WINDOW = int(os.getenv("LLM_METRICS_WINDOW", "500"))  # 키별 보관 표본 수
+
+# 현재 요청의 엔드포인트 (요청 밖의 백그라운드 작업은 "background")
+llm_endpoint: ContextVar[str] = ContextVar("llm_endpoint", default="background")
+
+_DURATION_FIELDS = ("total_duration", "load_duration", "prompt_eval_duration", "eval_duration")
+_COUNT_FIELDS = ("prompt_eval_count", "eval_count")
+
+
+def _percentile(values: List[float], pct: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, int(math.ceil(pct / 100.0 * len(ordered))) - 1))
+    return ordered[idx]
+
+
+def _summary(values: List[float], digits: int = 3) -> Dict[str, Optional[float]]:
+    p50, p95 = _percentile(values, 50), _percentile(values, 95)
+    return {
+        "p50": round(p50, digits) if p50 is not None else None,
+        "p95": round(p95, digits) if p95 is not None else None,
+    }
+
+
+class LLMMetrics:
+    def __init__(self, window: int = LLM_METRICS_WINDOW):
+        self.window = window
+        self._samples: Dict[str, Dict[str, Deque[Dict[str, Any]]]] = {"model": {}, "endpoint": {}}
+        self._totals: Dict[str, int] = {"calls": 0, "errors": 0}
+        self._started_at = time.time()
+
+    def record(
+        self,
+        backend: str,
+        model: Optional[str],
+        meta: Optional[Dict[str, Any]],
+        elapsed: float,
+        ok: bool = True,
+        parse_ok: Optional[bool] = None,
+        endpoint: Optional[str] = None,
+    ) -> None:
+        """
+        호출 한 건 기록
+
+        Args:
+            meta: Ollama done 청크(…_duration은 나노초) 또는 LLMResult.meta
+            elapsed: 호출 측에서 잰 경과 시간(초)
+            parse_ok: JSON 응답을 기대한 호출이면 파싱 성공 여부, 아니면 None
+        """
+        meta = meta or {}
+        sample: Dict[str, Any] = {
+            "ok": ok,
+            "parse_ok": parse_ok,
+            "elapsed_s": elapsed,
+            "client_measured": bool(meta.get("client_measured")),
+        }
+        for name in _DURATION_FIELDS:
+            value = meta.get(name)
+            if isinstance(value, (int, float)):
+                sample[name.replace("_duration", "_s")] = value / 1e9
+        for name in _COUNT_FIELDS:
+            value = meta.get(name)
+            if isinstance(value, int):
+                sample[name] = value
+        # Gemini usageMetadata (토큰 수만 있음)
+        usage = meta.get("usage") or {}
+        if isinstance(usage.get("promptTokenCount"), int):
+            sample["prompt_eval_count"] = usage["promptTokenCount"]
+        if isinstance(usage.get("candidatesTokenCount"), int):
+            sample["eval_count"] = usage["candidatesTokenCount"]
+        self._totals["calls"] += 1
+        if not ok:
+            self._totals["errors"] += 1
+
+        model_key = f"{backend}:{model or ''}"
+        endpoint_key = endpoint or llm_endpoint.get()
+        for group, key in (("model", model_key), ("endpoint", endpoint_key)):
+            samples = self._samples[group].setdefault(key, deque(maxlen=self.window))
+            samples.append(sample)
+
+    def _aggregate(self, samples: List[Dict[str, Any]]) -> Dict[str, Any]:
+        def values(name: str) -> List[float]:
+            return [s[name] for s in samples if name in s]
+
+        parsed = [s["parse_ok"] for s in samples if s["parse_ok"] is not None]
+        eval_rates = [
+            s["eval_count"] / s["eval_s"] for s in samples
+            if s.get("eval_count") and s.get("eval_s")
+        ]
+        prompt_rates = [
+            s["prompt_eval_count"] / s["prompt_eval_s"] for s in samples
+            if s.get("prompt_eval_count") and s.get("prompt_eval_s")
+        ]
+        return {
+            "samples": len(samples),
+            "errors": sum(1 for s in samples if not s["ok"]),
+            "client_measured": sum(1 for s in samples if s["client_measured"]),
+            "parse_success_rate": round(sum(parsed) / len(parsed), 3) if parsed else None,
+            "elapsed_s": _summary(values("elapsed_s")),
+            "total_s": _summary(values("total_s")),
+            "load_s": _summary(values("load_s")),
+            "prompt_eval_s": _summary(values("prompt_eval_s")),
+            "eval_s": _summary(values("eval_s")),
+            "prompt_eval_count": _summary(values("prompt_eval_count"), 0),
+            "eval_count": _summary(values("eval_count"), 0),
+            "tokens_per_s": _summary(eval_rates, 1),
+            "prompt_tokens_per_s": _summary(prompt_rates, 1),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "window": self.window,
+            "since": self._started_at,
+            **self._totals,
+            "by_model": {k: self._aggregate(list(v)) for k, v in self._samples["model"].items()},
+            "by_endpoint": {k: self._aggregate(list(v)) for k, v in self._samples["endpoint"].items()},
+        }
+
+
+# 프로세스 공용 지표 수집기
+llm_metrics = LLMMetrics()
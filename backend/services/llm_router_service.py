@@ -0,0 +1,209 @@
+"""
+지연 기반 헤지(hedged) LLM 라우터
+
+기본(primary) 백엔드로 먼저 보내고, 첫 토큰이 임계 시간 안에 오지 않으면
+보조(secondary) 백엔드로 같은 요청을 보내 먼저 성공한 쪽을 쓰고 나머지는 취소합니다.
+- 임계 시간: 엔드포인트/백엔드별 최근 첫 토큰 지연의 백분위수 (표본이 적으면 기본값).
+  첫 토큰 전에 취소된 primary는 취소 시점까지의 시간을 하한값 표본으로 기록
+- primary가 즉시 실패하면(대기열 초과 등) 기다리지 않고 secondary로 전환
+- 엔드포인트별 라우팅 결정과 승리 횟수 기록
+"""
+
+import os
+import math
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from dotenv import load_dotenv
+
+from backend.services.llm_service import LLMResult, llm_generate, single_flight, coalesce_key
+
+# .env 파일 로드
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+LLM_HEDGE = os.getenv("LLM_HEDGE", "0").strip().lower() in ("1", "true", "yes", "on")
+LLM_HEDGE_PERCENTILE = float(os.getenv("LLM_HEDGE_PERCENTILE", "95"))
+LLM_HEDGE_DEFAULT_DELAY = float(os.getenv("LLM_HEDGE_DEFAULT_DELAY", "3"))
+LLM_HEDGE_MIN_DELAY = float(os.getenv("LLM_HEDGE_MIN_DELAY", "0.5"))
+LLM_HEDGE_MAX_DELAY = float(os.getenv("LLM_HEDGE_MAX_DELAY", "10"))
+LLM_HEDGE_MIN_SAMPLES = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+
+# (backend, llm_generate 인자). 인자에 "prompt"가 있으면 그 leg는 공통 프롬프트 대신 사용
+Leg = Tuple[str, Dict[str, Any]]
+
+
+def _leg_call(prompt: str, backend: str, kwargs: Dict[str, Any], **more: Any):
+    kwargs = dict(kwargs)
+    return llm_generate(kwargs.pop("prompt", prompt), backend, **kwargs, **more)
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, int(math.ceil(pct / 100.0 * len(ordered))) - 1))
+    return ordered[idx]
+
+
+class HedgedRouter:
+    def __init__(
+        self,
+        enabled: bool = LLM_HEDGE,
+        percentile: float = LLM_HEDGE_PERCENTILE,
+        default_delay: float = LLM_HEDGE_DEFAULT_DELAY,
+        min_delay: float = LLM_HEDGE_MIN_DELAY,
+        max_delay: float = LLM_HEDGE_MAX_DELAY,
+        min_samples: int = LLM_HEDGE_MIN_SAMPLES,
+    ):
+        self.enabled = enabled
+        self.percentile = percentile
+        self.default_delay = default_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self._first_token: Dict[Tuple[str, str], Deque[float]] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def _endpoint_stats(self, endpoint: str) -> Dict[str, Any]:
+        stats = self._stats.get(endpoint)
+        if stats is None:
+            stats = self._stats[endpoint] = {
+                "requests": 0,
+                "primary_only": 0,
+                "hedged": 0,
+                "failover": 0,
+                "wins": {},
+            }
+        return stats
+
+    def _record_first_token(self, endpoint: str, backend: str, seconds: float) -> None:
+        samples = self._first_token.setdefault((endpoint, backend), deque(maxlen=200))
+        samples.append(seconds)
+
+    def threshold(self, endpoint: str, backend: str) -> float:
+        """헤지 대기 시간(초): 최근 첫 토큰 지연의 백분위수를 [min, max]로 제한"""
+        samples = self._first_token.get((endpoint, backend))
+        if not samples or len(samples) < self.min_samples:
+            delay = self.default_delay
+        else:
+            delay = _percentile(list(samples), self.percentile)
+        return min(self.max_delay, max(self.min_delay, delay))
+
+    async def generate(
+        self,
+        endpoint: str,
+        prompt: str,
+        legs: List[Leg],
+        available: Optional[Callable[[str], bool]] = None,
+    ) -> LLMResult:
+        """
+        legs[0]을 primary, legs[1]을 secondary로 라우팅 (동일 요청은 합쳐서 한 번만 실행)
+
+        Args:
+            endpoint: 통계/임계값 구분용 이름
+            legs: [(backend, llm_generate 인자), ...] - 인자에 "prompt"를 넣으면 leg별 프롬프트
+            available: backend 사용 가능 여부 (False면 해당 leg 제외)
+        """
+        usable = [leg for leg in legs if available is None or available(leg[0])]
+        if not self.enabled:
+            usable = usable[:1]
+        key = coalesce_key(prompt, "hedge:" + endpoint, None, {"legs": [
+            (backend, {k: v for k, v in kwargs.items() if k not in ("priority", "background")})
+            for backend, kwargs in usable
+        ]})
+        return await single_flight(key, lambda: self._route(endpoint, prompt, usable))
+
+    async def _route(self, endpoint: str, prompt: str, legs: List[Leg]) -> LLMResult:
+        stats = self._endpoint_stats(endpoint)
+        stats["requests"] += 1
+        loop = asyncio.get_running_loop()
+
+        primary_backend, primary_kwargs = legs[0]
+        first = asyncio.Event()
+        started = loop.time()
+        primary = asyncio.ensure_future(_leg_call(prompt, primary_backend, primary_kwargs, first_token=first))
+        first_wait = asyncio.ensure_future(first.wait())
+        first_wait.add_done_callback(
+            lambda f: None if f.cancelled() else self._record_first_token(endpoint, primary_backend, loop.time() - started)
+        )
+
+        tasks = {primary: primary_backend}
+        try:
+            if len(legs) > 1:
+                await asyncio.wait(
+                    {primary, first_wait},
+                    timeout=self.threshold(endpoint, primary_backend),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+            primary_failed = primary.done() and (primary.exception() is not None or not primary.result().ok)
+            # 토큰 없이 끝난 정상 응답(빈 생성 등)도 primary 결과로 확정한다
+            primary_ok = primary.done() and not primary_failed
+            if len(legs) == 1 or primary_ok or (first.is_set() and not primary_failed):
+                stats["primary_only"] += 1
+                result = await primary
+                stats["wins"][primary_backend] = stats["wins"].get(primary_backend, 0) + 1
+                return result
+
+            secondary_backend, secondary_kwargs = legs[1]
+            if primary_failed:
+                stats["failover"] += 1
+                tasks = {}
+            else:
+                stats["hedged"] += 1
+            secondary = asyncio.ensure_future(_leg_call(prompt, secondary_backend, secondary_kwargs))
+            tasks[secondary] = secondary_backend
+            logger.info(f"[router] {endpoint}: {'failover' if primary_failed else 'hedge'} to {secondary_backend}")
+
+            # 먼저 성공한 결과 사용. 둘 다 실패하면 마지막 결과(또는 예외)를 그대로 전달
+            pending = set(tasks)
+            fallback: Optional[LLMResult] = None
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        error = task.exception()
+                        continue
+                    result = task.result()
+                    if result.ok:
+                        backend = tasks[task]
+                        stats["wins"][backend] = stats["wins"].get(backend, 0) + 1
+                        result.meta["routed"] = {"primary": primary_backend, "winner": backend,
+                                                 "hedged": not primary_failed}
+                        return result
+                    fallback = result
+            if fallback is not None:
+                return fallback
+            raise error
+        finally:
+            if not primary.done() and not first.is_set():
+                # 첫 토큰 전에 취소되는 느린 primary도 표본에 넣는다 (실제 지연의 하한값).
+                # 빠른 표본만 쌓이면 임계값이 계속 낮아져 헤지가 점점 잦아진다
+                self._record_first_token(endpoint, primary_backend, loop.time() - started)
+            # 진 쪽(또는 호출 취소 시 모두) 정리
+            for task in list(tasks) + [primary, first_wait]:
+                if not task.done():
+                    task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        endpoints = {}
+        for endpoint, stats in self._stats.items():
+            thresholds = {}
+            for (ep, backend), samples in self._first_token.items():
+                if ep != endpoint:
+                    continue
+                ordered = list(samples)
+                thresholds[backend] = {
+                    "samples": len(ordered),
+                    "first_token_p50_s": round(_percentile(ordered, 50), 3) if ordered else None,
+                    "first_token_p95_s": round(_percentile(ordered, 95), 3) if ordered else None,
+                    "hedge_after_s": round(self.threshold(endpoint, backend), 3),
+                }
+            endpoints[endpoint] = dict(stats, wins=dict(stats["wins"]), first_token=thresholds)
+        return {"enabled": self.enabled, "percentile": self.percentile, "endpoints": endpoints}
+
+
+# 프로세스 공용 라우터
+llm_router = HedgedRouter()
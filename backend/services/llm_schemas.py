@@ -0,0 +1,155 @@
+"""
+LLM 응답 스키마 레지스트리
+
+엔드포인트별로 고정된 응답 형태를 JSON Schema로 정의합니다.
+- Ollama: /api/generate의 format 파라미터에 그대로 전달 (structured outputs)
+- Gemini: to_gemini_schema()로 변환해 responseSchema로 전달
+- 응답 객체는 validate_schema()로 검증
+"""
+
+import os
+from typing import Any, Dict, List, Optional
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+# 스키마 제약 생성 사용 여부 (format 스키마를 지원하지 않는 구버전 Ollama는 0으로 설정)
+LLM_STRUCTURED_OUTPUT = os.getenv("LLM_STRUCTURED_OUTPUT", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def _string() -> Dict[str, Any]:
+    return {"type": "string"}
+
+
+def _string_array() -> Dict[str, Any]:
+    return {"type": "array", "items": _string()}
+
+
+def _object(properties: Dict[str, Any]) -> Dict[str, Any]:
+    return {"type": "object", "properties": properties, "required": list(properties)}
+
+
+GENERATE_CONTENT_SCHEMA = _object({
+    "dialogue": {
+        "type": "array",
+        "items": _object({
+            "speaker": _string(),
+            "text": _string(),
+            "pronunciation": _string(),
+        }),
+    },
+    "vocabulary": _string_array(),
+})
+
+FLUENCY_CHECK_SCHEMA = _object({
+    "score": {"type": "integer"},
+    "corrected": _string(),
+    "feedback": _string(),
+})
+
+# 여러 문장을 한 프롬프트로 교정할 때: index는 프롬프트에 붙인 문장 번호(1부터)
+FLUENCY_CHECK_BATCH_SCHEMA = _object({
+    "results": {
+        "type": "array",
+        "items": _object({
+            "index": {"type": "integer"},
+            "score": {"type": "integer"},
+            "corrected": _string(),
+            "feedback": _string(),
+        }),
+    },
+})
+
+SITUATIONAL_CONTENT_SCHEMA = _object({
+    "situation_description": _string(),
+    "key_expressions": {
+        "type": "array",
+        "items": _object({
+            "korean": _string(),
+            "romanization": _string(),
+            "meaning": _string(),
+        }),
+    },
+    "example_dialogue": {
+        "type": "array",
+        "items": _object({
+            "role": _string(),
+            "text": _string(),
+        }),
+    },
+    "vocabulary": _string_array(),
+})
+
+RESPONSE_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "generate-content": GENERATE_CONTENT_SCHEMA,
+    "fluency-check": FLUENCY_CHECK_SCHEMA,
+    "fluency-check-batch": FLUENCY_CHECK_BATCH_SCHEMA,
+    "situational-content": SITUATIONAL_CONTENT_SCHEMA,
+}
+
+
+def get_response_schema(endpoint: str) -> Optional[Dict[str, Any]]:
+    """엔드포인트의 응답 스키마 (스키마 제약 생성이 꺼져 있으면 None)"""
+    if not LLM_STRUCTURED_OUTPUT:
+        return None
+    return RESPONSE_SCHEMAS.get(endpoint)
+
+
+def to_gemini_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    JSON Schema를 Gemini responseSchema(OpenAPI 부분집합) 형식으로 변환
+
+    타입명은 대문자(OBJECT, STRING ...)로 바꾸고 지원하지 않는 키워드는 버립니다.
+    """
+    out: Dict[str, Any] = {}
+    if "type" in schema:
+        out["type"] = str(schema["type"]).upper()
+    if "properties" in schema:
+        out["properties"] = {k: to_gemini_schema(v) for k, v in schema["properties"].items()}
+    if "required" in schema:
+        out["required"] = list(schema["required"])
+    if "items" in schema:
+        out["items"] = to_gemini_schema(schema["items"])
+    if "enum" in schema:
+        out["enum"] = list(schema["enum"])
+    return out
+
+
+_TYPE_CHECKS = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+}
+
+
+def validate_schema(value: Any, schema: Dict[str, Any], path: str = "$") -> List[str]:
+    """
+    레지스트리 스키마에서 쓰는 키워드(type/properties/required/items/enum)만 검증
+
+    Returns:
+        오류 메시지 목록 (비어 있으면 유효)
+    """
+    errors: List[str] = []
+    expected = schema.get("type")
+    check = _TYPE_CHECKS.get(expected) if expected else None
+    if check is not None and not check(value):
+        return [f"{path}: expected {expected}, got {type(value).__name__}"]
+
+    if "enum" in schema and value not in schema["enum"]:
+        errors.append(f"{path}: {value!r} not in {schema['enum']}")
+
+    if isinstance(value, dict):
+        for key in schema.get("required", []):
+            if key not in value:
+                errors.append(f"{path}: missing required key '{key}'")
+        for key, sub in schema.get("properties", {}).items():
+            if key in value:
+                errors.extend(validate_schema(value[key], sub, f"{path}.{key}"))
+    elif isinstance(value, list) and "items" in schema:
+        for i, item in enumerate(value):
+            errors.extend(validate_schema(item, schema["items"], f"{path}[{i}]"))
+    return errors
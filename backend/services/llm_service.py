@@ -0,0 +1,667 @@
+"""
+LLM 클라이언트 서비스
+
+Ollama / Gemini 호출을 위한 비동기 공용 클라이언트
+- keep-alive 커넥션 풀을 공유하는 aiohttp 세션 (프로세스당 1개)
+- Ollama 스트리밍 NDJSON 누적기
+- 호출별 타임아웃과 공통 결과 타입(LLMResult)
+"""
+
+import os
+import json
+import copy
+import time
+import asyncio
+import random
+import hashlib
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional
+
+import aiohttp
+from dotenv import load_dotenv
+
+from backend.services.json_stream_parser import StreamingJSONExtractor
+from backend.services.llm_schemas import to_gemini_schema, validate_schema
+from backend.services.llm_admission_service import admission
+from backend.services.llm_metrics_service import llm_metrics
+
+# .env 파일 로드
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# LLM 서버 설정
+OLLAMA_URL = os.getenv("OLLAMA_URL", "http://localhost:11434")
+GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
+GEMINI_REST_URL = "https://generativelanguage.googleapis.com/v1/models"
+
+# Gemini 어댑터 공통 설정
+GEMINI_TIMEOUT = float(os.getenv("GEMINI_TIMEOUT", "60"))
+GEMINI_MAX_RETRIES = int(os.getenv("GEMINI_MAX_RETRIES", "2"))
+GEMINI_RETRY_BACKOFF = float(os.getenv("GEMINI_RETRY_BACKOFF", "0.5"))
+
+# 마지막 요청 후 Ollama가 모델을 메모리에 유지할 시간 (예: "30m", "-1"은 무기한)
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+
+# 커넥션 풀 설정
+LLM_POOL_SIZE = int(os.getenv("LLM_POOL_SIZE", "32"))
+LLM_KEEPALIVE_TIMEOUT = float(os.getenv("LLM_KEEPALIVE_TIMEOUT", "60"))
+LLM_CONNECT_TIMEOUT = float(os.getenv("LLM_CONNECT_TIMEOUT", "5"))
+
+_session: Optional[aiohttp.ClientSession] = None
+
+# 사용자 요청에 의한 LLM 호출 활동 (백그라운드 작업의 유휴 판정용)
+_inflight = 0
+_last_activity = 0.0
+
+# 동일 요청 합치기(single-flight): 진행 중인 업스트림 호출과 통계
+_shared_calls: Dict[str, "asyncio.Future[LLMResult]"] = {}
+_coalesce_stats = {"requests": 0, "upstream": 0, "saved": 0}
+
+
+class LLMError(RuntimeError):
+    """LLM 호출 실패 (연결 오류, 비정상 응답 등)"""
+
+    def __init__(self, message: str, status: Optional[int] = None, body: str = ""):
+        super().__init__(message)
+        self.status = status  # 서버가 비정상 상태 코드를 반환한 경우에만 설정
+        self.body = body
+
+
+class LLMTimeoutError(LLMError):
+    """LLM 응답 시간 초과"""
+
+
+@dataclass
+class LLMResult:
+    """LLM 호출 결과 (백엔드 공통)"""
+    text: str
+    model: str
+    backend: str
+    ok: bool = True
+    status: int = 200
+    error: Optional[str] = None
+    meta: Dict[str, Any] = field(default_factory=dict)  # Ollama 마지막(done) 청크 등
+    parsed: Optional[Any] = None  # 스트림 중 추출된 JSON 객체 (ollama_generate_json)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'text': self.text,
+            'model': self.model,
+            'backend': self.backend,
+            'ok': self.ok,
+            'status': self.status,
+            'error': self.error,
+        }
+
+
+class NDJSONAccumulator:
+    """
+    Ollama 스트리밍(NDJSON) 응답 누적기
+
+    한 줄씩 feed()로 넣으면 토큰 조각을 반환하고, 전체 텍스트는 text에 쌓입니다.
+    done=true 청크(통계, context 등)는 final에 보관합니다.
+    """
+
+    def __init__(self):
+        self._parts: List[str] = []
+        self.final: Dict[str, Any] = {}
+        self.pieces = 0
+        self._first_at = self._last_at = 0.0
+
+    def feed(self, line: str) -> str:
+        if not line:
+            return ""
+        try:
+            obj = json.loads(line)
+        except Exception:
+            piece = line
+        else:
+            if isinstance(obj, dict):
+                piece = obj.get("response", "") or obj.get("text", "")
+                if obj.get("done"):
+                    self.final = {k: v for k, v in obj.items() if k != "response"}
+            else:
+                piece = str(obj)
+        if piece:
+            self._last_at = time.monotonic()
+            if not self.pieces:
+                self._first_at = self._last_at
+            self.pieces += 1
+            self._parts.append(piece)
+        return piece
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    def metrics_meta(self) -> Dict[str, Any]:
+        """
+        llm_metrics.record용 meta
+
+        done 청크를 받았으면 그대로, 조기 종료/연결 끊김으로 못 받았으면 받은 토큰 조각 수와
+        첫 조각~마지막 조각 사이 시간을 eval_count/eval_duration으로 대신 쓰고
+        client_measured=True로 표시합니다 (prompt 쪽 통계는 비워 둔다).
+        """
+        if self.final:
+            return dict(self.final)
+        if not self.pieces:
+            return {}
+        # Ollama는 스트림 청크 하나에 토큰 하나를 보낸다
+        meta: Dict[str, Any] = {"eval_count": self.pieces, "client_measured": True}
+        if self.pieces > 1:
+            meta["eval_duration"] = int((self._last_at - self._first_at) * 1e9)
+        return meta
+
+
+async def get_llm_session() -> aiohttp.ClientSession:
+    """공유 aiohttp 세션 반환 (없으면 생성)"""
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=LLM_POOL_SIZE,
+            keepalive_timeout=LLM_KEEPALIVE_TIMEOUT,
+        )
+        _session = aiohttp.ClientSession(connector=connector)
+    return _session
+
+
+async def close_llm_session() -> None:
+    """공유 세션 종료 (앱 종료 시 호출)"""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+@contextmanager
+def _track_activity(background: bool = False):
+    global _inflight, _last_activity
+    if background:
+        yield
+        return
+    _inflight += 1
+    try:
+        yield
+    finally:
+        _inflight -= 1
+        _last_activity = time.monotonic()
+
+
+def llm_idle_seconds() -> float:
+    """사용자 요청 LLM 호출이 없었던 시간(초). 호출 진행 중이면 0"""
+    if _inflight > 0:
+        return 0.0
+    return time.monotonic() - _last_activity
+
+
+def _client_timeout(timeout: float) -> aiohttp.ClientTimeout:
+    # requests의 timeout과 같은 의미: 연결/청크 간 대기 시간 제한 (전체 생성 시간 아님)
+    return aiohttp.ClientTimeout(total=None, connect=LLM_CONNECT_TIMEOUT, sock_read=timeout)
+
+
+async def iter_ollama_lines(payload: Dict[str, Any], timeout: float = 30) -> AsyncIterator[str]:
+    """
+    Ollama /api/generate 호출 후 NDJSON 라인을 순서대로 반환
+
+    Raises:
+        LLMError: 비정상 상태 코드 또는 연결 실패
+        LLMTimeoutError: 타임아웃
+    """
+    session = await get_llm_session()
+    try:
+        async with session.post(
+            f"{OLLAMA_URL}/api/generate",
+            json=payload,
+            timeout=_client_timeout(timeout),
+        ) as resp:
+            if resp.status != 200:
+                body = await resp.text()
+                raise LLMError(f"ollama generate failed (status {resp.status})", status=resp.status, body=body)
+            async for raw in resp.content:
+                line = raw.decode("utf-8", errors="ignore").strip()
+                if line:
+                    yield line
+    except asyncio.TimeoutError:
+        raise LLMTimeoutError(f"ollama generate timed out after {timeout}s")
+    except aiohttp.ClientError as e:
+        raise LLMError(f"ollama connection failed: {e}")
+
+
+def _ollama_payload(
+    prompt: str,
+    model: str,
+    options: Optional[Dict[str, Any]],
+    extra: Dict[str, Any],
+) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {"model": model, "prompt": prompt}
+    if options:
+        payload["options"] = options
+    if OLLAMA_KEEP_ALIVE:
+        payload["keep_alive"] = OLLAMA_KEEP_ALIVE
+    payload.update(extra)
+    return payload
+
+
+async def ollama_generate(
+    prompt: str,
+    model: str,
+    timeout: float = 30,
+    options: Optional[Dict[str, Any]] = None,
+    first_token: Optional[asyncio.Event] = None,
+    **extra: Any,
+) -> LLMResult:
+    """
+    Ollama 텍스트 생성 (스트리밍 응답을 누적하여 반환)
+
+    Args:
+        prompt: 프롬프트
+        model: Ollama 모델명
+        timeout: 청크 간 최대 대기 시간(초)
+        options: Ollama options (temperature 등)
+        first_token: 첫 토큰이 도착하면 set되는 이벤트 (지연 기반 라우팅용)
+        **extra: payload에 그대로 추가할 필드 (format, keep_alive, context 등)
+    """
+    payload = _ollama_payload(prompt, model, options, extra)
+
+    acc = NDJSONAccumulator()
+    try:
+        async for line in iter_ollama_lines(payload, timeout=timeout):
+            if acc.feed(line) and first_token is not None:
+                first_token.set()
+    except LLMError as e:
+        if e.status is None:
+            raise
+        return LLMResult(text=acc.text, model=model, backend="ollama", ok=False, status=e.status, error=e.body)
+
+    return LLMResult(text=acc.text, model=model, backend="ollama", meta=acc.final)
+
+
+async def ollama_stream(
+    prompt: str,
+    model: str,
+    timeout: float = 30,
+    options: Optional[Dict[str, Any]] = None,
+    acc: Optional[NDJSONAccumulator] = None,
+    background: bool = False,
+    **extra: Any,
+) -> AsyncIterator[str]:
+    """
+    Ollama 텍스트 생성 (토큰 조각을 생성되는 즉시 반환)
+
+    acc를 넘기면 스트림 종료 후 전체 텍스트와 done 청크를 acc에서 읽을 수 있습니다.
+    비정상 상태 코드는 LLMError(status 설정)로 전달됩니다.
+    background=True이면 llm_idle_seconds 유휴 판정에서 제외합니다.
+    """
+    payload = _ollama_payload(prompt, model, options, extra)
+
+    acc = acc if acc is not None else NDJSONAccumulator()
+    lines = iter_ollama_lines(payload, timeout=timeout)
+    try:
+        with _track_activity(background):
+            async for line in lines:
+                piece = acc.feed(line)
+                if piece:
+                    yield piece
+    finally:
+        # 소비 측이 중간에 닫으면 HTTP 응답도 즉시 닫는다 (GC 시점까지 미루지 않음)
+        await lines.aclose()
+
+
+async def ollama_generate_json(
+    prompt: str,
+    model: str,
+    required_keys: Iterable[str] = (),
+    timeout: float = 30,
+    options: Optional[Dict[str, Any]] = None,
+    first_token: Optional[asyncio.Event] = None,
+    **extra: Any,
+) -> LLMResult:
+    """
+    Ollama 생성 + 스트리밍 JSON 추출
+
+    필수 키를 모두 가진 JSON 객체가 완성되는 즉시 업스트림 스트림을 닫아
+    뒤따르는 설명 토큰 생성을 중단합니다. 추출 결과는 LLMResult.parsed에 담기며,
+    조기 종료 여부는 meta["stopped_early"]로 확인할 수 있습니다.
+    조기 종료하면 done 청크가 없으므로 통계는 NDJSONAccumulator.metrics_meta()의 대체값을 씁니다.
+    """
+    acc = NDJSONAccumulator()
+    extractor = StreamingJSONExtractor(required_keys)
+    # 활동 집계는 호출 측(llm_generate)에서 한다
+    stream = ollama_stream(prompt, model, timeout=timeout, options=options, acc=acc, background=True, **extra)
+    stopped_early = False
+    try:
+        async for piece in stream:
+            if first_token is not None:
+                first_token.set()
+            if extractor.feed(piece) is not None:
+                stopped_early = True
+                break
+    except LLMError as e:
+        if e.status is None:
+            raise
+        return LLMResult(text=acc.text, model=model, backend="ollama", ok=False, status=e.status, error=e.body)
+    finally:
+        # 응답을 다 읽지 않고 닫으면 연결이 끊겨 Ollama가 생성을 중단한다
+        await stream.aclose()
+
+    meta = acc.metrics_meta()
+    meta["stopped_early"] = stopped_early
+    return LLMResult(text=acc.text, model=model, backend="ollama", meta=meta, parsed=extractor.result)
+
+
+async def ollama_warmup(model: str, timeout: float = 120) -> Dict[str, Any]:
+    """
+    짧은 프롬프트로 모델을 메모리에 올리고 keep_alive를 갱신
+
+    Returns:
+        {"model", "elapsed_s", "load_s"} - load_s는 Ollama가 보고한 모델 로드 시간
+        (이미 로드되어 있으면 0에 가깝다)
+    """
+    payload = _ollama_payload("안녕", model, {"num_predict": 1}, {})
+    acc = NDJSONAccumulator()
+    started = time.monotonic()
+    async for line in iter_ollama_lines(payload, timeout=timeout):
+        acc.feed(line)
+    elapsed = time.monotonic() - started
+    load_ns = acc.final.get("load_duration") or 0
+    return {"model": model, "elapsed_s": round(elapsed, 3), "load_s": round(load_ns / 1e9, 3)}
+
+
+class GeminiClient:
+    """
+    재사용 가능한 비동기 Gemini 어댑터 (프로세스당 1개)
+
+    - SDK: genai.configure()는 한 번만, GenerativeModel은 모델명별로 캐시하고
+      generate_content_async로 호출 (스레드 풀을 점유하지 않음)
+    - REST: 공유 aiohttp 세션 사용
+    - 두 경로 모두 같은 타임아웃/재시도(429, 5xx, 연결 오류; 지수 백오프 + 지터) 설정을 따른다
+    """
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(
+        self,
+        api_key: Optional[str] = GEMINI_API_KEY,
+        default_model: str = GEMINI_MODEL,
+        timeout: float = GEMINI_TIMEOUT,
+        max_retries: int = GEMINI_MAX_RETRIES,
+        backoff: float = GEMINI_RETRY_BACKOFF,
+    ):
+        self.api_key = api_key
+        self.default_model = default_model
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self._genai = None
+        self._models: Dict[str, Any] = {}
+
+    def _sdk_model(self, model: str):
+        if self._genai is None:
+            import google.generativeai as genai
+            genai.configure(api_key=self.api_key)
+            self._genai = genai
+        cached = self._models.get(model)
+        if cached is None:
+            cached = self._models[model] = self._genai.GenerativeModel(model)
+        return cached
+
+    async def _rest(self, prompt: str, model: str, timeout: float, schema: Optional[Dict[str, Any]]) -> LLMResult:
+        url = f"{GEMINI_REST_URL}/{model}:generateContent?key={self.api_key}"
+        payload: Dict[str, Any] = {"contents": [{"parts": [{"text": prompt}]}]}
+        if schema is not None:
+            payload["generationConfig"] = {
+                "responseMimeType": "application/json",
+                "responseSchema": to_gemini_schema(schema),
+            }
+        session = await get_llm_session()
+        try:
+            async with session.post(url, json=payload, timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+                result = await resp.json(content_type=None)
+                if resp.status != 200:
+                    return LLMResult(text="", model=model, backend="gemini", ok=False,
+                                     status=resp.status, error=json.dumps(result, ensure_ascii=False)[:500])
+        except asyncio.TimeoutError:
+            raise LLMTimeoutError(f"gemini generate timed out after {timeout}s")
+        except aiohttp.ClientError as e:
+            raise LLMError(f"gemini connection failed: {e}")
+
+        if "candidates" in result and len(result["candidates"]) > 0:
+            text = result["candidates"][0]["content"]["parts"][0]["text"]
+            return LLMResult(text=text, model=model, backend="gemini", meta={"usage": result.get("usageMetadata", {})})
+        return LLMResult(text="", model=model, backend="gemini", ok=False, status=500,
+                         error=f"No response from Gemini: {json.dumps(result, ensure_ascii=False)[:500]}")
+
+    async def _sdk(self, prompt: str, model: str, timeout: float, schema: Optional[Dict[str, Any]]) -> LLMResult:
+        generation_config = None
+        if schema is not None:
+            generation_config = {
+                "response_mime_type": "application/json",
+                "response_schema": to_gemini_schema(schema),
+            }
+        try:
+            response = await asyncio.wait_for(
+                self._sdk_model(model).generate_content_async(
+                    prompt,
+                    generation_config=generation_config,
+                    # SDK 자체 재시도는 끄고 어댑터의 재시도 설정만 따른다
+                    request_options={"timeout": timeout, "retry": None},
+                ),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            raise LLMTimeoutError(f"gemini generate timed out after {timeout}s")
+        except Exception as e:
+            # google.api_core 예외는 HTTP 상태 코드를 code로 가진다
+            status = getattr(e, "code", None)
+            if isinstance(status, int):
+                return LLMResult(text="", model=model, backend="gemini", ok=False, status=status, error=str(e))
+            raise LLMError(f"gemini request failed: {e}")
+        try:
+            text = response.text
+        except ValueError as e:
+            # 안전 필터 등으로 후보가 비어 있는 경우
+            return LLMResult(text="", model=model, backend="gemini", ok=False, status=500,
+                             error=f"No response from Gemini: {e}")
+        return LLMResult(text=text or "", model=model, backend="gemini")
+
+    async def generate(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        timeout: Optional[float] = None,
+        transport: str = "sdk",
+        schema: Optional[Dict[str, Any]] = None,
+    ) -> LLMResult:
+        use_model = model or self.default_model
+        if not self.api_key:
+            return LLMResult(text="", model=use_model, backend="gemini", ok=False,
+                             status=400, error="GEMINI_API_KEY not configured")
+        use_timeout = timeout or self.timeout
+        call = self._rest if transport == "rest" else self._sdk
+
+        attempt = 0
+        while True:
+            try:
+                result = await call(prompt, use_model, use_timeout, schema)
+            except LLMTimeoutError:
+                raise
+            except LLMError:
+                if attempt >= self.max_retries:
+                    raise
+            else:
+                if result.ok or result.status not in self.RETRY_STATUSES or attempt >= self.max_retries:
+                    return result
+            attempt += 1
+            delay = self.backoff * (2 ** (attempt - 1)) * (0.5 + random.random())
+            logger.info(f"gemini retry {attempt}/{self.max_retries} in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+
+_gemini_client: Optional[GeminiClient] = None
+
+
+def get_gemini_client() -> GeminiClient:
+    """공유 Gemini 어댑터 반환 (없으면 생성)"""
+    global _gemini_client
+    if _gemini_client is None:
+        _gemini_client = GeminiClient()
+    return _gemini_client
+
+
+async def gemini_generate(
+    prompt: str,
+    model: Optional[str] = None,
+    timeout: Optional[float] = None,
+    transport: str = "sdk",
+    schema: Optional[Dict[str, Any]] = None,
+) -> LLMResult:
+    """
+    Gemini 텍스트 생성 (공유 GeminiClient 사용)
+
+    Args:
+        timeout: 요청 타임아웃(초). 생략 시 GEMINI_TIMEOUT
+        transport: "sdk" (google-generativeai) 또는 "rest" (v1 REST API)
+        schema: 응답 JSON Schema (지정 시 JSON 모드 + responseSchema)
+    """
+    return await get_gemini_client().generate(prompt, model, timeout=timeout, transport=transport, schema=schema)
+
+
+def _apply_schema(result: LLMResult, schema: Dict[str, Any]) -> LLMResult:
+    """스키마 제약 응답을 파싱/검증해 parsed를 채운다 (검증 실패 시 parsed=None, 오류는 meta에 기록)"""
+    if not result.ok:
+        return result
+    obj = result.parsed
+    if obj is None:
+        try:
+            obj = json.loads(result.text)
+        except Exception:
+            obj = None
+    errors = validate_schema(obj, schema) if obj is not None else ["$: response is not valid JSON"]
+    if errors:
+        logger.warning(f"{result.backend} response failed schema validation: {errors[:3]}")
+    result.parsed = None if errors else obj
+    result.meta["schema_errors"] = errors
+    return result
+
+
+async def llm_generate(
+    prompt: str,
+    backend: str,
+    model: Optional[str] = None,
+    timeout: float = 30,
+    json_keys: Optional[Iterable[str]] = None,
+    schema: Optional[Dict[str, Any]] = None,
+    background: bool = False,
+    priority: str = "content",
+    first_token: Optional[asyncio.Event] = None,
+    **kwargs: Any,
+) -> LLMResult:
+    """
+    백엔드 공통 진입점
+
+    Args:
+        backend: "ollama" 또는 "gemini"
+        model: 모델명 (ollama는 필수, gemini는 생략 시 GEMINI_MODEL)
+        json_keys: 지정하면 (ollama) 해당 키를 가진 JSON 객체가 완성되는 즉시 생성을 중단
+        schema: 응답 JSON Schema. ollama는 format, gemini는 responseSchema로 전달하고
+            결과를 검증해 유효한 객체만 LLMResult.parsed에 담는다
+        background: 백그라운드 작업 호출 여부 (llm_idle_seconds 유휴 판정에서 제외)
+        priority: admission 우선순위 클래스 (chatbot/feedback/content/test/background).
+            GPU를 공유하는 ollama 호출에만 적용되며, 대기열이 가득 차면 LLMOverloadedError
+        first_token: 첫 토큰 도착 시 set되는 이벤트 (gemini는 스트리밍이 아니므로 응답 완료 시)
+        **kwargs: 백엔드별 추가 인자 (ollama: options/format 등, gemini: transport)
+
+    호출마다 실행 지표(소요 시간, 토큰 수, 파싱 성공 여부)를 llm_metrics에 기록한다.
+    """
+    with _track_activity(background):
+        if backend == "ollama":
+            if schema is not None:
+                kwargs["format"] = schema
+                if json_keys is None:
+                    json_keys = schema.get("required", ())
+            async with admission.slot(priority):
+                started = time.monotonic()
+                try:
+                    if json_keys is not None:
+                        result = await ollama_generate_json(
+                            prompt, model, required_keys=json_keys, timeout=timeout, first_token=first_token, **kwargs
+                        )
+                    else:
+                        result = await ollama_generate(prompt, model, timeout=timeout, first_token=first_token, **kwargs)
+                except LLMError:
+                    llm_metrics.record("ollama", model, None, time.monotonic() - started, ok=False)
+                    raise
+            result = _apply_schema(result, schema) if schema is not None else result
+            _record_result(result, time.monotonic() - started, expects_json=json_keys is not None)
+            return result
+        if backend == "gemini":
+            started = time.monotonic()
+            try:
+                result = await gemini_generate(prompt, model, timeout=timeout, schema=schema, **kwargs)
+            except LLMError:
+                llm_metrics.record("gemini", model or GEMINI_MODEL, None, time.monotonic() - started, ok=False)
+                raise
+            if first_token is not None:
+                first_token.set()
+            result = _apply_schema(result, schema) if schema is not None else result
+            _record_result(result, time.monotonic() - started, expects_json=schema is not None)
+            return result
+    return LLMResult(text="", model=model or "", backend=backend, ok=False, status=400,
+                     error=f"Unknown backend: {backend}")
+
+
+def _record_result(result: LLMResult, elapsed: float, expects_json: bool) -> None:
+    parse_ok = (result.parsed is not None) if expects_json and result.ok else None
+    llm_metrics.record(result.backend, result.model, result.meta, elapsed, ok=result.ok, parse_ok=parse_ok)
+
+
+def coalesce_key(prompt: str, backend: str, model: Optional[str], params: Dict[str, Any]) -> str:
+    """(backend, model, prompt, 생성 옵션)의 정규화된 키"""
+    material = {"backend": backend, "model": model or "", "prompt": prompt, "params": params}
+    raw = json.dumps(material, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+async def llm_generate_shared(
+    prompt: str,
+    backend: str,
+    model: Optional[str] = None,
+    timeout: float = 30,
+    **kwargs: Any,
+) -> LLMResult:
+    """
+    llm_generate + 동일 요청 합치기
+
+    같은 (backend, model, prompt, 옵션, 우선순위) 요청이 이미 진행 중이면 새 업스트림 호출 없이
+    그 결과를 함께 받습니다. 결과는 호출자마다 복사본이 반환되므로 수정해도 안전합니다.
+    한 호출자가 취소되어도 공유 호출은 계속 진행됩니다.
+    """
+    # 우선순위/백그라운드 여부도 키에 넣는다: 사용자 요청이 background 대기열에 있는
+    # 사전 생성 호출에 합류하면 그 대기 시간을 그대로 떠안게 된다 (우선순위 역전)
+    params = dict(kwargs, priority=kwargs.get("priority", "content"), background=kwargs.get("background", False))
+    key = coalesce_key(prompt, backend, model, params)
+    return await single_flight(key, lambda: llm_generate(prompt, backend, model=model, timeout=timeout, **kwargs))
+
+
+async def single_flight(key: str, factory: Callable[[], Awaitable[LLMResult]]) -> LLMResult:
+    """key가 같은 호출이 진행 중이면 합류하고, 아니면 factory()로 새 호출을 시작"""
+    _coalesce_stats["requests"] += 1
+    shared = _shared_calls.get(key)
+    if shared is None:
+        _coalesce_stats["upstream"] += 1
+        shared = asyncio.ensure_future(factory())
+        _shared_calls[key] = shared
+        shared.add_done_callback(lambda _f: _shared_calls.pop(key, None))
+    else:
+        _coalesce_stats["saved"] += 1
+    result = await asyncio.shield(shared)
+    return copy.deepcopy(result)
+
+
+def coalescing_stats() -> Dict[str, int]:
+    """동일 요청 합치기 통계 (saved = 절약된 업스트림 호출 수)"""
+    return dict(_coalesce_stats, in_flight=len(_shared_calls))
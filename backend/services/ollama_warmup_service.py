@@ -0,0 +1,156 @@
+"""
+Ollama 모델 예열(warm-up) 서비스
+
+서버 재시작이나 유휴 언로드 후 첫 학습자가 모델 로드 시간을 떠안지 않도록
+- 시작 시 선택된 모델을 짧은 프롬프트로 미리 로드하고 (keep_alive 설정)
+- 서비스 시간대에는 일정 간격으로 keep-warm 요청을 보내 모델을 메모리에 유지합니다.
+모든 작업은 백그라운드 태스크로 실행되며, Ollama가 꺼져 있어도 서버 시작을 막지 않습니다.
+"""
+
+import os
+import time
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+from dotenv import load_dotenv
+
+from backend.services.llm_service import ollama_warmup, llm_idle_seconds
+from backend.services.llm_admission_service import admission
+
+# .env 파일 로드
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+OLLAMA_WARMUP = os.getenv("OLLAMA_WARMUP", "1").strip().lower() not in ("0", "false", "no", "off")
+OLLAMA_KEEPWARM_INTERVAL = float(os.getenv("OLLAMA_KEEPWARM_INTERVAL", "240"))  # 0이면 주기적 예열 끔
+OLLAMA_SERVICE_HOURS = os.getenv("OLLAMA_SERVICE_HOURS", "")  # 예: "08-23" (비우면 항상)
+OLLAMA_WARMUP_RETRY = float(os.getenv("OLLAMA_WARMUP_RETRY", "30"))  # 시작 예열 실패 시 재시도 간격(초)
+
+
+def parse_service_hours(value: str) -> Optional[Tuple[int, int]]:
+    """"HH-HH" 형식을 (시작 시, 종료 시)로 변환. 비었거나 잘못된 형식이면 None(항상)"""
+    try:
+        start, end = (int(part) for part in value.split("-", 1))
+    except Exception:
+        return None
+    if not (0 <= start <= 24 and 0 <= end <= 24):
+        return None
+    return start, end
+
+
+def in_service_hours(hours: Optional[Tuple[int, int]], now: Optional[datetime] = None) -> bool:
+    if hours is None:
+        return True
+    hour = (now or datetime.now()).hour
+    start, end = hours
+    if start == end:
+        return True
+    if start < end:
+        return start <= hour < end
+    # 자정을 넘는 구간 (예: 22-06)
+    return hour >= start or hour < end
+
+
+class OllamaWarmer:
+    def __init__(
+        self,
+        interval: float = OLLAMA_KEEPWARM_INTERVAL,
+        service_hours: str = OLLAMA_SERVICE_HOURS,
+        retry: float = OLLAMA_WARMUP_RETRY,
+    ):
+        self.interval = interval
+        self.hours = parse_service_hours(service_hours)
+        self.retry = retry
+        self._task: Optional[asyncio.Task] = None
+        self.status: Dict[str, Any] = {
+            "warm": False,
+            "model": None,
+            "startup_load_s": None,
+            "startup_elapsed_s": None,
+            "last_ping_at": None,
+            "last_load_s": None,
+            "pings": 0,
+            "failures": 0,
+            "last_error": None,
+        }
+
+    async def _ping(self, model: str) -> Dict[str, Any]:
+        async with admission.slot("background"):
+            report = await ollama_warmup(model)
+        self.status.update(
+            warm=True,
+            model=model,
+            last_ping_at=time.time(),
+            last_load_s=report["load_s"],
+            last_error=None,
+        )
+        self.status["pings"] += 1
+        return report
+
+    async def run(self, model_getter: Callable[[], str]) -> None:
+        # 1) 시작 예열: 성공할 때까지 retry 간격으로 재시도
+        while True:
+            model = model_getter()
+            try:
+                report = await self._ping(model)
+                self.status["startup_load_s"] = report["load_s"]
+                self.status["startup_elapsed_s"] = report["elapsed_s"]
+                logger.info(
+                    f"Ollama 모델 예열 완료: {model} (로드 {report['load_s']}s, 전체 {report['elapsed_s']}s)"
+                )
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.status["failures"] += 1
+                self.status["last_error"] = str(e)
+                logger.warning(f"Ollama 모델 예열 실패 ({model}): {e} - {self.retry}s 후 재시도")
+                await asyncio.sleep(self.retry)
+
+        if self.interval <= 0:
+            return
+
+        # 2) 서비스 시간대 keep-warm: 최근 사용자 요청이 있었다면 이미 keep_alive가 갱신되었으므로 건너뜀
+        while True:
+            await asyncio.sleep(self.interval)
+            if not in_service_hours(self.hours) or llm_idle_seconds() < self.interval:
+                continue
+            model = model_getter()
+            try:
+                report = await self._ping(model)
+                if report["load_s"] >= 1:
+                    logger.info(f"Ollama 모델 재로드됨: {model} ({report['load_s']}s)")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.status["warm"] = False
+                self.status["failures"] += 1
+                self.status["last_error"] = str(e)
+                logger.warning(f"Ollama keep-warm 실패 ({model}): {e}")
+
+    def start(self, model_getter: Callable[[], str]) -> None:
+        """실행 중인 이벤트 루프에 예열 태스크 등록 (시작을 막지 않음)"""
+        if not OLLAMA_WARMUP or self._task is not None:
+            return
+        self._task = asyncio.get_running_loop().create_task(self.run(model_getter))
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        return dict(
+            self.status,
+            enabled=OLLAMA_WARMUP,
+            interval_s=self.interval,
+            service_hours=OLLAMA_SERVICE_HOURS or None,
+            in_service_hours=in_service_hours(self.hours),
+        )
@@ -0,0 +1,321 @@
+"""
+SpeechPro 사전 계산 문장 저장소
+
+sp_ko_questions.csv의 문장별 GTP/FST를 하나의 바이너리 파일(sp_ko_questions.bin)로 컴파일해
+워커마다 mmap으로 공유합니다.
+- 파일 구조: 헤더(매직, 버전, 문장 수, 인덱스/데이터 위치, SHA-256 체크섬) + JSON 인덱스 + FST 원본 바이트
+- 인덱스(문장, 음절 정보, fst_hash, FST 오프셋)만 메모리에 올리고 정규화 문장/ID/해시 -> 레코드 번호 dict로 O(1) 조회
+- FST는 base64를 풀어 원본 바이트로 저장하고 요청 시에만 mmap에서 읽어 base64로 돌려줌
+- 바이너리가 없거나 CSV보다 오래되었거나 체크섬이 맞지 않으면 CSV에서 다시 컴파일
+  (CSV 없이 바이너리만 배포해도 동작)
+- 레코드마다 FST 내용 해시(fst_hash)를 두어 브라우저가 FST 대신 해시로 참조할 수 있게 함
+- scripts/precompute_speechpro_presets.py가 커리큘럼 문장으로 만든 CSV(dataset 열 포함)도 함께 컴파일
+  (생성 문장은 텍스트/해시 조회에만 쓰고 프리셋 문장 목록에는 노출하지 않음)
+
+빌드:
+    python -m backend.services.precomputed_sentence_store [CSV ...] [-o OUT]
+"""
+
+import os
+import csv
+import json
+import mmap
+import base64
+import struct
+import hashlib
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from backend.services.speechpro_service import normalize_spaces
+
+logger = logging.getLogger(__name__)
+
+SPEECHPRO_PRESET_CSV = "data/sp_ko_questions.csv"
+SPEECHPRO_GENERATED_CSV = "data/sp_ko_generated.csv"
+
+STORE_MAGIC = b"SPPRESET"
+STORE_VERSION = 1
+# 매직, 버전, 문장 수, 인덱스 오프셋/길이, 데이터 오프셋/길이, 인덱스+데이터의 SHA-256
+_HEADER = struct.Struct("<8sIIQQQQ32s")
+
+
+def _store_path(csv_path: str) -> str:
+    return os.path.splitext(csv_path)[0] + ".bin"
+
+
+SPEECHPRO_PRESET_STORE = _store_path(SPEECHPRO_PRESET_CSV)
+
+
+def fst_content_hash(fst: str) -> str:
+    """FST 내용 해시 (base64 문자열의 SHA-256 앞 32자리)"""
+    return hashlib.sha256(fst.encode("utf-8")).hexdigest()[:32]
+
+
+def text_hash(text: str) -> str:
+    """정규화 문장 해시 (일괄 생성 시 이미 있는 문장을 건너뛰는 키)"""
+    return hashlib.sha256(normalize_spaces(text).encode("utf-8")).hexdigest()
+
+
+def _row_meta(row: Dict[str, str]) -> Dict[str, Any]:
+    sentence_kr = normalize_spaces(row.get("sentence", ""))
+    try:
+        base_id = int(row.get("ko_id", 0))
+    except Exception:
+        base_id = 0
+
+    try:
+        order = int(row.get("order", base_id))
+    except Exception:
+        order = base_id
+
+    dataset = row.get("dataset")
+    if dataset:
+        # 커리큘럼 데이터셋에서 일괄 생성한 문장
+        return {
+            "id": f"gen-{order}",
+            "order": order,
+            "sentenceKr": sentence_kr,
+            "dataset": dataset,
+            "syll_ltrs": row.get("syll_ltrs", ""),
+            "syll_phns": row.get("syll_phns", ""),
+            "source": "generated"
+        }
+
+    return {
+        "id": 1000 + base_id if base_id else order,
+        "order": order,
+        "sentenceKr": sentence_kr,
+        "sentenceEn": "",
+        "level": "초급",
+        "difficulty": "SpeechPro",
+        "category": "프리셋",
+        "tags": ["speechpro", "preset"],
+        "tips": "SpeechPro 서버의 프리셋 문장입니다.",
+        "syll_ltrs": row.get("syll_ltrs", ""),
+        "syll_phns": row.get("syll_phns", ""),
+        "source": "precomputed"
+    }
+
+
+def _iter_csv_rows(csv_paths: Iterable[str]) -> Iterable[Dict[str, str]]:
+    for path in csv_paths:
+        if not os.path.exists(path):
+            continue
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                yield row
+
+
+def build_preset_store(csv_paths: Sequence[str], out_path: str) -> int:
+    """
+    CSV(들)을 바이너리 저장소로 컴파일 (임시 파일에 쓴 뒤 교체하므로 다른 워커가 읽는 중에도 안전)
+
+    Returns:
+        저장한 문장 수
+    """
+    index: List[Dict[str, Any]] = []
+    seen = set()
+    tmp_path = f"{out_path}.{os.getpid()}.tmp"
+    data_path = tmp_path + ".data"
+    offset = 0
+    try:
+        # FST는 임시 데이터 파일로 바로 흘려 보내고 메타데이터만 모은다
+        with open(data_path, "wb") as data:
+            for row in _iter_csv_rows(csv_paths):
+                meta = _row_meta(row)
+                if not meta["sentenceKr"] or meta["sentenceKr"] in seen:
+                    continue
+                fst_text = (row.get("fst") or "").strip()
+                try:
+                    fst = base64.b64decode(fst_text, validate=True) if fst_text else b""
+                except ValueError:
+                    logger.warning(f"Skipping invalid FST for '{meta['sentenceKr']}'")
+                    continue
+                seen.add(meta["sentenceKr"])
+                data.write(fst)
+                meta["fst_hash"] = fst_content_hash(fst_text) if fst_text else None
+                meta["fst_offset"] = offset
+                meta["fst_length"] = len(fst)
+                index.append(meta)
+                offset += len(fst)
+
+        # Presets first, then by given order
+        index.sort(key=lambda m: (m["source"] != "precomputed", m.get("order", 0), str(m.get("id", ""))))
+        index_bytes = json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha256(index_bytes)
+        with open(data_path, "rb") as data:
+            for chunk in iter(lambda: data.read(1 << 20), b""):
+                digest.update(chunk)
+
+        index_offset = _HEADER.size
+        data_offset = index_offset + len(index_bytes)
+        header = _HEADER.pack(
+            STORE_MAGIC, STORE_VERSION, len(index),
+            index_offset, len(index_bytes), data_offset, offset, digest.digest(),
+        )
+        with open(tmp_path, "wb") as out, open(data_path, "rb") as data:
+            out.write(header)
+            out.write(index_bytes)
+            for chunk in iter(lambda: data.read(1 << 20), b""):
+                out.write(chunk)
+        os.replace(tmp_path, out_path)
+    finally:
+        for path in (tmp_path, data_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    logger.info(f"Built {out_path} ({len(index)} sentences, {offset} FST bytes)")
+    return len(index)
+
+
+class PrecomputedSentenceStore:
+    def __init__(
+        self,
+        csv_path: str = SPEECHPRO_PRESET_CSV,
+        store_path: Optional[str] = None,
+        extra_csv_paths: Sequence[str] = (),
+    ):
+        self.csv_paths = [csv_path, *extra_csv_paths]
+        self.store_path = store_path or _store_path(csv_path)
+        self._meta: List[Dict[str, Any]] = []
+        self._spans: List[Tuple[int, int]] = []  # FST (offset, length)
+        self._by_text: Dict[str, int] = {}
+        self._by_id: Dict[Any, int] = {}
+        self._by_hash: Dict[str, int] = {}
+        self._listed: List[int] = []  # 목록 API에 노출할 프리셋 레코드
+        self._mm: Optional[mmap.mmap] = None
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            if self._stale():
+                build_preset_store(self.csv_paths, self.store_path)
+            if not os.path.exists(self.store_path):
+                return
+            if not self._open() and self._has_sources():
+                # 체크섬/형식이 맞지 않으면 CSV에서 한 번 다시 만든다
+                build_preset_store(self.csv_paths, self.store_path)
+                self._open()
+        except Exception as e:
+            print(f"Error loading {self.store_path}: {e}")
+
+    def _has_sources(self) -> bool:
+        return any(os.path.exists(path) for path in self.csv_paths)
+
+    def _stale(self) -> bool:
+        """바이너리가 없거나 원본 CSV보다 오래되었으면 다시 만든다 (CSV가 없으면 있는 바이너리를 그대로 사용)"""
+        sources = [os.path.getmtime(path) for path in self.csv_paths if os.path.exists(path)]
+        if not sources:
+            return False
+        try:
+            return os.path.getmtime(self.store_path) < max(sources)
+        except OSError:
+            return True
+
+    def _open(self) -> bool:
+        """바이너리를 mmap하고 헤더/체크섬 검증 후 인덱스 적재"""
+        with open(self.store_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _HEADER.size:
+                print(f"Error loading {self.store_path}: file too small")
+                return False
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, index_offset, index_length, data_offset, data_length, checksum = \
+            _HEADER.unpack_from(mm, 0)
+        if magic != STORE_MAGIC or version != STORE_VERSION:
+            print(f"Error loading {self.store_path}: unsupported format")
+            mm.close()
+            return False
+        with memoryview(mm) as view:
+            valid = data_offset + data_length == size and hashlib.sha256(view[index_offset:]).digest() == checksum
+        if not valid:
+            print(f"Error loading {self.store_path}: checksum mismatch")
+            mm.close()
+            return False
+
+        index = json.loads(mm[index_offset:index_offset + index_length].decode("utf-8"))
+        if self._mm is not None:
+            self._mm.close()
+        self._mm = mm
+        self._meta, self._spans = [], []
+        self._by_text, self._by_id, self._by_hash, self._listed = {}, {}, {}, []
+        for idx, meta in enumerate(index):
+            self._spans.append((data_offset + meta.pop("fst_offset"), meta.pop("fst_length")))
+            self._meta.append(meta)
+            self._by_text.setdefault(meta["sentenceKr"], idx)
+            if meta["source"] == "precomputed":
+                self._by_id.setdefault(meta["id"], idx)
+                self._listed.append(idx)
+            if meta.get("fst_hash"):
+                self._by_hash.setdefault(meta["fst_hash"], idx)
+        logger.info(f"Loaded {self.store_path} ({count} sentences)")
+        return True
+
+    def __len__(self) -> int:
+        return len(self._meta)
+
+    def _fst(self, idx: int) -> str:
+        offset, length = self._spans[idx]
+        if self._mm is None or not length:
+            return ""
+        return base64.b64encode(self._mm[offset:offset + length]).decode("ascii")
+
+    def _record(self, idx: int, include_fst: bool = True) -> Dict[str, Any]:
+        """include_fst=False이면 음절 정보와 FST를 빼고 fst_hash만 남긴 참조용 레코드"""
+        record = dict(self._meta[idx])
+        if include_fst:
+            record["fst"] = self._fst(idx)
+        else:
+            record.pop("syll_ltrs", None)
+            record.pop("syll_phns", None)
+        return record
+
+    def find_by_text(self, text: str) -> Optional[Dict[str, Any]]:
+        idx = self._by_text.get(normalize_spaces(text or ""))
+        return None if idx is None else self._record(idx)
+
+    def get(self, sentence_id: Any, include_fst: bool = True) -> Optional[Dict[str, Any]]:
+        idx = self._by_id.get(sentence_id)
+        return None if idx is None else self._record(idx, include_fst)
+
+    def get_by_hash(self, fst_hash: str) -> Optional[Dict[str, Any]]:
+        idx = self._by_hash.get(fst_hash)
+        return None if idx is None else self._record(idx)
+
+    def all(self, include_fst: bool = True) -> List[Dict[str, Any]]:
+        return [self._record(idx, include_fst) for idx in self._listed]
+
+    def by_level(self, level: str, include_fst: bool = True) -> List[Dict[str, Any]]:
+        return [
+            self._record(idx, include_fst)
+            for idx in self._listed
+            if self._meta[idx].get("level") == level
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "path": self.store_path,
+            "sentences": len(self._meta),
+            "listed": len(self._listed),
+            "bytes": len(self._mm) if self._mm is not None else 0,
+        }
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="SpeechPro 사전 계산 문장 CSV를 바이너리 저장소로 컴파일")
+    parser.add_argument("csv", nargs="*", default=[SPEECHPRO_PRESET_CSV], help="원본 CSV (여러 개 가능)")
+    parser.add_argument("-o", "--out", default=None, help="출력 경로 (기본: 첫 CSV 이름의 .bin)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    out = args.out or _store_path(args.csv[0])
+    total = build_preset_store(args.csv, out)
+    print(f"{out}: {total} sentences, {os.path.getsize(out)} bytes")
@@ -0,0 +1,157 @@
+"""
+사전 생성 풀 서비스
+
+입력이 미리 알려진 LLM 콘텐츠(예: 상황별 학습 컨텐츠)를 유휴 시간에 생성해 두고
+요청 시 라운드 로빈으로 제공합니다.
+- 키마다 최대 N개의 변형(variant)을 보관하고, TTL이 지난 변형은 교체
+- LLM 서버가 일정 시간 이상 유휴 상태일 때만 한 번에 하나씩 생성
+- 풀에 없는 키는 호출 측이 실시간 생성으로 처리
+"""
+
+import os
+import time
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+PREGEN_VARIANTS = int(os.getenv("PREGEN_VARIANTS", "3"))            # 키당 변형 수 (0이면 비활성화)
+PREGEN_TTL = int(os.getenv("PREGEN_TTL", str(6 * 3600)))            # 변형 유효 시간(초)
+PREGEN_IDLE_SECONDS = float(os.getenv("PREGEN_IDLE_SECONDS", "10"))  # 생성 전 필요한 LLM 유휴 시간(초)
+PREGEN_INTERVAL = float(os.getenv("PREGEN_INTERVAL", "5"))          # 스케줄러 점검 주기(초)
+
+
+class PregenPool:
+    def __init__(
+        self,
+        name: str,
+        variants: int = PREGEN_VARIANTS,
+        ttl: int = PREGEN_TTL,
+        idle_seconds: float = PREGEN_IDLE_SECONDS,
+        interval: float = PREGEN_INTERVAL,
+    ):
+        self.name = name
+        self.variants = variants
+        self.ttl = ttl
+        self.idle_seconds = idle_seconds
+        self.interval = interval
+        self._items: Dict[Hashable, List[Tuple[float, Any]]] = {}
+        self._cursor: Dict[Hashable, int] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._served = 0
+        self._misses = 0
+        self._generated = 0
+        self._failures = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.variants > 0
+
+    def _fresh(self, key: Hashable) -> List[Tuple[float, Any]]:
+        """만료된 변형을 제거하고 남은 목록 반환"""
+        items = self._items.get(key, [])
+        if self.ttl > 0:
+            cutoff = time.time() - self.ttl
+            items = [item for item in items if item[0] >= cutoff]
+            self._items[key] = items
+        return items
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """사전 생성된 변형을 라운드 로빈으로 반환 (없으면 None)"""
+        items = self._fresh(key)
+        if not items:
+            self._misses += 1
+            return None
+        idx = self._cursor.get(key, 0) % len(items)
+        self._cursor[key] = idx + 1
+        self._served += 1
+        return items[idx][1]
+
+    def add(self, key: Hashable, value: Any) -> None:
+        items = self._fresh(key)
+        items.append((time.time(), value))
+        # 상한 초과 시 가장 오래된 변형부터 제거
+        del items[:-self.variants]
+        self._items[key] = items
+
+    def _next_missing(self, keys: Iterable[Hashable]) -> Optional[Hashable]:
+        """변형이 가장 적은 키 (모두 채워졌으면 None)"""
+        best, best_count = None, self.variants
+        for key in keys:
+            count = len(self._fresh(key))
+            if count < best_count:
+                best, best_count = key, count
+        return best
+
+    async def run(
+        self,
+        keys: Callable[[], Iterable[Hashable]],
+        generate: Callable[[Hashable], Awaitable[Optional[Any]]],
+        idle_for: Callable[[], float],
+    ) -> None:
+        """
+        스케줄러 루프
+
+        Args:
+            keys: 채워야 할 키 목록을 반환하는 함수 (모델 변경 등을 반영하도록 매번 호출)
+            generate: 키 하나에 대한 변형을 생성하는 코루틴 함수 (실패 시 None)
+            idle_for: LLM 서버가 유휴 상태로 지난 시간(초)을 반환하는 함수
+        """
+        while True:
+            await asyncio.sleep(self.interval)
+            if idle_for() < self.idle_seconds:
+                continue
+            key = self._next_missing(keys())
+            if key is None:
+                continue
+            try:
+                value = await generate(key)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                value = None
+                logger.warning(f"[{self.name}] pre-generation failed for {key}: {e}")
+            if value is None:
+                self._failures += 1
+                continue
+            self.add(key, value)
+            self._generated += 1
+            logger.info(f"[{self.name}] pre-generated {key} ({len(self._fresh(key))}/{self.variants})")
+
+    def start(
+        self,
+        keys: Callable[[], Iterable[Hashable]],
+        generate: Callable[[Hashable], Awaitable[Optional[Any]]],
+        idle_for: Callable[[], float],
+    ) -> None:
+        """실행 중인 이벤트 루프에 스케줄러 태스크 등록"""
+        if not self.enabled or self._task is not None:
+            return
+        self._task = asyncio.get_running_loop().create_task(self.run(keys, generate, idle_for))
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "variants_per_key": self.variants,
+            "keys": {str(k): len(self._fresh(k)) for k in list(self._items)},
+            "served": self._served,
+            "misses": self._misses,
+            "generated": self._generated,
+            "failures": self._failures,
+            "running": self._task is not None and not self._task.done(),
+        }
@@ -0,0 +1,99 @@
+"""
+한글 로마자 변환 서비스
+
+생성 콘텐츠의 대화 문장마다 호출되므로 변환 비용을 줄입니다.
+- korean_romanizer가 설치되어 있으면 사용 (발음 규칙 반영, 결과는 LRU 캐시)
+- 없으면 11,172개 한글 음절 전체를 미리 계산한 표로 str.translate 한 번에 변환
+  (기존 음절 단위 계산 결과와 바이트 단위로 동일)
+- romanize_many: 여러 문장을 한 번에 변환 (중복 문장은 한 번만 계산)
+"""
+
+import os
+from functools import lru_cache
+from typing import Dict, Iterable, List
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+ROMANIZE_CACHE_SIZE = int(os.getenv("ROMANIZE_CACHE_SIZE", "4096"))  # 최근 변환 결과 캐시 크기
+
+# Revised Romanization 근사 (초성/중성/종성)
+L_TABLE = [
+    "g", "kk", "n", "d", "tt", "r", "m", "b", "pp",
+    "s", "ss", "", "j", "jj", "ch", "k", "t", "p", "h"
+]
+V_TABLE = [
+    "a", "ae", "ya", "yae", "eo", "e", "yeo", "ye", "o",
+    "wa", "wae", "oe", "yo", "u", "wo", "we", "wi", "yu",
+    "eu", "ui", "i"
+]
+T_TABLE = [
+    "", "k", "k", "ks", "n", "nj", "nh", "t", "l", "lg",
+    "lm", "lb", "ls", "lt", "lp", "lh", "m", "p", "ps",
+    "t", "t", "ng", "t", "ch", "k", "t", "p", "h"
+]
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+
+def _build_syllable_table() -> Dict[int, str]:
+    """가(U+AC00)~힣(U+D7A3) 음절 코드 -> 로마자 (str.translate용)"""
+    table: Dict[int, str] = {}
+    t_count = len(T_TABLE)
+    n_count = len(V_TABLE) * t_count
+    for code in range(HANGUL_BASE, HANGUL_LAST + 1):
+        s_index = code - HANGUL_BASE
+        table[code] = (
+            L_TABLE[s_index // n_count]
+            + V_TABLE[(s_index % n_count) // t_count]
+            + T_TABLE[s_index % t_count]
+        )
+    return table
+
+
+SYLLABLE_TABLE = _build_syllable_table()
+
+
+def romanize_table(text: str) -> str:
+    """표 기반 변환: 한글 음절만 바꾸고 나머지 문자는 그대로 둔다"""
+    return text.translate(SYLLABLE_TABLE)
+
+
+try:
+    from korean_romanizer.romanizer import Romanizer
+
+    def _romanize(text: str) -> str:
+        try:
+            return Romanizer(text).romanize()
+        except Exception:
+            return text
+
+    ROMANIZER_AVAILABLE = True
+except Exception:
+    def _romanize(text: str) -> str:
+        try:
+            return romanize_table(text)
+        except Exception:
+            return text
+
+    ROMANIZER_AVAILABLE = False
+
+
+@lru_cache(maxsize=ROMANIZE_CACHE_SIZE)
+def romanize_korean(text: str) -> str:
+    """한글 문장을 로마자로 변환 (최근 입력은 캐시)"""
+    return _romanize(text)
+
+
+def romanize_many(texts: Iterable[str]) -> List[str]:
+    """여러 문장을 순서대로 변환 (같은 문장은 한 번만 계산)"""
+    done: Dict[str, str] = {}
+    out = []
+    for text in texts:
+        result = done.get(text)
+        if result is None:
+            result = done[text] = romanize_korean(text)
+        out.append(result)
+    return out
@@ -0,0 +1,242 @@
+"""
+SpeechPro 서킷 브레이커 서비스
+
+SpeechPro 서버가 느리거나 꺼져 있을 때 모든 평가 요청이 15/20/30초 타임아웃을 기다리며
+워커를 붙잡지 않도록 합니다.
+- 연속 실패가 SPEECHPRO_BREAKER_FAILURES회를 넘으면 open: 요청을 바로 SpeechProUnavailableError(HTTP 503)로 거절
+- open 상태에서는 백그라운드 헬스 프로브가 주기적으로 확인하고, 성공하면 closed로 복구
+  (프로브가 없으면 쿨다운 후 half-open으로 요청 하나만 통과시켜 확인)
+- 연결 오류/5xx는 지터를 준 지수 백오프로 재시도하되, 최근 요청 대비 재시도 비율(retry budget)을 넘지 않음
+- 상태/통계는 GET /api/speechpro/config의 breaker에 노출
+"""
+
+import os
+import time
+import random
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+SPEECHPRO_BREAKER_FAILURES = int(os.getenv("SPEECHPRO_BREAKER_FAILURES", "5"))        # open까지 연속 실패 수
+SPEECHPRO_BREAKER_COOLDOWN = float(os.getenv("SPEECHPRO_BREAKER_COOLDOWN", "30"))     # open 유지 시간(초)
+SPEECHPRO_RETRIES = int(os.getenv("SPEECHPRO_RETRIES", "2"))                          # 호출당 최대 재시도 수
+SPEECHPRO_RETRY_BASE = float(os.getenv("SPEECHPRO_RETRY_BASE", "0.2"))                # 백오프 기본(초)
+SPEECHPRO_RETRY_MAX = float(os.getenv("SPEECHPRO_RETRY_MAX", "2"))                    # 백오프 상한(초)
+SPEECHPRO_RETRY_BUDGET = float(os.getenv("SPEECHPRO_RETRY_BUDGET", "0.2"))            # 최근 요청 대비 재시도 비율
+SPEECHPRO_RETRY_BUDGET_MIN = int(os.getenv("SPEECHPRO_RETRY_BUDGET_MIN", "3"))        # 요청이 적을 때 허용할 재시도 수
+SPEECHPRO_RETRY_WINDOW = float(os.getenv("SPEECHPRO_RETRY_WINDOW", "10"))             # 재시도 예산 계산 구간(초)
+SPEECHPRO_PROBE_INTERVAL = float(os.getenv("SPEECHPRO_PROBE_INTERVAL", "10"))         # 헬스 프로브 간격(초)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class SpeechProUnavailableError(RuntimeError):
+    """서킷이 열려 있어 SpeechPro 호출을 바로 거절함"""
+
+    def __init__(self, message: str, retry_after: int = 1):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class RetryBudget:
+    """최근 window초 동안의 요청 수 대비 재시도 수를 ratio 이하로 제한"""
+
+    def __init__(
+        self,
+        ratio: float = SPEECHPRO_RETRY_BUDGET,
+        min_retries: int = SPEECHPRO_RETRY_BUDGET_MIN,
+        window: float = SPEECHPRO_RETRY_WINDOW,
+    ):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self.exhausted = 0
+
+    def _trim(self, now: float) -> None:
+        cutoff = now - self.window
+        for events in (self._requests, self._retries):
+            while events and events[0] < cutoff:
+                events.popleft()
+
+    def record_request(self) -> None:
+        self._requests.append(time.monotonic())
+
+    def try_retry(self) -> bool:
+        now = time.monotonic()
+        self._trim(now)
+        if len(self._retries) >= max(self.min_retries, self.ratio * len(self._requests)):
+            self.exhausted += 1
+            return False
+        self._retries.append(now)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        self._trim(time.monotonic())
+        return {
+            "ratio": self.ratio,
+            "window_s": self.window,
+            "recent_requests": len(self._requests),
+            "recent_retries": len(self._retries),
+            "exhausted": self.exhausted,
+        }
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_threshold: int = SPEECHPRO_BREAKER_FAILURES,
+        cooldown: float = SPEECHPRO_BREAKER_COOLDOWN,
+        probe_interval: float = SPEECHPRO_PROBE_INTERVAL,
+        retries: int = SPEECHPRO_RETRIES,
+        retry_base: float = SPEECHPRO_RETRY_BASE,
+        retry_max: float = SPEECHPRO_RETRY_MAX,
+    ):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.probe_interval = probe_interval
+        self.retries = retries
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.budget = RetryBudget()
+        self.state = CLOSED
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._trial_started = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._stats = {"rejected": 0, "opened": 0, "failures": 0, "retries": 0, "probes": 0, "probe_failures": 0}
+        self.last_error: Optional[str] = None
+
+    def _retry_after(self) -> int:
+        if self._opened_at is None:
+            return 1
+        return max(1, int(self._opened_at + self.cooldown - time.monotonic() + 0.999))
+
+    def _unavailable(self) -> SpeechProUnavailableError:
+        self._stats["rejected"] += 1
+        return SpeechProUnavailableError(
+            "SpeechPro 서버에 연결할 수 없어 발음 평가를 잠시 중단했습니다. 잠시 후 다시 시도해주세요.",
+            retry_after=self._retry_after(),
+        )
+
+    def reject_if_open(self) -> None:
+        """오디오 변환 등 비싼 작업 전에 확인 (half-open 시험 요청 자리는 쓰지 않음)"""
+        if self.state == OPEN and time.monotonic() - self._opened_at < self.cooldown:
+            raise self._unavailable()
+
+    def before_call(self) -> None:
+        """호출 전 확인. open이면 SpeechProUnavailableError"""
+        if self.state == OPEN and time.monotonic() - self._opened_at >= self.cooldown:
+            # 쿨다운이 지나면 요청 하나로 복구 여부를 확인
+            self.state = HALF_OPEN
+        if self.state == HALF_OPEN and (
+            not self._trial_in_flight or time.monotonic() - self._trial_started >= self.cooldown
+        ):
+            # 시험 요청이 취소되어 결과가 기록되지 않았으면 쿨다운 후 다시 허용
+            self._trial_in_flight = True
+            self._trial_started = time.monotonic()
+        elif self.state != CLOSED:
+            raise self._unavailable()
+        self.budget.record_request()
+
+    def record_success(self) -> None:
+        if self.state != CLOSED:
+            logger.info("SpeechPro 서킷 복구 (closed)")
+        self.state = CLOSED
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+        self.last_error = None
+
+    def reset(self) -> None:
+        """SpeechPro URL이 바뀌면 호출"""
+        self.record_success()
+
+    def record_failure(self, error: str) -> None:
+        self._failures += 1
+        self._stats["failures"] += 1
+        self.last_error = error
+        self._trial_in_flight = False
+        if self.state == HALF_OPEN or (self.state == CLOSED and self._failures >= self.failure_threshold):
+            self._open()
+        elif self.state == OPEN:
+            self._opened_at = time.monotonic()
+
+    def _open(self) -> None:
+        if self.state != OPEN:
+            self._stats["opened"] += 1
+            logger.warning(f"SpeechPro 서킷 열림: 연속 실패 {self._failures}회 ({self.last_error})")
+        self.state = OPEN
+        self._opened_at = time.monotonic()
+
+    def next_retry_delay(self, attempt: int) -> Optional[float]:
+        """attempt번째 재시도 대기 시간 (full jitter). 재시도 불가(횟수/예산/서킷)면 None"""
+        if attempt > self.retries or self.state != CLOSED or not self.budget.try_retry():
+            return None
+        self._stats["retries"] += 1
+        return random.uniform(0, min(self.retry_max, self.retry_base * (2 ** attempt)))
+
+    async def run_probe(self, probe: Callable[[], Awaitable[Any]]) -> None:
+        """서킷이 닫혀 있지 않은 동안 probe_interval마다 헬스 프로브 실행"""
+        while True:
+            await asyncio.sleep(self.probe_interval)
+            if self.state == CLOSED:
+                continue
+            self._stats["probes"] += 1
+            try:
+                await probe()
+                self.record_success()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._stats["probe_failures"] += 1
+                self.last_error = f"probe: {e}"
+                self._trial_in_flight = False
+                self._open()
+                logger.warning(f"SpeechPro 헬스 프로브 실패: {e}")
+
+    def start(self, probe: Callable[[], Awaitable[Any]]) -> None:
+        """실행 중인 이벤트 루프에 헬스 프로브 태스크 등록"""
+        if self.probe_interval <= 0 or self._task is not None:
+            return
+        self._task = asyncio.get_running_loop().create_task(self.run_probe(probe))
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        return dict(
+            self._stats,
+            state=self.state,
+            degraded=self.state != CLOSED,
+            consecutive_failures=self._failures,
+            retry_after_s=self._retry_after() if self.state != CLOSED else 0,
+            last_error=self.last_error,
+            failure_threshold=self.failure_threshold,
+            cooldown_s=self.cooldown,
+            probe_interval_s=self.probe_interval,
+            max_retries=self.retries,
+            retry_budget=self.budget.stats(),
+        )
+
+
+# 프로세스 공용 SpeechPro 서킷 브레이커
+speechpro_breaker = CircuitBreaker()
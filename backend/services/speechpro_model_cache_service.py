@@ -0,0 +1,177 @@
+"""
+SpeechPro 발음 모델(GTP/FST) 캐시 서비스
+
+GTP와 Model 결과는 정규화된 문장에만 의존하므로, 사전 계산 목록(sp_ko_questions.csv)에
+없는 문장도 한 번 계산한 결과를 SQLite에 저장해 다음 평가부터는 Score 호출만 하게 합니다.
+- 키: normalize_spaces(text) + SpeechPro URL + 모델 버전 태그의 SHA-256
+- 값: syll_ltrs, syll_phns, fst
+- 용량: 전체 크기가 상한을 넘으면 마지막 접근이 오래된 항목부터 삭제 (LRU)
+- async 핸들러에서는 aget/aput/astats를 사용 (SQLite I/O를 스레드에서 실행해 이벤트 루프를 막지 않음)
+"""
+
+import os
+import time
+import asyncio
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+from dotenv import load_dotenv
+
+from backend.services.speechpro_service import normalize_spaces
+
+# .env 파일 로드
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+SPEECHPRO_MODEL_CACHE_PATH = os.getenv("SPEECHPRO_MODEL_CACHE_PATH", "data/speechpro_model_cache.db")
+SPEECHPRO_MODEL_CACHE_MAX_BYTES = int(os.getenv("SPEECHPRO_MODEL_CACHE_MAX_BYTES", str(200 * 1024 * 1024)))
+# SpeechPro 엔진/사전이 바뀌면 올려서 이전 FST를 무효화
+SPEECHPRO_MODEL_VERSION = os.getenv("SPEECHPRO_MODEL_VERSION", "1")
+
+
+def make_model_cache_key(text: str, speechpro_url: str, version: str = SPEECHPRO_MODEL_VERSION) -> str:
+    raw = "\x1f".join((normalize_spaces(text), speechpro_url.rstrip("/"), version))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class SpeechProModelCache:
+    def __init__(
+        self,
+        db_path: str = SPEECHPRO_MODEL_CACHE_PATH,
+        max_bytes: int = SPEECHPRO_MODEL_CACHE_MAX_BYTES,
+        version: str = SPEECHPRO_MODEL_VERSION,
+    ):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.version = version
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=5)
+
+    def _init_db(self):
+        """캐시 테이블 초기화"""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS speechpro_model_cache (
+                    key TEXT PRIMARY KEY,
+                    text TEXT NOT NULL,
+                    syll_ltrs TEXT NOT NULL,
+                    syll_phns TEXT NOT NULL,
+                    fst TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_speechpro_model_cache_access ON speechpro_model_cache(last_access)"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get(self, text: str, speechpro_url: str) -> Optional[Dict[str, Any]]:
+        """캐시 조회. 없으면 None, 있으면 {"text", "syll_ltrs", "syll_phns", "fst"}"""
+        key = make_model_cache_key(text, speechpro_url, self.version)
+        with self._lock:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT text, syll_ltrs, syll_phns, fst FROM speechpro_model_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    self._misses += 1
+                    return None
+                conn.execute(
+                    "UPDATE speechpro_model_cache SET last_access = ?, hits = hits + 1 WHERE key = ?",
+                    (time.time(), key),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        self._hits += 1
+        return {"text": row[0], "syll_ltrs": row[1], "syll_phns": row[2], "fst": row[3]}
+
+    def put(self, text: str, speechpro_url: str, syll_ltrs: str, syll_phns: str, fst: str) -> None:
+        """GTP/Model 결과 저장 후 용량 상한을 넘으면 LRU 순으로 삭제"""
+        if not (syll_ltrs and syll_phns and fst):
+            return
+        text = normalize_spaces(text)
+        size = sum(len(v.encode("utf-8")) for v in (text, syll_ltrs, syll_phns, fst))
+        if size > self.max_bytes:
+            return
+        key = make_model_cache_key(text, speechpro_url, self.version)
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO speechpro_model_cache
+                        (key, text, syll_ltrs, syll_phns, fst, size, created_at, last_access, hits)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)
+                    """,
+                    (key, text, syll_ltrs, syll_phns, fst, size, now, now),
+                )
+                self._evict(conn)
+                conn.commit()
+            finally:
+                conn.close()
+
+    async def aget(self, text: str, speechpro_url: str) -> Optional[Dict[str, Any]]:
+        """get의 비동기 버전 (스레드에서 실행)"""
+        return await asyncio.to_thread(self.get, text, speechpro_url)
+
+    async def aput(self, text: str, speechpro_url: str, syll_ltrs: str, syll_phns: str, fst: str) -> None:
+        """put의 비동기 버전 (스레드에서 실행)"""
+        await asyncio.to_thread(self.put, text, speechpro_url, syll_ltrs, syll_phns, fst)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM speechpro_model_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = conn.execute("SELECT key, size FROM speechpro_model_cache ORDER BY last_access ASC").fetchall()
+        victims = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM speechpro_model_cache WHERE key = ?", victims)
+        logger.info(f"SpeechPro model cache evicted {len(victims)} entries")
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 항목 수/총 크기/히트"""
+        conn = self._connect()
+        try:
+            count, total, hits = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(hits), 0) FROM speechpro_model_cache"
+            ).fetchone()
+        finally:
+            conn.close()
+        return {
+            "entries": count,
+            "bytes": total,
+            "hits": hits,
+            "session_hits": self._hits,
+            "session_misses": self._misses,
+            "max_bytes": self.max_bytes,
+            "version": self.version,
+        }
+
+    async def astats(self) -> Dict[str, Any]:
+        """stats의 비동기 버전 (스레드에서 실행)"""
+        return await asyncio.to_thread(self.stats)
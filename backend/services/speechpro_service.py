@@ -6,16 +6,40 @@ GTP (Grapheme-to-Phoneme), Model, Score의 3단계 워크플로우를 지원합
 """
 
 import os
+import json
 import uuid
+import asyncio
 import requests
 import base64
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, AsyncIterator, Iterator, Optional, List, Union
 from dataclasses import dataclass
 
+import aiohttp
+
+from backend.services.speechpro_breaker_service import (
+    CircuitBreaker,
+    SpeechProUnavailableError,
+    speechpro_breaker,
+)
+
 
 # SpeechPro API 설정
 SPEECHPRO_URL = os.getenv('SPEECHPRO_TARGET', 'http://112.220.79.222:33005/speechpro')
 
+# 비동기 클라이언트 커넥션 풀 설정 (keep-alive)
+SPEECHPRO_POOL_SIZE = int(os.getenv('SPEECHPRO_POOL_SIZE', '64'))
+SPEECHPRO_KEEPALIVE_TIMEOUT = float(os.getenv('SPEECHPRO_KEEPALIVE_TIMEOUT', '60'))
+
+# 단계별 타임아웃(초)
+GTP_TIMEOUT = 15
+MODEL_TIMEOUT = 20
+SCORE_TIMEOUT = 30  # 발음 평가 타임아웃 단축
+
+# Score 요청 본문을 만들 때 한 번에 base64로 인코딩할 오디오 크기 (3의 배수로 맞춤)
+SPEECHPRO_SCORE_CHUNK_SIZE = int(os.getenv('SPEECHPRO_SCORE_CHUNK_SIZE', str(48 * 1024)))
+
+_session: Optional[aiohttp.ClientSession] = None
+
 
 # 공백 정규화 함수
 def normalize_spaces(text: str) -> str:
@@ -124,6 +148,26 @@ def call_speechpro_gtp(text: str, request_id: Optional[str] = None) -> GTPResult
         >>> result.syll_ltrs
         '안_녕_하_세_요'
     """
+    payload = _gtp_payload(text, request_id)
+
+    try:
+        response = requests.post(
+            _endpoint('gtp'),
+            json=payload,
+            headers={'Content-Type': 'application/json'},
+            timeout=GTP_TIMEOUT
+        )
+        response.raise_for_status()
+        return _parse_gtp(response.json(), payload)
+    except requests.exceptions.RequestException as e:
+        raise RuntimeError(f"GTP API 호출 실패: {str(e)}")
+
+
+def _endpoint(path: str) -> str:
+    return f"{SPEECHPRO_URL.rstrip('/')}/{path}"
+
+
+def _gtp_payload(text: str, request_id: Optional[str]) -> Dict[str, Any]:
     if not text or not text.strip():
         raise ValueError("text is required")
 
@@ -134,33 +178,20 @@ def call_speechpro_gtp(text: str, request_id: Optional[str] = None) -> GTPResult
     if not request_id:
         request_id = f"gtp_{uuid.uuid4().hex[:8]}"
 
-    # SpeechPro GTP API 호출
-    url = f"{SPEECHPRO_URL.rstrip('/')}/gtp"
-
-    payload = {
+    return {
         "id": request_id,
         "text": text
     }
 
-    try:
-        response = requests.post(
-            url,
-            json=payload,
-            headers={'Content-Type': 'application/json'},
-            timeout=15
-        )
-        response.raise_for_status()
-        data = response.json()
-        
-        return GTPResult(
-            id=data.get('id', request_id),
-            text=data.get('text', text),
-            syll_ltrs=data.get('syll ltrs', ''),
-            syll_phns=data.get('syll phns', ''),
-            error_code=data.get('error code', 0)
-        )
-    except requests.exceptions.RequestException as e:
-        raise RuntimeError(f"GTP API 호출 실패: {str(e)}")
+
+def _parse_gtp(data: Dict[str, Any], payload: Dict[str, Any]) -> GTPResult:
+    return GTPResult(
+        id=data.get('id', payload['id']),
+        text=data.get('text', payload['text']),
+        syll_ltrs=data.get('syll ltrs', ''),
+        syll_phns=data.get('syll phns', ''),
+        error_code=data.get('error code', 0)
+    )
 
 
 def call_speechpro_model(
@@ -195,41 +226,45 @@ def call_speechpro_model(
         ...     syll_phns=gtp_result.syll_phns
         ... )
     """
+    payload = _model_payload(text, syll_ltrs, syll_phns, request_id)
+
+    try:
+        response = requests.post(
+            _endpoint('model'),
+            json=payload,
+            headers={'Content-Type': 'application/json'},
+            timeout=MODEL_TIMEOUT
+        )
+        response.raise_for_status()
+        return _parse_model(response.json(), payload)
+    except requests.exceptions.RequestException as e:
+        raise RuntimeError(f"Model API 호출 실패: {str(e)}")
+
+
+def _model_payload(text: str, syll_ltrs: str, syll_phns: str, request_id: Optional[str]) -> Dict[str, Any]:
     if not all([text, syll_ltrs, syll_phns]):
         raise ValueError("text, syll_ltrs, syll_phns are required")
 
     if not request_id:
         request_id = f"model_{uuid.uuid4().hex[:8]}"
 
-    url = f"{SPEECHPRO_URL.rstrip('/')}/model"
-
-    payload = {
+    return {
         "id": request_id,
         "text": text,
         "syll ltrs": syll_ltrs,
         "syll phns": syll_phns
     }
 
-    try:
-        response = requests.post(
-            url,
-            json=payload,
-            headers={'Content-Type': 'application/json'},
-            timeout=20
-        )
-        response.raise_for_status()
-        data = response.json()
-        
-        return ModelResult(
-            id=data.get('id', request_id),
-            text=data.get('text', text),
-            syll_ltrs=data.get('syll ltrs', syll_ltrs),
-            syll_phns=data.get('syll phns', syll_phns),
-            fst=data.get('fst', ''),
-            error_code=data.get('error code', 0)
-        )
-    except requests.exceptions.RequestException as e:
-        raise RuntimeError(f"Model API 호출 실패: {str(e)}")
+
+def _parse_model(data: Dict[str, Any], payload: Dict[str, Any]) -> ModelResult:
+    return ModelResult(
+        id=data.get('id', payload['id']),
+        text=data.get('text', payload['text']),
+        syll_ltrs=data.get('syll ltrs', payload['syll ltrs']),
+        syll_phns=data.get('syll phns', payload['syll phns']),
+        fst=data.get('fst', ''),
+        error_code=data.get('error code', 0)
+    )
 
 
 def call_speechpro_score(
@@ -271,75 +306,124 @@ def call_speechpro_score(
         ...     audio_data=audio
         ... )
     """
-    if not all([text, syll_ltrs, syll_phns, fst, audio_data]):
-        raise ValueError("text, syll_ltrs, syll_phns, fst, audio_data are required")
-
-    if not request_id:
-        request_id = f"score_{uuid.uuid4().hex[:8]}"
-
-    # 오디오 데이터를 Base64로 인코딩
-    wav_usr = base64.b64encode(audio_data).decode('utf-8')
-    print(f"[Score] Audio size: {len(audio_data)} bytes, Base64 size: {len(wav_usr)}, Text: {text}")
-
-    url = f"{SPEECHPRO_URL.rstrip('/')}/scorejson"
-    print(f"[Score] URL: {url}, Request ID: {request_id}")
-
-    payload = {
-        "id": request_id,
-        "text": text,
-        "syll ltrs": syll_ltrs,
-        "syll phns": syll_phns,
-        "fst": fst,
-        "wav usr": wav_usr
-    }
+    body = _score_payload(text, syll_ltrs, syll_phns, fst, audio_data, request_id)
 
     try:
-        print(f"[Score] Sending payload with FST length: {len(fst)}")
         response = requests.post(
-            url,
-            json=payload,
+            _endpoint('scorejson'),
+            data=body,
             headers={'Content-Type': 'application/json'},
-            timeout=30  # 발음 평가 타임아웃 단축
+            timeout=SCORE_TIMEOUT
         )
         print(f"[Score] Response status: {response.status_code}")
         response.raise_for_status()
-        data = response.json()
-        print(f"[Score] Response data: {data}")
-        
-        # 일부 SpeechPro 빌드에서는 scorejson 응답이 {"score": ..., "details": ...}
-        # 대신 {"result": {"quality": {...}, "fluency": {...}}} 형태로 반환됨.
-        # 점수가 없으면 quality.sentences의 평균 점수를 사용하고, 상세는 result 전체를 전달한다.
-        raw_score = data.get('score')
-        details = data.get('details') or data.get('result') or {}
-
-        computed_score = raw_score
-        if computed_score is None:
-            quality = details.get('quality', {}) if isinstance(details, dict) else {}
-            sentences = quality.get('sentences', []) if isinstance(quality, dict) else []
-            # !SIL과 0점(무음) 문장은 제외하고 평균을 계산
-            scored_sentences = [
-                s.get('score')
-                for s in sentences
-                if isinstance(s, dict)
-                and s.get('score') is not None
-                and s.get('text') not in ('!SIL', '')
-                and s.get('score') > 0
-            ]
-            if scored_sentences:
-                computed_score = sum(scored_sentences) / len(scored_sentences)
-            else:
-                computed_score = 0.0
-
-        return ScoreResult(
-            score=float(computed_score or 0.0),
-            details=details,
-            error_code=data.get('error code', 0)
-        )
+        return _parse_score(response.json())
     except requests.exceptions.RequestException as e:
         print(f"[Score] Error: {str(e)}")
         raise RuntimeError(f"Score API 호출 실패: {str(e)}")
 
 
+class ScoreRequestBody:
+    """
+    scorejson 요청 본문 (스트리밍)
+
+    오디오 전체를 base64 문자열로 만든 뒤 JSON으로 다시 직렬화하지 않고,
+    JSON 앞부분 -> 오디오 base64(청크 단위) -> 끝부분 순서로 바이트를 내보낸다.
+    결과 바이트는 json.dumps(payload)와 같고, 추가 메모리는 청크 크기로 제한된다.
+    __len__이 있으므로 requests/aiohttp가 chunked 대신 Content-Length로 전송한다.
+    """
+
+    def __init__(self, fields: Dict[str, Any], audio_data: bytes, chunk_size: int = SPEECHPRO_SCORE_CHUNK_SIZE):
+        head = json.dumps(fields)
+        self._prefix = (head[:-1] + ', "wav usr": "').encode('utf-8')
+        self._suffix = b'"}'
+        self._audio = memoryview(audio_data)
+        self._chunk_size = max(3, chunk_size - chunk_size % 3)
+
+    @property
+    def base64_size(self) -> int:
+        return (len(self._audio) + 2) // 3 * 4
+
+    def __len__(self) -> int:
+        return len(self._prefix) + self.base64_size + len(self._suffix)
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._prefix
+        for start in range(0, len(self._audio), self._chunk_size):
+            yield base64.b64encode(self._audio[start:start + self._chunk_size])
+        yield self._suffix
+
+    async def aiter(self) -> AsyncIterator[bytes]:
+        for chunk in self:
+            yield chunk
+
+
+def _score_payload(
+    text: str,
+    syll_ltrs: str,
+    syll_phns: str,
+    fst: str,
+    audio_data: bytes,
+    request_id: Optional[str]
+) -> ScoreRequestBody:
+    if not all([text, syll_ltrs, syll_phns, fst, audio_data]):
+        raise ValueError("text, syll_ltrs, syll_phns, fst, audio_data are required")
+
+    if not request_id:
+        request_id = f"score_{uuid.uuid4().hex[:8]}"
+
+    # 오디오는 전송하면서 청크 단위로 Base64 인코딩
+    body = ScoreRequestBody(
+        {
+            "id": request_id,
+            "text": text,
+            "syll ltrs": syll_ltrs,
+            "syll phns": syll_phns,
+            "fst": fst,
+        },
+        audio_data,
+    )
+    print(f"[Score] Audio size: {len(audio_data)} bytes, Base64 size: {body.base64_size}, Text: {text}")
+    print(f"[Score] URL: {_endpoint('scorejson')}, Request ID: {request_id}")
+    print(f"[Score] Sending payload with FST length: {len(fst)}")
+
+    return body
+
+
+def _parse_score(data: Dict[str, Any]) -> ScoreResult:
+    print(f"[Score] Response data: {data}")
+
+    # 일부 SpeechPro 빌드에서는 scorejson 응답이 {"score": ..., "details": ...}
+    # 대신 {"result": {"quality": {...}, "fluency": {...}}} 형태로 반환됨.
+    # 점수가 없으면 quality.sentences의 평균 점수를 사용하고, 상세는 result 전체를 전달한다.
+    raw_score = data.get('score')
+    details = data.get('details') or data.get('result') or {}
+
+    computed_score = raw_score
+    if computed_score is None:
+        quality = details.get('quality', {}) if isinstance(details, dict) else {}
+        sentences = quality.get('sentences', []) if isinstance(quality, dict) else []
+        # !SIL과 0점(무음) 문장은 제외하고 평균을 계산
+        scored_sentences = [
+            s.get('score')
+            for s in sentences
+            if isinstance(s, dict)
+            and s.get('score') is not None
+            and s.get('text') not in ('!SIL', '')
+            and s.get('score') > 0
+        ]
+        if scored_sentences:
+            computed_score = sum(scored_sentences) / len(scored_sentences)
+        else:
+            computed_score = 0.0
+
+    return ScoreResult(
+        score=float(computed_score or 0.0),
+        details=details,
+        error_code=data.get('error code', 0)
+    )
+
+
 def speechpro_full_workflow(
     text: str,
     audio_data: bytes,
@@ -434,6 +518,213 @@ def speechpro_full_workflow(
         }
 
 
+# ============================================================================
+# 비동기 클라이언트 (keep-alive 커넥션 풀)
+# ============================================================================
+# FastAPI 핸들러에서는 아래 *_async 함수를 사용한다. 요청/응답 형식과 예외는
+# 동기 함수와 같다 (ValueError: 입력 누락, RuntimeError: API 호출 실패).
+
+async def get_speechpro_session() -> aiohttp.ClientSession:
+    """SpeechPro 공유 aiohttp 세션 반환 (없으면 생성)"""
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=SPEECHPRO_POOL_SIZE,
+            keepalive_timeout=SPEECHPRO_KEEPALIVE_TIMEOUT,
+        )
+        _session = aiohttp.ClientSession(connector=connector)
+    return _session
+
+
+async def close_speechpro_session() -> None:
+    """공유 세션 종료 (앱 종료 시 호출)"""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+def _request_body(payload: Union[Dict[str, Any], ScoreRequestBody]) -> Dict[str, Any]:
+    if isinstance(payload, ScoreRequestBody):
+        # 스트리밍 본문: 길이를 알고 있으므로 Content-Length로 전송 (재시도 시 처음부터 다시 생성)
+        return {
+            'data': payload.aiter(),
+            'headers': {'Content-Type': 'application/json', 'Content-Length': str(len(payload))},
+        }
+    return {'json': payload}
+
+
+async def _post_json_async(
+    path: str,
+    payload: Union[Dict[str, Any], ScoreRequestBody],
+    timeout: float,
+    label: str,
+    breaker: Optional[CircuitBreaker] = speechpro_breaker
+) -> Dict[str, Any]:
+    """
+    SpeechPro POST 호출 (서킷 브레이커 + 재시도)
+
+    - 서킷이 열려 있으면 바로 SpeechProUnavailableError
+    - 연결 오류/5xx는 지터 백오프로 재시도 (재시도 예산 안에서만)
+    - 타임아웃은 실패로 기록하되 재시도하지 않음 (이미 timeout초를 기다렸으므로)
+    - 4xx는 서버가 응답한 것이므로 실패로 세지 않음
+    """
+    if breaker is not None:
+        breaker.before_call()
+    session = await get_speechpro_session()
+    attempt = 0
+    while True:
+        try:
+            async with session.post(
+                _endpoint(path),
+                timeout=aiohttp.ClientTimeout(total=timeout),
+                **_request_body(payload),
+            ) as response:
+                if path == 'scorejson':
+                    print(f"[Score] Response status: {response.status}")
+                if response.status < 500 and breaker is not None:
+                    breaker.record_success()
+                response.raise_for_status()
+                return await response.json(content_type=None)
+        except asyncio.TimeoutError:
+            if breaker is not None:
+                breaker.record_failure(f"{label} timed out after {timeout}s")
+            raise RuntimeError(f"{label} API 호출 실패: timed out after {timeout}s")
+        except aiohttp.ClientResponseError as e:
+            if e.status < 500:
+                raise RuntimeError(f"{label} API 호출 실패: {str(e)}")
+            error = e
+        except aiohttp.ClientError as e:
+            error = e
+
+        # 연결 오류 / 5xx
+        if breaker is None:
+            raise RuntimeError(f"{label} API 호출 실패: {str(error)}")
+        breaker.record_failure(f"{label}: {error}")
+        attempt += 1
+        delay = breaker.next_retry_delay(attempt)
+        if delay is None:
+            raise RuntimeError(f"{label} API 호출 실패: {str(error)}")
+        print(f"[{label}] 재시도 {attempt}/{breaker.retries} ({delay:.2f}s 후): {error}")
+        await asyncio.sleep(delay)
+
+
+async def speechpro_health_probe(timeout: float = 5) -> None:
+    """헬스 프로브: 짧은 문장으로 GTP를 호출 (서킷 상태와 무관하게 직접 호출)"""
+    payload = _gtp_payload("안녕하세요", f"probe_{uuid.uuid4().hex[:8]}")
+    data = await _post_json_async('gtp', payload, timeout, 'Probe', breaker=None)
+    if data.get('error code', 0) != 0:
+        raise RuntimeError(f"GTP error_code={data.get('error code')}")
+
+
+async def call_speechpro_gtp_async(
+    text: str,
+    request_id: Optional[str] = None,
+    breaker: Optional[CircuitBreaker] = speechpro_breaker
+) -> GTPResult:
+    """
+    call_speechpro_gtp의 비동기 버전
+
+    breaker=None이면 서킷 브레이커/재시도 없이 직접 호출 (재시도를 스스로 하는 일괄 작업용)
+    """
+    payload = _gtp_payload(text, request_id)
+    data = await _post_json_async('gtp', payload, GTP_TIMEOUT, 'GTP', breaker=breaker)
+    return _parse_gtp(data, payload)
+
+
+async def call_speechpro_model_async(
+    text: str,
+    syll_ltrs: str,
+    syll_phns: str,
+    request_id: Optional[str] = None,
+    breaker: Optional[CircuitBreaker] = speechpro_breaker
+) -> ModelResult:
+    """call_speechpro_model의 비동기 버전 (breaker는 call_speechpro_gtp_async 참고)"""
+    payload = _model_payload(text, syll_ltrs, syll_phns, request_id)
+    data = await _post_json_async('model', payload, MODEL_TIMEOUT, 'Model', breaker=breaker)
+    return _parse_model(data, payload)
+
+
+async def call_speechpro_score_async(
+    text: str,
+    syll_ltrs: str,
+    syll_phns: str,
+    fst: str,
+    audio_data: bytes,
+    request_id: Optional[str] = None
+) -> ScoreResult:
+    """call_speechpro_score의 비동기 버전"""
+    payload = _score_payload(text, syll_ltrs, syll_phns, fst, audio_data, request_id)
+    try:
+        data = await _post_json_async('scorejson', payload, SCORE_TIMEOUT, 'Score')
+    except RuntimeError as e:
+        print(f"[Score] Error: {str(e)}")
+        raise
+    return _parse_score(data)
+
+
+async def speechpro_full_workflow_async(
+    text: str,
+    audio_data: bytes,
+    request_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """speechpro_full_workflow의 비동기 버전 (반환 형식 동일)"""
+    if not text or not text.strip():
+        raise ValueError("text is required")
+    
+    if not audio_data or len(audio_data) == 0:
+        raise ValueError("audio_data is required")
+
+    # 공백 정규화
+    text = normalize_spaces(text)
+
+    if not request_id:
+        request_id = f"workflow_{uuid.uuid4().hex[:8]}"
+
+    try:
+        gtp_result = await call_speechpro_gtp_async(text, request_id)
+        if gtp_result.error_code != 0:
+            raise RuntimeError(f"GTP 오류: error_code={gtp_result.error_code}")
+
+        model_result = await call_speechpro_model_async(
+            text=text,
+            syll_ltrs=gtp_result.syll_ltrs,
+            syll_phns=gtp_result.syll_phns,
+            request_id=request_id
+        )
+        if model_result.error_code != 0:
+            raise RuntimeError(f"Model 오류: error_code={model_result.error_code}")
+
+        score_result = await call_speechpro_score_async(
+            text=text,
+            syll_ltrs=model_result.syll_ltrs,
+            syll_phns=model_result.syll_phns,
+            fst=model_result.fst,
+            audio_data=audio_data,
+            request_id=request_id
+        )
+        if score_result.error_code != 0:
+            raise RuntimeError(f"Score 오류: error_code={score_result.error_code}")
+
+        return {
+            'gtp': gtp_result.to_dict(),
+            'model': model_result.to_dict(),
+            'score': score_result.to_dict(),
+            'overall_score': score_result.score,
+            'success': True
+        }
+
+    except SpeechProUnavailableError:
+        # 서킷이 열려 있으면 호출 측이 503으로 바로 응답하도록 그대로 전달
+        raise
+    except Exception as e:
+        return {
+            'error': str(e),
+            'success': False,
+            'overall_score': 0.0
+        }
+
+
 def get_speechpro_url() -> str:
     """현재 SpeechPro API URL 반환"""
     return SPEECHPRO_URL
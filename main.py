@@ -1,4 +1,5 @@
 import os
+import time
 import shutil
 import csv
 import sqlite3
@@ -11,7 +12,7 @@ from datetime import datetime
 from fastapi import FastAPI, UploadFile, File, Form, Request, HTTPException
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from openai import OpenAI
@@ -29,90 +30,93 @@ import tempfile
 
 # SpeechPro 서비스 임포트
 from backend.services.speechpro_service import (
-    call_speechpro_gtp,
-    call_speechpro_model,
-    call_speechpro_score,
-    speechpro_full_workflow,
+    call_speechpro_gtp_async,
+    call_speechpro_model_async,
+    call_speechpro_score_async,
+    speechpro_full_workflow_async,
+    close_speechpro_session,
     get_speechpro_url,
     set_speechpro_url,
     normalize_spaces,
+    speechpro_health_probe,
 )
 
+# SpeechPro 서킷 브레이커 임포트
+from backend.services.speechpro_breaker_service import speechpro_breaker, SpeechProUnavailableError
+
+# SpeechPro 사전 계산 문장 저장소 임포트
+from backend.services.precomputed_sentence_store import (
+    PrecomputedSentenceStore,
+    SPEECHPRO_PRESET_CSV,
+    SPEECHPRO_GENERATED_CSV,
+)
+
+# SpeechPro 발음 모델(GTP/FST) 캐시 임포트
+from backend.services.speechpro_model_cache_service import SpeechProModelCache
+
 # 학습 진도 서비스 임포트
 from backend.services.learning_progress_service import LearningProgressService
 
 # FluencyPro 서비스 임포트
 from backend.services.fluencypro_service import (
     call_fluencypro_analyze,
-    parse_fluency_output
+    parse_fluency_output,
+    wav_to_pcm
 )
 
-# DALL-E 서비스 임포트
-from backend.services.dalle_service import (
-    generate_image_dall_e,
-    enhance_prompt_for_korean_learning
+# LLM 클라이언트 임포트 (Ollama / Gemini 공용 비동기 클라이언트)
+from backend.services.llm_service import (
+    llm_generate,
+    llm_generate_shared,
+    coalescing_stats,
+    llm_idle_seconds,
+    close_llm_session,
+    ollama_stream,
+    NDJSONAccumulator,
+    LLMTimeoutError,
+    LLMError,
 )
 
-# Try to provide a server-side romanization fallback for Korean -> Latin
-# We will try to import a lightweight romanizer if available. If not,
-# `romanize_korean` will be a no-op (returns original text) and we will
-# instruct the operator to install `korean_romanizer` for better results.
-try:
-    from korean_romanizer.romanizer import Romanizer
-    def romanize_korean(text: str) -> str:
-        try:
-            r = Romanizer(text)
-            return r.romanize()
-        except Exception:
-            return text
-    ROMANIZER_AVAILABLE = True
-except Exception:
-    # Basic built-in romanizer (Revised Romanization approximations)
-    # This provides a best-effort Latin transcription of Hangul syllables
-    # without requiring external packages. It is not perfect but works
-    # for common phrases and will ensure the UI receives Latin text.
-    L_TABLE = [
-        "g", "kk", "n", "d", "tt", "r", "m", "b", "pp",
-        "s", "ss", "", "j", "jj", "ch", "k", "t", "p", "h"
-    ]
-    V_TABLE = [
-        "a", "ae", "ya", "yae", "eo", "e", "yeo", "ye", "o",
-        "wa", "wae", "oe", "yo", "u", "wo", "we", "wi", "yu",
-        "eu", "ui", "i"
-    ]
-    T_TABLE = [
-        "", "k", "k", "ks", "n", "nj", "nh", "t", "l", "lg",
-        "lm", "lb", "ls", "lt", "lp", "lh", "m", "p", "ps",
-        "t", "t", "ng", "t", "ch", "k", "t", "p", "h"
-    ]
+# LLM 응답 캐시 임포트
+from backend.services.content_cache_service import LLMResponseCache, make_cache_key
 
-    def _romanize_syllable(ch: str) -> str:
-        code = ord(ch)
-        # Hangul syllables range
-        if code < 0xAC00 or code > 0xD7A3:
-            return ch
+# 스트리밍 JSON 추출기 임포트
+from backend.services.json_stream_parser import StreamingJSONExtractor
 
-        SIndex = code - 0xAC00
-        TCount = 28
-        VCount = 21
-        NCount = VCount * TCount
-        LIndex = SIndex // NCount
-        VIndex = (SIndex % NCount) // TCount
-        TIndex = SIndex % TCount
+# LLM 응답 스키마 레지스트리 임포트
+from backend.services.llm_schemas import get_response_schema
 
-        initial = L_TABLE[LIndex]
-        medial = V_TABLE[VIndex]
-        final = T_TABLE[TIndex]
+# 사전 생성 풀 임포트
+from backend.services.pregen_pool_service import PregenPool
 
-        return initial + medial + final
+# LLM 우선순위 admission 임포트
+from backend.services.llm_admission_service import admission, LLMOverloadedError
 
-    def romanize_korean(text: str) -> str:
-        try:
-            return "".join(_romanize_syllable(ch) if 0xAC00 <= ord(ch) <= 0xD7A3 else ch for ch in text)
-        except Exception:
-            return text
+# Ollama 모델 예열 임포트
+from backend.services.ollama_warmup_service import OllamaWarmer
 
-    ROMANIZER_AVAILABLE = False
+# 지연 기반 헤지 라우터 임포트
+from backend.services.llm_router_service import llm_router
+
+# 백그라운드 피드백 작업 임포트
+from backend.services.feedback_job_service import FeedbackJobStore
+
+# 챗봇 대화 세션 임포트
+from backend.services.chat_session_service import ChatSessionStore
+
+# LLM 성능 지표 임포트
+from backend.services.llm_metrics_service import llm_metrics, llm_endpoint
+
+# DALL-E 서비스 임포트
+from backend.services.dalle_service import (
+    generate_image_dall_e,
+    enhance_prompt_for_korean_learning
+)
+
+# Server-side Korean -> Latin romanization for dialogue pronunciations.
+# Uses `korean_romanizer` when installed, otherwise a precomputed syllable table
+# (see backend/services/romanizer_service.py). Results are LRU-cached.
+from backend.services.romanizer_service import romanize_korean, romanize_many, ROMANIZER_AVAILABLE
 
 # ==========================================
 # 설정: 환경변수에서 OpenAI API 키 로드
@@ -134,6 +138,16 @@ GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
 # 'prefer' = keep model-provided Latin pronunciation if it looks valid (contains ASCII letters).
 ROMANIZE_MODE = os.getenv("ROMANIZE_MODE", "force").lower()
 
+# Prompt version tags: bump when a prompt template changes so cached
+# responses generated from the old prompt are no longer served.
+GENERATE_CONTENT_PROMPT_VERSION = "gc-v1"
+SITUATIONAL_PROMPT_VERSION = "sc-v1"
+
+# Batch writing correction (/api/fluency-check/batch)
+FLUENCY_BATCH_PACK_SIZE = int(os.getenv("FLUENCY_BATCH_PACK_SIZE", "5"))      # sentences per LLM call
+FLUENCY_BATCH_CONCURRENCY = int(os.getenv("FLUENCY_BATCH_CONCURRENCY", "2"))  # packs in flight (match OLLAMA_NUM_PARALLEL)
+FLUENCY_BATCH_MAX_SENTENCES = int(os.getenv("FLUENCY_BATCH_MAX_SENTENCES", "100"))
+
 # MzTTS Configuration
 MZTTS_API_URL = os.getenv("MZTTS_API_URL", "http://112.220.79.218:56014")
 
@@ -649,6 +663,9 @@ class LoggingMiddleware(BaseHTTPMiddleware):
                     else:
                         user_info = f"User#{user_id} ({email})"
         
+        # LLM 성능 지표를 엔드포인트별로 모으기 위해 현재 경로 기록
+        llm_endpoint.set(path)
+
         logger.info(f"[REQUEST] {method} {path} from {client_host} | User: {user_info}")
         if query_params:
             logger.info(f"[QUERY] {query_params}")
@@ -725,6 +742,42 @@ def startup_event():
         logger.info("사용자 데이터베이스 초기화 완료")
     except Exception as e:
         logger.error(f"User DB init failed: {e}")
+    try:
+        presets = get_precomputed_store()
+        logger.info(f"SpeechPro 사전 계산 문장 로드 완료 ({len(presets)}개)")
+    except Exception as e:
+        logger.error(f"Precomputed store load failed: {e}")
+
+
+ollama_warmer = OllamaWarmer()
+
+# 발음 평가 AI 피드백 백그라운드 작업
+feedback_jobs = FeedbackJobStore()
+
+
+@app.on_event("startup")
+async def start_background_tasks():
+    # Ollama 모델 예열 + 서비스 시간대 keep-warm (Ollama가 꺼져 있어도 시작을 막지 않음)
+    if MODEL_BACKEND == "ollama":
+        ollama_warmer.start(lambda: OLLAMA_MODEL)
+    # 상황별 컨텐츠 사전 생성 (LLM 유휴 시간에만 동작)
+    if situational_pool.enabled and (MODEL_BACKEND == "ollama" or (MODEL_BACKEND == "gemini" and GEMINI_API_KEY)):
+        situational_pool.start(_situational_pool_keys, _pregenerate_situational, llm_idle_seconds)
+        logger.info(f"상황별 컨텐츠 사전 생성 시작 (키당 {situational_pool.variants}개)")
+    # SpeechPro 서킷이 열렸을 때 복구 여부를 확인하는 헬스 프로브
+    speechpro_breaker.start(speechpro_health_probe)
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    # 백그라운드 작업 중지
+    await feedback_jobs.shutdown()
+    await ollama_warmer.stop()
+    await situational_pool.stop()
+    await speechpro_breaker.stop()
+    # LLM / SpeechPro 커넥션 풀 정리
+    await close_llm_session()
+    await close_speechpro_session()
 
 # ==========================================
 # 학습 데이터 로드 헬퍼 함수
@@ -740,58 +793,29 @@ def load_json_data(filename):
 
 
 @lru_cache(maxsize=1)
-def load_speechpro_precomputed_sentences():
-    """Load precomputed SpeechPro sentences (with syllables/FST) from CSV"""
-    path = "data/sp_ko_questions.csv"
-    sentences = []
+def get_precomputed_store() -> PrecomputedSentenceStore:
+    """Precomputed SpeechPro sentences (compiled to data/sp_ko_questions.bin, index in memory, FST via mmap)"""
+    return PrecomputedSentenceStore(SPEECHPRO_PRESET_CSV, extra_csv_paths=[SPEECHPRO_GENERATED_CSV])
 
-    if not os.path.exists(path):
-        return sentences
 
-    try:
-        with open(path, "r", encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                sentence_kr = normalize_spaces(row.get("sentence", ""))
-                try:
-                    base_id = int(row.get("ko_id", 0))
-                except Exception:
-                    base_id = 0
-
-                try:
-                    order = int(row.get("order", base_id))
-                except Exception:
-                    order = base_id
-
-                sentences.append({
-                    "id": 1000 + base_id if base_id else order,
-                    "order": order,
-                    "sentenceKr": sentence_kr,
-                    "sentenceEn": "",
-                    "level": "초급",
-                    "difficulty": "SpeechPro",
-                    "category": "프리셋",
-                    "tags": ["speechpro", "preset"],
-                    "tips": "SpeechPro 서버의 프리셋 문장입니다.",
-                    "syll_ltrs": row.get("syll_ltrs", ""),
-                    "syll_phns": row.get("syll_phns", ""),
-                    "fst": row.get("fst", ""),
-                    "source": "precomputed"
-                })
-    except Exception as e:
-        print(f"Error loading {path}: {e}")
-
-    # Order by given order, then id
-    sentences.sort(key=lambda s: (s.get("order", 0), s.get("id", 0)))
-    return sentences
+# 사전 계산 목록에 없는 문장의 GTP/FST 캐시 (SQLite, LRU)
+speechpro_model_cache = SpeechProModelCache()
 
 
 def find_precomputed_sentence(text: str):
     """Find precomputed sentence entry by normalized text"""
-    normalized = normalize_spaces(text or "")
-    for item in load_speechpro_precomputed_sentences():
-        if normalize_spaces(item.get("sentenceKr", "")) == normalized:
-            return item
+    return get_precomputed_store().find_by_text(text)
+
+
+def resolve_precomputed_reference(sentence_id=None, fst_hash=None):
+    """Find a precomputed sentence by id or FST content hash (browser sends a reference instead of the blobs)"""
+    store = get_precomputed_store()
+    if fst_hash:
+        preset = store.get_by_hash(fst_hash.strip())
+        if preset:
+            return preset
+    if sentence_id is not None:
+        return store.get(sentence_id)
     return None
 
 
@@ -881,33 +905,14 @@ FluencyPro 분석:
 - 마크다운 형식 금지"""
 
         if MODEL_BACKEND == "ollama":
-            payload = {
-                "model": OLLAMA_MODEL,
-                "prompt": prompt,
-                "stream": False
-            }
-            
-            resp = requests.post(f"{OLLAMA_URL}/api/generate", json=payload, timeout=15)
-            if resp.status_code != 200:
-                return None
-            
-            result = resp.json()
-            feedback = result.get("response", "").strip()
-            
-        elif MODEL_BACKEND == "gemini":
-            if not GEMINI_API_KEY:
-                return None
-            
-            import google.generativeai as genai
-            genai.configure(api_key=GEMINI_API_KEY)
-            model = genai.GenerativeModel(GEMINI_MODEL)
-            
-            response = model.generate_content(prompt)
-            feedback = response.text.strip()
-        
+            result = await llm_generate_shared(prompt, backend="ollama", model=OLLAMA_MODEL, timeout=15, priority="feedback")
         else:
+            result = await llm_generate_shared(prompt, backend="gemini", model=GEMINI_MODEL, timeout=15)
+
+        if not result.ok:
             return None
-        
+        feedback = result.text.strip()
+
         # Remove any markdown/json artifacts
         feedback = re.sub(r'```.*?```', '', feedback, flags=re.DOTALL)
         feedback = re.sub(r'\{.*?\}', '', feedback, flags=re.DOTALL)
@@ -1307,13 +1312,12 @@ async def change_password(request: Request, payload: dict):
     
     return {"success": True, "message": "비밀번호가 변경되었습니다."}
 
-@app.post("/api/generate-content")
-async def generate_content(
-    topic: str = Form(...), 
-    level: str = Form(...), 
-    model: str = Form(None),
-    backend: str = Form(None)
-):
+# 콘텐츠 생성 응답 캐시 (SQLite, TTL + LRU)
+content_cache = LLMResponseCache()
+
+
+def _build_generate_content_prompt(topic: str, level: str) -> str:
+    """Build the dialogue/vocabulary prompt for /api/generate-content."""
     # Add level-specific guidance to the prompt so the model tailors output
     lvl = (level or "").strip()
     if lvl == "초급":
@@ -1337,7 +1341,7 @@ async def generate_content(
     else:
         level_guidance = "요구된 레벨에 맞게 적절한 난이도로 작성해 주세요."
 
-    prompt = f"""
+    return f"""
     한국어 선생님입니다.
     주제: '{topic}'
     레벨: '{level}'
@@ -1359,9 +1363,115 @@ async def generate_content(
     
     중요: 응답은 반드시 마지막에 하나의 JSON 객체만 포함된 코드 블럭(```json ... ``` )으로 정확하게 반환하세요. 추가 설명이나 여분의 텍스트는 포함하지 마시고, 코드 블럭 외의 다른 출력은 하지 마세요.
     """
+
+
+def _generate_content_cache_key(topic: str, level: str, model: str, backend: str):
+    """Return the response-cache key for a generate-content request (None if uncacheable)."""
+    if backend not in ("gemini", "ollama"):
+        return None
+    resolved_model = model or (GEMINI_MODEL if backend == "gemini" else OLLAMA_MODEL)
+    return make_cache_key(
+        "generate-content",
+        {"topic": topic, "level": level, "romanize_mode": ROMANIZE_MODE},
+        model=resolved_model,
+        backend=backend,
+        version=GENERATE_CONTENT_PROMPT_VERSION,
+    )
+
+
+def _parse_dialogue_output(out: str):
+    """_parse_model_output plus a fallback search for a JSON substring with a "dialogue" key."""
+    parsed = _parse_model_output(out)
+    if parsed is None:
+        try:
+            m = re.search(r"(\{[\s\S]*\"dialogue\"[\s\S]*\})", out)
+            if m:
+                parsed = json.loads(m.group(1))
+        except Exception:
+            parsed = None
+    return parsed
+
+
+def _postprocess_generated_content(parsed):
+    """Ensure each dialogue entry has a romanized pronunciation (in place)."""
+    # Post-process: ensure each dialogue entry has an English
+    # (romanized) pronunciation and normalize whitespace.
+    # If the model returned Hangul or omitted pronunciation,
+    # produce a romanized fallback from the `text` field.
+    try:
+        dlg = parsed.get("dialogue")
+        if isinstance(dlg, list):
+            items = [item for item in dlg if isinstance(item, dict)]
+            # Romanize every line in one batch (repeated lines are computed once)
+            romanized = romanize_many([str(item.get("text", "") or "") for item in items])
+            for item, item_romanized in zip(items, romanized):
+                item_text = item.get("text", "") or ""
+                # Prefer the model-provided pronunciation if it
+                # appears to be Latin. If it's missing or contains
+                # Hangul, derive from `text`.
+                pron = item.get("pronunciation")
+                try:
+                    # ROMANIZE_MODE controls behavior:
+                    # - 'force': always overwrite with the romanizer output
+                    # - 'prefer': keep model-provided Latin pronunciation when valid
+                    mode = ROMANIZE_MODE
+                    if mode == "force":
+                        pron = item_romanized
+                    else:
+                        # prefer mode: keep model-provided pronunciation
+                        # if it looks like Latin (has ASCII letters and
+                        # does not include Hangul), otherwise romanize.
+                        if pron and isinstance(pron, str):
+                            if re.search(r"[\uac00-\ud7a3]", pron) or not re.search(r"[A-Za-z]", pron):
+                                pron = item_romanized
+                            # else: keep model-provided Latin pronunciation
+                        else:
+                            pron = item_romanized
+                except Exception:
+                    pron = pron or item_romanized
+
+                # Normalize whitespace & newlines: collapse runs
+                # of whitespace into a single space and trim.
+                try:
+                    if isinstance(pron, str):
+                        # replace newlines/tabs with spaces then collapse
+                        pron = re.sub(r"\s+", " ", pron.replace("\n", " ").replace("\t", " ")).strip()
+                    else:
+                        pron = str(pron)
+                except Exception:
+                    pron = pron if pron is not None else ""
+
+                item["pronunciation"] = pron
+    except Exception:
+        # keep parsed as-is on any failure
+        pass
+    return parsed
+
+
+@app.post("/api/generate-content")
+async def generate_content(
+    topic: str = Form(...), 
+    level: str = Form(...), 
+    model: str = Form(None),
+    backend: str = Form(None),
+    cache: str = Form(None)
+):
+    prompt = _build_generate_content_prompt(topic, level)
+    schema = get_response_schema("generate-content")
     
     # Determine which backend to use
     selected_backend = backend or MODEL_BACKEND
+
+    # Response cache (stores the post-processed JSON, so hits also skip romanization)
+    cache_key = None
+    cache_status = "BYPASS"
+    if (cache or "").strip().lower() != "bypass":
+        cache_key = _generate_content_cache_key(topic, level, model, selected_backend)
+    if cache_key:
+        cached = await content_cache.aget(cache_key)
+        if cached is not None:
+            return JSONResponse(content=cached, headers={"X-Cache": "HIT"})
+        cache_status = "MISS"
     
     # Use Gemini backend if configured
     if selected_backend == "gemini":
@@ -1370,70 +1480,22 @@ async def generate_content(
                 return JSONResponse(status_code=400, content={"error": "GEMINI_API_KEY not configured"})
             
             # Use REST API for Python 3.8 compatibility
-            gemini_model = model or GEMINI_MODEL
-            url = f"https://generativelanguage.googleapis.com/v1/models/{gemini_model}:generateContent?key={GEMINI_API_KEY}"
-            payload = {
-                "contents": [{
-                    "parts": [{
-                        "text": prompt
-                    }]
-                }]
-            }
-            
-            resp = requests.post(url, json=payload, timeout=60)
-            resp.raise_for_status()
-            result = resp.json()
-            
-            if "candidates" in result and len(result["candidates"]) > 0:
-                out = result["candidates"][0]["content"]["parts"][0]["text"]
-            else:
-                return JSONResponse(status_code=500, content={"error": "No response from Gemini", "details": result})
+            result = await llm_generate_shared(
+                prompt, backend="gemini", model=model or GEMINI_MODEL, timeout=60,
+                transport="rest", schema=schema,
+            )
+            if not result.ok:
+                return JSONResponse(status_code=500, content={"error": "No response from Gemini", "details": result.error})
+            out = result.text
             
-            parsed = _parse_model_output(out)
-            if parsed is None:
-                try:
-                    m = re.search(r"(\{[\s\S]*\"dialogue\"[\s\S]*\})", out)
-                    if m:
-                        parsed = json.loads(m.group(1))
-                except Exception:
-                    parsed = None
+            parsed = result.parsed if result.parsed is not None else _parse_dialogue_output(out)
             
             if parsed is not None:
-                # Post-process pronunciation
-                try:
-                    dlg = parsed.get("dialogue")
-                    if isinstance(dlg, list):
-                        for item in dlg:
-                            if not isinstance(item, dict):
-                                continue
-                            item_text = item.get("text", "") or ""
-                            pron = item.get("pronunciation")
-                            try:
-                                mode = ROMANIZE_MODE
-                                if mode == "force":
-                                    pron = romanize_korean(item_text)
-                                else:
-                                    if pron and isinstance(pron, str):
-                                        if re.search(r"[\uac00-\ud7a3]", pron) or not re.search(r"[A-Za-z]", pron):
-                                            pron = romanize_korean(item_text)
-                                    else:
-                                        pron = romanize_korean(item_text)
-                            except Exception:
-                                pron = pron or romanize_korean(item_text)
-
-                            try:
-                                if isinstance(pron, str):
-                                    pron = re.sub(r"\s+", " ", pron.replace("\n", " ").replace("\t", " ")).strip()
-                                else:
-                                    pron = str(pron)
-                            except Exception:
-                                pron = pron if pron is not None else ""
-
-                            item["pronunciation"] = pron
-                except Exception:
-                    pass
-                return JSONResponse(content=parsed)
-            return JSONResponse(content={"text": out})
+                _postprocess_generated_content(parsed)
+                if cache_key:
+                    await content_cache.aput(cache_key, parsed, endpoint="generate-content")
+                return JSONResponse(content=parsed, headers={"X-Cache": cache_status})
+            return JSONResponse(content={"text": out}, headers={"X-Cache": cache_status})
         except Exception as e:
             return JSONResponse(status_code=500, content={"error": "generate-content (gemini) failed", "details": str(e)})
     
@@ -1441,130 +1503,52 @@ async def generate_content(
     elif selected_backend == "ollama":
         try:
             use_model = model or OLLAMA_MODEL
-            payload = {"model": use_model, "prompt": prompt}
-            resp = requests.post(f"{OLLAMA_URL}/api/generate", json=payload, stream=True, timeout=30)
-            if resp.status_code != 200:
-                return JSONResponse(status_code=500, content={"error": "ollama generate failed", "status": resp.status_code, "body": resp.text})
-
-            out = ""
-            for line in resp.iter_lines(decode_unicode=True):
-                if not line:
-                    continue
-                try:
-                    obj = json.loads(line)
-                    if isinstance(obj, dict):
-                        out += obj.get("response", "") or obj.get("text", "")
-                    else:
-                        out += str(obj)
-                except Exception:
-                    out += line
-
-            parsed = _parse_model_output(out)
-            # If parser failed to extract JSON, try a fallback extraction of a
-            # JSON substring containing a "dialogue" key. If that still fails,
-            # re-prompt the model once with a very strict instruction asking for
-            # exactly one JSON code block only. This helps when the model
-            # prepends commentary or streams non-JSON content before the JSON.
-            if parsed is None:
-                try:
-                    m = re.search(r"(\{[\s\S]*\"dialogue\"[\s\S]*\})", out)
-                    if m:
-                        candidate = m.group(1)
-                        parsed = json.loads(candidate)
-                except Exception:
-                    parsed = None
+            # Stop generation as soon as a complete {"dialogue": ...} object
+            # has streamed in; trailing commentary is never generated.
+            # When the local box is slow to produce a first token the router
+            # hedges to Gemini (LLM_HEDGE=1), unless a backend was pinned.
+            legs = [("ollama", dict(model=use_model, timeout=30, json_keys=("dialogue",), schema=schema, priority="content"))]
+            if backend is None:
+                legs.append(("gemini", dict(model=GEMINI_MODEL, timeout=60, transport="rest", schema=schema)))
+            result = await llm_router.generate("generate-content", prompt, legs, available=_backend_available)
+            if not result.ok:
+                return JSONResponse(status_code=500, content={"error": "ollama generate failed", "status": result.status, "body": result.error})
+            out = result.text
+
+            # If the streaming extractor found nothing, try the full-text
+            # parser and a fallback extraction of a JSON substring containing
+            # a "dialogue" key. If that still fails, re-prompt the model once
+            # with a very strict instruction asking for exactly one JSON code
+            # block only.
+            parsed = result.parsed if result.parsed is not None else _parse_dialogue_output(out)
 
             # If still not parsed, perform one retry with a short, strict
             # re-instruction to the model to only return the single JSON
-            # object in a code block. Avoid infinite retries.
-            if parsed is None:
+            # object in a code block. Avoid infinite retries. Schema-constrained
+            # output is already grammar-restricted, so it gets no retry.
+            if parsed is None and schema is None:
                 try:
                     retry_prompt = (
                         prompt
                         + "\n\nSECOND REQUEST (STRICT): RETURN ONLY ONE JSON OBJECT INSIDE A SINGLE ```json CODE BLOCK. DO NOT ADD ANY TEXT OUTSIDE THE CODE BLOCK."
                     )
-                    payload2 = {"model": use_model, "prompt": retry_prompt}
-                    resp2 = requests.post(f"{OLLAMA_URL}/api/generate", json=payload2, stream=True, timeout=30)
-                    if resp2.status_code == 200:
-                        out2 = ""
-                        for line in resp2.iter_lines(decode_unicode=True):
-                            if not line:
-                                continue
-                            try:
-                                obj = json.loads(line)
-                                if isinstance(obj, dict):
-                                    out2 += obj.get("response", "") or obj.get("text", "")
-                                else:
-                                    out2 += str(obj)
-                            except Exception:
-                                out2 += line
-
-                        parsed = _parse_model_output(out2)
-                        if parsed is None:
-                            try:
-                                m2 = re.search(r"(\{[\s\S]*\"dialogue\"[\s\S]*\})", out2)
-                                if m2:
-                                    parsed = json.loads(m2.group(1))
-                            except Exception:
-                                parsed = None
+                    result2 = await llm_generate_shared(retry_prompt, backend="ollama", model=use_model, timeout=30, json_keys=("dialogue",))
+                    if result2.ok:
+                        parsed = result2.parsed if result2.parsed is not None else _parse_dialogue_output(result2.text)
                 except Exception:
                     # swallow retry errors and continue; we'll return raw text if
                     # parsing still fails.
                     parsed = None
 
             if parsed is not None:
-                # Post-process: ensure each dialogue entry has an English
-                # (romanized) pronunciation and normalize whitespace.
-                # If the model returned Hangul or omitted pronunciation,
-                # produce a romanized fallback from the `text` field.
-                try:
-                    dlg = parsed.get("dialogue")
-                    if isinstance(dlg, list):
-                        for item in dlg:
-                            if not isinstance(item, dict):
-                                continue
-                            item_text = item.get("text", "") or ""
-                            # Prefer the model-provided pronunciation if it
-                            # appears to be Latin. If it's missing or contains
-                            # Hangul, derive from `text`.
-                            pron = item.get("pronunciation")
-                            try:
-                                # ROMANIZE_MODE controls behavior:
-                                # - 'force': always overwrite with the romanizer output
-                                # - 'prefer': keep model-provided Latin pronunciation when valid
-                                mode = ROMANIZE_MODE
-                                if mode == "force":
-                                    pron = romanize_korean(item_text)
-                                else:
-                                    # prefer mode: keep model-provided pronunciation
-                                    # if it looks like Latin (has ASCII letters and
-                                    # does not include Hangul), otherwise romanize.
-                                    if pron and isinstance(pron, str):
-                                        if re.search(r"[\uac00-\ud7a3]", pron) or not re.search(r"[A-Za-z]", pron):
-                                            pron = romanize_korean(item_text)
-                                        # else: keep model-provided Latin pronunciation
-                                    else:
-                                        pron = romanize_korean(item_text)
-                            except Exception:
-                                pron = pron or romanize_korean(item_text)
-
-                            # Normalize whitespace & newlines: collapse runs
-                            # of whitespace into a single space and trim.
-                            try:
-                                if isinstance(pron, str):
-                                    # replace newlines/tabs with spaces then collapse
-                                    pron = re.sub(r"\s+", " ", pron.replace("\n", " ").replace("\t", " ")).strip()
-                                else:
-                                    pron = str(pron)
-                            except Exception:
-                                pron = pron if pron is not None else ""
-
-                            item["pronunciation"] = pron
-                except Exception:
-                    # keep parsed as-is on any failure
-                    pass
-                return JSONResponse(content=parsed)
-            return JSONResponse(content={"text": out})
+                _postprocess_generated_content(parsed)
+                # Only cache answers from the backend the key was built for
+                if cache_key and result.backend == "ollama":
+                    await content_cache.aput(cache_key, parsed, endpoint="generate-content")
+                return JSONResponse(content=parsed, headers={"X-Cache": cache_status})
+            return JSONResponse(content={"text": out}, headers={"X-Cache": cache_status})
+        except LLMOverloadedError as e:
+            return _overloaded_response(e)
         except Exception as e:
             return JSONResponse(status_code=500, content={"error": "generate-content (ollama) failed", "details": str(e)})
 
@@ -1572,6 +1556,184 @@ async def generate_content(
     return JSONResponse(status_code=501, content={"error": "OpenAI integration is disabled in this deployment"})
 
 
+def _backend_available(backend: str) -> bool:
+    """Whether a backend can take requests in this deployment (used by the hedge router)."""
+    if backend == "gemini":
+        return bool(GEMINI_API_KEY)
+    return backend == "ollama"
+
+
+def _overloaded_response(e: LLMOverloadedError) -> JSONResponse:
+    """429 response for requests shed by the LLM admission queue."""
+    return JSONResponse(
+        status_code=429,
+        content={"error": "AI 서버 요청이 많습니다. 잠시 후 다시 시도해주세요.", "retry_after": e.retry_after},
+        headers={"Retry-After": str(e.retry_after)},
+    )
+
+
+def _speechpro_unavailable_response(e: SpeechProUnavailableError) -> JSONResponse:
+    """503 response while the SpeechPro circuit breaker is open (fail fast instead of waiting out timeouts)."""
+    return JSONResponse(
+        status_code=503,
+        content={"error": str(e), "success": False, "degraded": True, "retry_after": e.retry_after},
+        headers={"Retry-After": str(e.retry_after)},
+    )
+
+
+def _sse_event(event: str, data) -> str:
+    """Format one Server-Sent Events message with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+# Headers that keep proxies (nginx/ngrok) from buffering the event stream
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+class _SlotStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse that owns an admission slot taken before the response started.
+
+    The slot is released when the response finishes, fails or is cancelled - also when
+    the client is gone before the body iterator ever runs (its finally would never fire).
+    """
+
+    def __init__(self, content, priority: str, **kwargs):
+        super().__init__(content, **kwargs)
+        self._priority = priority
+        self._acquired_at = time.monotonic()
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            if self._priority is not None:
+                admission.release(self._priority, time.monotonic() - self._acquired_at)
+                self._priority = None
+
+
+@app.post("/api/generate-content/stream")
+async def generate_content_stream(
+    topic: str = Form(...),
+    level: str = Form(...),
+    model: str = Form(None),
+    backend: str = Form(None),
+    cache: str = Form(None)
+):
+    """
+    SSE variant of /api/generate-content.
+
+    Events:
+        token  - {"text": "..."} raw model output as it is generated
+        result - the same JSON body /api/generate-content would return
+                 (sent as soon as the JSON object completes; the upstream
+                 generation is stopped at that point)
+        error  - {"error": "...", "details": "..."}
+    """
+    prompt = _build_generate_content_prompt(topic, level)
+    schema = get_response_schema("generate-content")
+    selected_backend = backend or MODEL_BACKEND
+
+    cache_key = None
+    cache_status = "BYPASS"
+    if (cache or "").strip().lower() != "bypass":
+        cache_key = _generate_content_cache_key(topic, level, model, selected_backend)
+    cached = await content_cache.aget(cache_key) if cache_key else None
+    if cache_key:
+        cache_status = "HIT" if cached is not None else "MISS"
+
+    # Take the Ollama slot before the response starts so overload is a plain 429
+    holds_slot = False
+    if cached is None and selected_backend == "ollama":
+        try:
+            await admission.acquire("content")
+        except LLMOverloadedError as e:
+            return _overloaded_response(e)
+        holds_slot = True
+
+    async def event_source():
+        if cached is not None:
+            yield _sse_event("result", cached)
+            return
+        parsed = None
+        try:
+            if selected_backend == "ollama":
+                acc = NDJSONAccumulator()
+                extractor = StreamingJSONExtractor(required_keys=("dialogue",))
+                extra = {"format": schema} if schema is not None else {}
+                stream = ollama_stream(prompt, model or OLLAMA_MODEL, timeout=30, acc=acc, **extra)
+                started = time.monotonic()
+                ok = False
+                try:
+                    async for piece in stream:
+                        yield _sse_event("token", {"text": piece})
+                        if extractor.feed(piece) is not None:
+                            parsed = extractor.result
+                            break
+                    ok = True
+                finally:
+                    await stream.aclose()
+                    # 실패/클라이언트 연결 끊김도 ok=False로 기록
+                    llm_metrics.record("ollama", model or OLLAMA_MODEL, acc.metrics_meta(), time.monotonic() - started,
+                                       ok=ok, parse_ok=(parsed is not None) if ok else None)
+                out = acc.text
+            elif selected_backend == "gemini":
+                # Gemini REST path is not streamed; forward the whole answer as one token
+                result = await llm_generate(
+                    prompt, backend="gemini", model=model or GEMINI_MODEL, timeout=60,
+                    transport="rest", schema=schema,
+                )
+                if not result.ok:
+                    yield _sse_event("error", {"error": "No response from Gemini", "details": result.error})
+                    return
+                out = result.text
+                parsed = result.parsed
+                yield _sse_event("token", {"text": out})
+            else:
+                yield _sse_event("error", {"error": f"Unknown backend: {selected_backend}"})
+                return
+
+            if parsed is None:
+                parsed = _parse_dialogue_output(out)
+            if parsed is None:
+                yield _sse_event("result", {"text": out})
+                return
+            _postprocess_generated_content(parsed)
+            if cache_key:
+                await content_cache.aput(cache_key, parsed, endpoint="generate-content")
+            yield _sse_event("result", parsed)
+        except Exception as e:
+            yield _sse_event("error", {"error": "generate-content stream failed", "details": str(e)})
+
+    headers = {**SSE_HEADERS, "X-Cache": cache_status}
+    if holds_slot:
+        return _SlotStreamingResponse(event_source(), "content", media_type="text/event-stream", headers=headers)
+    return StreamingResponse(event_source(), media_type="text/event-stream", headers=headers)
+
+
+@app.get("/api/llm/stats")
+def llm_stats():
+    """LLM 호출 계층 통계 (동일 요청 합치기 절약 수, admission 대기열, 모델 예열 상태 등)"""
+    return {
+        "coalescing": coalescing_stats(),
+        "admission": admission.stats(),
+        "warmup": ollama_warmer.stats(),
+        "routing": llm_router.stats(),
+        "chat_sessions": chat_sessions.stats(),
+    }
+
+
+@app.get("/api/llm/metrics")
+def llm_metrics_summary():
+    """
+    LLM 호출 성능 지표 (최근 LLM_METRICS_WINDOW건, 모델별/엔드포인트별)
+
+    각 항목: 소요 시간(total/load/prompt_eval/eval, 초)과 토큰 수의 p50/p95,
+    초당 생성 토큰 수(tokens_per_s), 프롬프트 처리 속도, JSON 파싱 성공률, 실패 수
+    """
+    return llm_metrics.stats()
+
+
 @app.get("/api/ollama/models")
 def get_ollama_models():
     """Proxy endpoint to list Ollama models available on the local server."""
@@ -1590,23 +1752,10 @@ async def ollama_test(prompt: str = Form(...), model: str = Form(None)):
 
     use_model = model or OLLAMA_MODEL
     try:
-        payload = {"model": use_model, "prompt": prompt}
-        resp = requests.post(f"{OLLAMA_URL}/api/generate", json=payload, stream=True, timeout=30)
-        if resp.status_code != 200:
-            return JSONResponse(status_code=500, content={"error": "ollama generate failed", "status": resp.status_code, "body": resp.text})
-
-        out = ""
-        for line in resp.iter_lines(decode_unicode=True):
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-                if isinstance(obj, dict):
-                    out += obj.get("response", "") or obj.get("text", "")
-                else:
-                    out += str(obj)
-            except Exception:
-                out += line
+        result = await llm_generate(prompt, backend="ollama", model=use_model, timeout=30, priority="test")
+        if not result.ok:
+            return JSONResponse(status_code=500, content={"error": "ollama generate failed", "status": result.status, "body": result.error})
+        out = result.text
 
         parsed = _parse_model_output(out)
         if parsed is None:
@@ -1620,6 +1769,8 @@ async def ollama_test(prompt: str = Form(...), model: str = Form(None)):
         if parsed is not None:
             return JSONResponse(content={"model": use_model, "parsed": parsed})
         return JSONResponse(content={"model": use_model, "text": out})
+    except LLMOverloadedError as e:
+        return _overloaded_response(e)
     except Exception as e:
         return JSONResponse(status_code=500, content={"error": "ollama test failed", "details": str(e)})
 
@@ -1635,24 +1786,11 @@ async def chat_test(prompt: str = Form(...), model: str = Form(None), backend: s
                 return JSONResponse(status_code=400, content={"error": "GEMINI_API_KEY not configured"})
             
             gemini_model = model or GEMINI_MODEL
-            url = f"https://generativelanguage.googleapis.com/v1/models/{gemini_model}:generateContent?key={GEMINI_API_KEY}"
-            payload = {
-                "contents": [{
-                    "parts": [{
-                        "text": prompt
-                    }]
-                }]
-            }
-            
-            resp = requests.post(url, json=payload, timeout=60)
-            resp.raise_for_status()
-            result = resp.json()
-            
-            if "candidates" in result and len(result["candidates"]) > 0:
-                out = result["candidates"][0]["content"]["parts"][0]["text"]
-                return JSONResponse(content={"model": gemini_model, "text": out})
+            result = await llm_generate(prompt, backend="gemini", model=gemini_model, timeout=60, transport="rest")
+            if result.ok:
+                return JSONResponse(content={"model": gemini_model, "text": result.text})
             else:
-                return JSONResponse(status_code=500, content={"error": "No response from Gemini", "details": result})
+                return JSONResponse(status_code=500, content={"error": "No response from Gemini", "details": result.error})
                 
         except Exception as e:
             return JSONResponse(status_code=500, content={"error": "gemini test failed", "details": str(e)})
@@ -1661,25 +1799,13 @@ async def chat_test(prompt: str = Form(...), model: str = Form(None), backend: s
     elif selected_backend == "ollama":
         use_model = model or OLLAMA_MODEL
         try:
-            payload = {"model": use_model, "prompt": prompt}
-            resp = requests.post(f"{OLLAMA_URL}/api/generate", json=payload, stream=True, timeout=30)
-            if resp.status_code != 200:
-                return JSONResponse(status_code=500, content={"error": "ollama generate failed", "status": resp.status_code, "body": resp.text})
-
-            out = ""
-            for line in resp.iter_lines(decode_unicode=True):
-                if not line:
-                    continue
-                try:
-                    obj = json.loads(line)
-                    if isinstance(obj, dict):
-                        out += obj.get("response", "") or obj.get("text", "")
-                    else:
-                        out += str(obj)
-                except Exception:
-                    out += line
+            result = await llm_generate(prompt, backend="ollama", model=use_model, timeout=30, priority="test")
+            if not result.ok:
+                return JSONResponse(status_code=500, content={"error": "ollama generate failed", "status": result.status, "body": result.error})
 
-            return JSONResponse(content={"model": use_model, "text": out})
+            return JSONResponse(content={"model": use_model, "text": result.text})
+        except LLMOverloadedError as e:
+            return _overloaded_response(e)
         except Exception as e:
             return JSONResponse(status_code=500, content={"error": "ollama test failed", "details": str(e)})
     
@@ -1689,41 +1815,50 @@ async def chat_test(prompt: str = Form(...), model: str = Form(None), backend: s
 # ==========================================
 # 3. 유창성 테스트 (작문 교정) API
 # ==========================================
-@app.post("/api/fluency-check")
-async def fluency_check(user_text: str = Form(...)):
-    prompt = f"""
+def _build_fluency_check_prompt(user_text: str) -> str:
+    return f"""
     사용자가 쓴 한국어 문장입니다: "{user_text}"
     
     이 문장의 자연스러움을 100점 만점으로 평가하고, 
     교정된 문장과 피드백을 한국어로 짧게 주세요.
     JSON 형식: {{"score": 85, "corrected": "...", "feedback": "..."}}
     """
+
+
+def _build_fluency_batch_prompt(sentences) -> str:
+    numbered = "\n".join(f'    {i}. "{s}"' for i, s in enumerate(sentences, 1))
+    return f"""
+    사용자가 쓴 한국어 문장들입니다:
+{numbered}
+    
+    각 문장의 자연스러움을 100점 만점으로 평가하고, 
+    교정된 문장과 피드백을 한국어로 짧게 주세요. 모든 문장을 번호(index)와 함께 빠짐없이 답하세요.
+    JSON 형식: {{"results": [{{"index": 1, "score": 85, "corrected": "...", "feedback": "..."}}, ...]}}
+    """
+
+
+@app.post("/api/fluency-check")
+async def fluency_check(user_text: str = Form(...)):
+    prompt = _build_fluency_check_prompt(user_text)
+    schema = get_response_schema("fluency-check")
     
     # Use Ollama backend if configured
     if MODEL_BACKEND == "ollama":
         try:
-            payload = {"model": OLLAMA_MODEL, "prompt": prompt}
-            resp = requests.post(f"{OLLAMA_URL}/api/generate", json=payload, stream=True, timeout=30)
-            if resp.status_code != 200:
-                return JSONResponse(status_code=500, content={"error": "ollama generate failed", "status": resp.status_code, "body": resp.text})
-
-            out = ""
-            for line in resp.iter_lines(decode_unicode=True):
-                if not line:
-                    continue
-                try:
-                    obj = json.loads(line)
-                    if isinstance(obj, dict):
-                        out += obj.get("response", "") or obj.get("text", "")
-                    else:
-                        out += str(obj)
-                except Exception:
-                    out += line
+            result = await llm_generate_shared(
+                prompt, backend="ollama", model=OLLAMA_MODEL, timeout=30,
+                json_keys=("score", "corrected", "feedback"), schema=schema, priority="content",
+            )
+            if not result.ok:
+                return JSONResponse(status_code=500, content={"error": "ollama generate failed", "status": result.status, "body": result.error})
+            out = result.text
 
-            parsed = _parse_model_output(out)
+            parsed = result.parsed if result.parsed is not None else _parse_model_output(out)
             if parsed is not None:
                 return JSONResponse(content=parsed)
             return JSONResponse(content={"text": out})
+        except LLMOverloadedError as e:
+            return _overloaded_response(e)
         except Exception as e:
             return JSONResponse(status_code=500, content={"error": "fluency-check (ollama) failed", "details": str(e)})
     
@@ -1733,14 +1868,12 @@ async def fluency_check(user_text: str = Form(...)):
             if not GEMINI_API_KEY:
                 return JSONResponse(status_code=400, content={"error": "GEMINI_API_KEY not configured"})
             
-            import google.generativeai as genai
-            genai.configure(api_key=GEMINI_API_KEY)
-            model = genai.GenerativeModel(GEMINI_MODEL)
+            result = await llm_generate_shared(prompt, backend="gemini", model=GEMINI_MODEL, timeout=60, schema=schema)
+            if not result.ok:
+                return JSONResponse(status_code=500, content={"error": "fluency-check (gemini) failed", "details": result.error})
+            out = result.text
             
-            response = model.generate_content(prompt)
-            out = response.text
-            
-            parsed = _parse_model_output(out)
+            parsed = result.parsed if result.parsed is not None else _parse_model_output(out)
             if parsed is not None:
                 return JSONResponse(content=parsed)
             return JSONResponse(content={"text": out})
@@ -1750,27 +1883,160 @@ async def fluency_check(user_text: str = Form(...)):
     # Fallback / default: OpenAI (disabled)
     return JSONResponse(status_code=501, content={"error": "OpenAI integration is disabled in this deployment"})
 
+async def _run_fluency_llm(prompt: str, schema_name: str, json_keys):
+    """fluency-check 계열 프롬프트를 현재 백엔드로 실행하고 파싱된 JSON(실패 시 None) 반환"""
+    schema = get_response_schema(schema_name)
+    if MODEL_BACKEND == "ollama":
+        result = await llm_generate_shared(
+            prompt, backend="ollama", model=OLLAMA_MODEL, timeout=60,
+            json_keys=json_keys, schema=schema, priority="content",
+        )
+    elif MODEL_BACKEND == "gemini":
+        if not GEMINI_API_KEY:
+            raise RuntimeError("GEMINI_API_KEY not configured")
+        result = await llm_generate_shared(prompt, backend="gemini", model=GEMINI_MODEL, timeout=60, schema=schema)
+    else:
+        raise RuntimeError("OpenAI integration is disabled in this deployment")
+    if not result.ok:
+        raise RuntimeError(result.error or f"LLM error {result.status}")
+    return result.parsed if result.parsed is not None else _parse_model_output(result.text)
+
+
+def _fluency_item(index: int, sentence: str, graded) -> dict:
+    item = {"index": index, "sentence": sentence}
+    if not isinstance(graded, dict) or "corrected" not in graded:
+        item["error"] = "unparseable model output"
+        return item
+    item.update(score=graded.get("score"), corrected=graded.get("corrected"), feedback=graded.get("feedback"))
+    return item
+
+
+async def _grade_fluency_pack(start: int, sentences):
+    """
+    문장 묶음을 한 번의 LLM 호출로 교정하고 [{"index", "sentence", "score", "corrected", "feedback"}] 반환.
+    묶음 응답에서 빠진 문장은 한 문장씩 다시 요청한다 (묶음 호출 자체가 실패하면 전부 한 문장씩).
+    """
+    graded = {}
+    if len(sentences) > 1:
+        try:
+            parsed = await _run_fluency_llm(_build_fluency_batch_prompt(sentences), "fluency-check-batch", ("results",))
+        except LLMOverloadedError:
+            # 과부하면 한 문장씩 다시 보내도 거절되므로 그대로 전달
+            raise
+        except Exception as e:
+            print(f"[FluencyBatch] pack of {len(sentences)} failed, grading one by one: {e}")
+            parsed = None
+        results = parsed.get("results") if isinstance(parsed, dict) else None
+        if isinstance(results, list):
+            for pos, entry in enumerate(results, 1):
+                if not isinstance(entry, dict):
+                    continue
+                idx = entry.get("index")
+                # index가 없거나 범위를 벗어나면 순서로 대응 (문장 수와 결과 수가 같을 때만)
+                if not isinstance(idx, int) or not 1 <= idx <= len(sentences):
+                    idx = pos if len(results) == len(sentences) else None
+                if idx is not None and idx not in graded:
+                    graded[idx] = entry
+
+    items = []
+    for i, sentence in enumerate(sentences, 1):
+        entry = graded.get(i)
+        if entry is None:
+            try:
+                entry = await _run_fluency_llm(
+                    _build_fluency_check_prompt(sentence), "fluency-check", ("score", "corrected", "feedback"),
+                )
+            except Exception as e:
+                items.append({"index": start + i - 1, "sentence": sentence, "error": str(e)})
+                continue
+        items.append(_fluency_item(start + i - 1, sentence, entry))
+    return items
+
+
+@app.post("/api/fluency-check/batch")
+async def fluency_check_batch(request: Request):
+    """
+    여러 문장 작문 교정 (NDJSON 스트리밍)
+
+    Body (JSON): {"sentences": ["...", ...]} 또는 {"text": "줄바꿈으로 구분된 문장들"}
+
+    문장을 FLUENCY_BATCH_PACK_SIZE개씩 묶어 한 프롬프트로 교정하고, 묶음은
+    FLUENCY_BATCH_CONCURRENCY개까지 동시에 실행합니다. 묶음이 끝나는 대로 한 줄씩 반환:
+        {"index": 0, "sentence": "...", "score": 85, "corrected": "...", "feedback": "..."}
+        {"index": 3, "sentence": "...", "error": "..."}
+        {"done": true, "count": N, "elapsed": 1.23}
+    """
+    try:
+        data = await request.json()
+    except Exception:
+        return JSONResponse(status_code=400, content={"error": "JSON body required"})
+    sentences = data.get("sentences")
+    if sentences is None and isinstance(data.get("text"), str):
+        sentences = data["text"].splitlines()
+    if not isinstance(sentences, list):
+        return JSONResponse(status_code=400, content={"error": "sentences (list) or text is required"})
+    sentences = [str(s).strip() for s in sentences if str(s).strip()]
+    if not sentences:
+        return JSONResponse(status_code=400, content={"error": "no sentences"})
+    if len(sentences) > FLUENCY_BATCH_MAX_SENTENCES:
+        return JSONResponse(
+            status_code=400,
+            content={"error": f"too many sentences (max {FLUENCY_BATCH_MAX_SENTENCES})"},
+        )
+    if MODEL_BACKEND not in ("ollama", "gemini"):
+        return JSONResponse(status_code=501, content={"error": "OpenAI integration is disabled in this deployment"})
+
+    pack_size = max(1, FLUENCY_BATCH_PACK_SIZE)
+    packs = [(i, sentences[i:i + pack_size]) for i in range(0, len(sentences), pack_size)]
+    # 동시 실행은 Ollama 병렬 슬롯 수만큼; 실제 LLM 슬롯 배분은 admission(content 클래스)이 맡는다
+    semaphore = asyncio.Semaphore(max(1, FLUENCY_BATCH_CONCURRENCY))
+
+    async def run_pack(start, pack):
+        async with semaphore:
+            try:
+                return await _grade_fluency_pack(start, pack)
+            except LLMOverloadedError as e:
+                error = f"LLM overloaded, retry after {e.retry_after}s"
+            except Exception as e:
+                error = str(e)
+            return [{"index": start + i, "sentence": s, "error": error} for i, s in enumerate(pack)]
+
+    async def ndjson_source():
+        started = asyncio.get_running_loop().time()
+        tasks = [asyncio.ensure_future(run_pack(start, pack)) for start, pack in packs]
+        try:
+            for future in asyncio.as_completed(tasks):
+                for item in await future:
+                    yield json.dumps(item, ensure_ascii=False) + "\n"
+            elapsed = round(asyncio.get_running_loop().time() - started, 3)
+            yield json.dumps({"done": True, "count": len(sentences), "elapsed": elapsed}) + "\n"
+        finally:
+            # 클라이언트가 연결을 끊으면 남은 묶음 취소
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    return StreamingResponse(ndjson_source(), media_type="application/x-ndjson", headers=SSE_HEADERS)
+
 # ==========================================
 # 3-2. 상황별 컨텐츠 생성 API
 # ==========================================
-@app.post("/api/situational-content")
-async def situational_content(situation: str = Form(...), level: str = Form(...), model: str = Form(...)):
-    """
-    상황(예: 카페, 식당, 병원)과 난이도를 입력받아 
-    상황에 맞는 표현, 대화, 어휘를 생성합니다.
-    """
-    situation_prompts = {
-        "카페": "카페에서 커피를 주문하는 상황",
-        "식당": "식당에서 음식을 예약하고 주문하는 상황",
-        "병원": "병원 진료를 받는 상황",
-        "은행": "은행에서 업무를 보는 상황",
-        "여행": "여행을 계획하고 호텔을 예약하는 상황",
-        "면접": "면접을 보는 상황",
-    }
-    
-    situation_desc = situation_prompts.get(situation, situation)
-    
-    prompt = f"""
+SITUATION_PROMPTS = {
+    "카페": "카페에서 커피를 주문하는 상황",
+    "식당": "식당에서 음식을 예약하고 주문하는 상황",
+    "병원": "병원 진료를 받는 상황",
+    "은행": "은행에서 업무를 보는 상황",
+    "여행": "여행을 계획하고 호텔을 예약하는 상황",
+    "면접": "면접을 보는 상황",
+}
+SITUATION_LEVELS = ("초급", "중급", "고급")
+
+# 고정 상황 x 난이도 조합은 유휴 시간에 미리 생성해 두고 라운드 로빈으로 제공
+situational_pool = PregenPool("situational-content")
+
+
+def _build_situational_prompt(situation_desc: str, level: str) -> str:
+    return f"""
     한국어 학습자를 위한 상황별 학습 컨텐츠를 생성해주세요.
     
     상황: {situation_desc}
@@ -1791,49 +2057,108 @@ async def situational_content(situation: str = Form(...), level: str = Form(...)
         "vocabulary": ["단어1", "단어2", ...]
     }}
     """
+
+
+def _situational_model(model: str = None) -> str:
+    """상황별 컨텐츠에 실제로 쓰이는 모델명 (캐시/사전 생성 풀 키)"""
+    return GEMINI_MODEL if MODEL_BACKEND == "gemini" else (model or OLLAMA_MODEL)
+
+
+async def _run_situational_llm(prompt: str, model: str = None, background: bool = False):
+    """현재 백엔드로 상황별 컨텐츠 생성. (LLMResult, 파싱 결과 또는 None) 반환"""
+    schema = get_response_schema("situational-content")
+    if MODEL_BACKEND == "ollama":
+        result = await llm_generate_shared(
+            prompt, backend="ollama", model=model or OLLAMA_MODEL, timeout=60,
+            json_keys=("situation_description", "key_expressions", "example_dialogue", "vocabulary"),
+            schema=schema, background=background,
+            priority="background" if background else "content",
+        )
+    else:
+        result = await llm_generate_shared(
+            prompt, backend="gemini", model=GEMINI_MODEL, timeout=60,
+            schema=schema, background=background,
+        )
+    parsed = None
+    if result.ok:
+        parsed = result.parsed if result.parsed is not None else _parse_model_output(result.text)
+    return result, parsed
+
+
+def _situational_pool_keys():
+    """사전 생성 대상: 고정 상황 x 난이도 x 현재 기본 모델"""
+    model_name = _situational_model()
+    return [(s, lvl, model_name) for s in SITUATION_PROMPTS for lvl in SITUATION_LEVELS]
+
+
+async def _pregenerate_situational(key):
+    situation, level, model_name = key
+    prompt = _build_situational_prompt(SITUATION_PROMPTS[situation], level)
+    _, parsed = await _run_situational_llm(prompt, model_name, background=True)
+    return parsed
+
+
+@app.get("/api/situational-content/pool")
+def situational_pool_stats():
+    """사전 생성 풀 상태 (키별 변형 수, 제공/미스 횟수)"""
+    return situational_pool.stats()
+
+
+@app.post("/api/situational-content")
+async def situational_content(
+    situation: str = Form(...),
+    level: str = Form(...),
+    model: str = Form(...),
+    cache: str = Form(None)
+):
+    """
+    상황(예: 카페, 식당, 병원)과 난이도를 입력받아 
+    상황에 맞는 표현, 대화, 어휘를 생성합니다.
+    """
+    situation_desc = SITUATION_PROMPTS.get(situation, situation)
+    prompt = _build_situational_prompt(situation_desc, level)
+
+    cache_key = None
+    cache_status = "BYPASS"
+    if (cache or "").strip().lower() != "bypass" and MODEL_BACKEND in ("gemini", "ollama"):
+        # 사전 생성 풀 (고정 상황만 해당, 자유 입력은 실시간 생성)
+        if situation in SITUATION_PROMPTS:
+            pooled = situational_pool.get((situation, level, _situational_model(model)))
+            if pooled is not None:
+                return JSONResponse(content=pooled, headers={"X-Cache": "PREGEN"})
+
+        cache_key = make_cache_key(
+            "situational-content",
+            {"situation": situation_desc, "level": level},
+            model=_situational_model(model),
+            backend=MODEL_BACKEND,
+            version=SITUATIONAL_PROMPT_VERSION,
+        )
+        cached = await content_cache.aget(cache_key)
+        if cached is not None:
+            return JSONResponse(content=cached, headers={"X-Cache": "HIT"})
+        cache_status = "MISS"
     
     try:
-        if MODEL_BACKEND == "ollama":
-            payload = {"model": model or OLLAMA_MODEL, "prompt": prompt}
-            resp = requests.post(f"{OLLAMA_URL}/api/generate", json=payload, stream=True, timeout=60)
-            if resp.status_code != 200:
-                return JSONResponse(status_code=500, content={"error": "ollama generate failed"})
-            
-            out = ""
-            for line in resp.iter_lines(decode_unicode=True):
-                if not line:
-                    continue
-                try:
-                    obj = json.loads(line)
-                    if isinstance(obj, dict):
-                        out += obj.get("response", "") or obj.get("text", "")
-                except Exception:
-                    out += line
-            
-            parsed = _parse_model_output(out)
-            if parsed is not None:
-                return JSONResponse(content=parsed)
-            return JSONResponse(content={"error": "Failed to parse response"})
-        
-        elif MODEL_BACKEND == "gemini":
-            if not GEMINI_API_KEY:
-                return JSONResponse(status_code=400, content={"error": "GEMINI_API_KEY not configured"})
-            
-            import google.generativeai as genai
-            genai.configure(api_key=GEMINI_API_KEY)
-            gemini_model = genai.GenerativeModel(GEMINI_MODEL)
-            
-            response = gemini_model.generate_content(prompt)
-            out = response.text
-            
-            parsed = _parse_model_output(out)
-            if parsed is not None:
-                return JSONResponse(content=parsed)
-            return JSONResponse(content={"error": "Failed to parse response"})
-        
-        else:
+        if MODEL_BACKEND not in ("ollama", "gemini"):
             return JSONResponse(status_code=501, content={"error": "Backend not configured"})
+        if MODEL_BACKEND == "gemini" and not GEMINI_API_KEY:
+            return JSONResponse(status_code=400, content={"error": "GEMINI_API_KEY not configured"})
+
+        result, parsed = await _run_situational_llm(prompt, model)
+        if not result.ok:
+            if MODEL_BACKEND == "ollama":
+                return JSONResponse(status_code=500, content={"error": "ollama generate failed"})
+            return JSONResponse(status_code=500, content={"error": "gemini generate failed", "details": result.error})
+
+        if parsed is not None:
+            if cache_key:
+                await content_cache.aput(cache_key, parsed, endpoint="situational-content")
+            return JSONResponse(content=parsed, headers={"X-Cache": cache_status})
+        return JSONResponse(content={"error": "Failed to parse response"})
     
+    except LLMOverloadedError as e:
+        return _overloaded_response(e)
     except Exception as e:
         return JSONResponse(status_code=500, content={"error": "situational-content failed", "details": str(e)})
 
@@ -2112,21 +2437,26 @@ async def get_pronunciation_word(word_id: str):
 # ==========================================
 
 @app.get("/api/speechpro/sentences")
-async def get_speechpro_sentences():
-    """Get all SpeechPro evaluation sentences"""
+async def get_speechpro_sentences(blobs: bool = True):
+    """
+    Get all SpeechPro evaluation sentences
+
+    Query:
+        - blobs: false면 syll_ltrs/syll_phns/fst를 빼고 fst_hash만 반환
+          (평가 시 sentence_id 또는 fst_hash를 보내면 서버가 FST를 찾아 사용)
+    """
     try:
-        precomputed = load_speechpro_precomputed_sentences()
+        precomputed = get_precomputed_store().all(include_fst=blobs)
         return JSONResponse(content=precomputed)
     except Exception as e:
         return JSONResponse(status_code=500, content={"error": "Failed to load speechpro sentences", "details": str(e)})
 
 
 @app.get("/api/speechpro/sentences/{sentence_id}")
-async def get_speechpro_sentence(sentence_id: int):
+async def get_speechpro_sentence(sentence_id: int, blobs: bool = True):
     """Get a specific SpeechPro evaluation sentence by ID"""
     try:
-        sentences = load_speechpro_precomputed_sentences()
-        sentence = next((s for s in sentences if s.get("id") == sentence_id), None)
+        sentence = get_precomputed_store().get(sentence_id, include_fst=blobs)
         if sentence:
             return JSONResponse(content=sentence)
         return JSONResponse(status_code=404, content={"error": "Sentence not found"})
@@ -2135,11 +2465,10 @@ async def get_speechpro_sentence(sentence_id: int):
 
 
 @app.get("/api/speechpro/sentences/level/{level}")
-async def get_speechpro_sentences_by_level(level: str):
+async def get_speechpro_sentences_by_level(level: str, blobs: bool = True):
     """Get SpeechPro evaluation sentences by level (A1, A2, B1, etc.)"""
     try:
-        sentences = load_speechpro_precomputed_sentences()
-        filtered = [s for s in sentences if s.get("level") == level.upper()]
+        filtered = get_precomputed_store().by_level(level.upper(), include_fst=blobs)
         return JSONResponse(content=filtered)
     except Exception as e:
         return JSONResponse(status_code=500, content={"error": "Failed to load speechpro sentences", "details": str(e)})
@@ -2245,7 +2574,7 @@ async def speechpro_gtp(data: dict = None):
                 content={"error": "text is required"}
             )
         
-        result = call_speechpro_gtp(text)
+        result = await call_speechpro_gtp_async(text)
         return JSONResponse(content=result.to_dict())
     
     except ValueError as e:
@@ -2253,6 +2582,8 @@ async def speechpro_gtp(data: dict = None):
             status_code=400,
             content={"error": str(e)}
         )
+    except SpeechProUnavailableError as e:
+        return _speechpro_unavailable_response(e)
     except RuntimeError as e:
         return JSONResponse(
             status_code=503,
@@ -2292,7 +2623,7 @@ async def speechpro_model(data: dict = None):
                 content={"error": "text, syll_ltrs, syll_phns are required"}
             )
         
-        result = call_speechpro_model(text, syll_ltrs, syll_phns)
+        result = await call_speechpro_model_async(text, syll_ltrs, syll_phns)
         return JSONResponse(content=result.to_dict())
     
     except ValueError as e:
@@ -2300,6 +2631,8 @@ async def speechpro_model(data: dict = None):
             status_code=400,
             content={"error": str(e)}
         )
+    except SpeechProUnavailableError as e:
+        return _speechpro_unavailable_response(e)
     except RuntimeError as e:
         return JSONResponse(
             status_code=503,
@@ -2315,10 +2648,12 @@ async def speechpro_model(data: dict = None):
 @app.post("/api/speechpro/score")
 async def speechpro_score(
     text: str = Form(...),
-    syll_ltrs: str = Form(...),
-    syll_phns: str = Form(...),
-    fst: str = Form(...),
-    audio: UploadFile = File(...)
+    syll_ltrs: str = Form(None),
+    syll_phns: str = Form(None),
+    fst: str = Form(None),
+    audio: UploadFile = File(...),
+    sentence_id: int = Form(None),
+    fst_hash: str = Form(None)
 ):
     """
     Score JSON API - 발음 평가
@@ -2330,10 +2665,14 @@ async def speechpro_score(
         - syll_phns: 음절 음소
         - fst: FST 모델 데이터
         - audio: WAV 오디오 파일
+        - sentence_id / fst_hash: 사전 계산 문장 참조 (syll_ltrs/syll_phns/fst 대신 사용)
     
     Response: {"score": 85.5, "details": {...}}
     """
     try:
+        # SpeechPro 서킷이 열려 있으면 오디오 변환 전에 바로 503
+        speechpro_breaker.reject_if_open()
+
         # 오디오 파일 읽기
         audio_content_raw = await audio.read()
         
@@ -2343,14 +2682,33 @@ async def speechpro_score(
                 content={"error": "audio file is required"}
             )
 
+        loop = asyncio.get_running_loop()
         try:
-            audio_content = _convert_audio_bytes_to_wav16(audio_content_raw)
+            audio_content = await loop.run_in_executor(None, _convert_audio_bytes_to_wav16, audio_content_raw)
         except Exception as conv_err:
             return JSONResponse(
                 status_code=400,
                 content={"error": f"audio convert failed: {conv_err}"}
             )
-        
+        # 변환 후 원본 업로드는 더 이상 필요 없음 (요청당 메모리 절감)
+        del audio_content_raw
+        
+        # 사전 계산 문장 참조로 받은 경우 서버에서 음절 정보/FST를 채운다
+        if not all([syll_ltrs, syll_phns, fst]) and (sentence_id is not None or fst_hash):
+            preset = resolve_precomputed_reference(sentence_id, fst_hash)
+            if preset is None:
+                return JSONResponse(
+                    status_code=404,
+                    content={"error": "precomputed sentence not found"}
+                )
+            # 참조한 문장이 평가 텍스트와 다르면 다른 문장으로 채점하게 되므로 거절
+            if preset.get("sentenceKr") != normalize_spaces(text):
+                return JSONResponse(
+                    status_code=400,
+                    content={"error": "precomputed sentence does not match text"}
+                )
+            syll_ltrs, syll_phns, fst = preset["syll_ltrs"], preset["syll_phns"], preset["fst"]
+
         # 필수 파라미터 검증
         text = text.strip()
         if not all([text, syll_ltrs, syll_phns, fst]):
@@ -2359,7 +2717,7 @@ async def speechpro_score(
                 content={"error": "text, syll_ltrs, syll_phns, fst are required"}
             )
         
-        result = call_speechpro_score(text, syll_ltrs, syll_phns, fst, audio_content)
+        result = await call_speechpro_score_async(text, syll_ltrs, syll_phns, fst, audio_content)
         return JSONResponse(content=result.to_dict())
     
     except ValueError as e:
@@ -2367,6 +2725,8 @@ async def speechpro_score(
             status_code=400,
             content={"error": str(e)}
         )
+    except SpeechProUnavailableError as e:
+        return _speechpro_unavailable_response(e)
     except RuntimeError as e:
         return JSONResponse(
             status_code=503,
@@ -2379,13 +2739,95 @@ async def speechpro_score(
         )
 
 
+async def _speechpro_score_audio(text: str, audio_content: bytes, preset=None):
+    """
+    변환된 16k WAV로 SpeechPro 점수 계산
+
+    preset(사전 계산 GTP/FST)이 없으면 사전 계산 목록 -> GTP/FST 캐시 순으로 찾아 Score만 호출하고,
+    어디에도 없으면 전체 워크플로우(GTP -> Model -> Score)를 수행한 뒤 결과를 캐시에 저장한다.
+
+    Returns:
+        (응답 dict, ScoreResult 또는 None(전체 워크플로우 경로))
+    """
+    if not preset:
+        print(f"[Evaluate] Searching for precomputed sentence match")
+        preset = find_precomputed_sentence(text)
+        if preset:
+            print(f"[Evaluate] Found preset: {preset.get('sentence', '')}")
+        else:
+            # 이전에 계산해 둔 GTP/FST가 있으면 Score 호출만 수행
+            cached_model = await speechpro_model_cache.aget(text, get_speechpro_url())
+            if cached_model:
+                print(f"[Evaluate] Using cached GTP/FST model")
+                preset = dict(cached_model, sentenceKr=text, id="cache", source="model-cache")
+
+    if preset and preset.get("fst"):
+        print(f"[Evaluate] Using preset for scoring")
+        request_id = f"preset_{preset.get('id', 'score')}"
+
+        gtp_dict = {
+            "id": f"gtp_{request_id}",
+            "text": text,
+            "syll_ltrs": preset.get("syll_ltrs", ""),
+            "syll_phns": preset.get("syll_phns", ""),
+            "error_code": 0,
+        }
+        model_dict = {
+            "id": f"model_{request_id}",
+            "text": text,
+            "syll_ltrs": preset.get("syll_ltrs", ""),
+            "syll_phns": preset.get("syll_phns", ""),
+            "fst": preset.get("fst", ""),
+            "error_code": 0,
+        }
+
+        print(f"[Evaluate] Calling score API...")
+        score_result = await call_speechpro_score_async(
+            text=text,
+            syll_ltrs=preset.get("syll_ltrs", ""),
+            syll_phns=preset.get("syll_phns", ""),
+            fst=preset.get("fst", ""),
+            audio_data=audio_content,
+            request_id=request_id,
+        )
+
+        print(f"[Evaluate] Score result: score={score_result.score}, error_code={score_result.error_code}")
+
+        if score_result.error_code != 0:
+            print(f"[Evaluate] Score error detected: {score_result.error_code}")
+            raise RuntimeError(f"Score 오류: error_code={score_result.error_code}")
+
+        print(f"[Evaluate] Success - returning response")
+        return {
+            "gtp": gtp_dict,
+            "model": model_dict,
+            "score": score_result.to_dict(),
+            "overall_score": score_result.score,
+            "success": True,
+            "source": preset.get("source", "precomputed")
+        }, score_result
+
+    # 프리셋이 없으면 기존 전체 워크플로우 수행
+    print(f"[Evaluate] No preset found, using full workflow")
+    result = await speechpro_full_workflow_async(text, audio_content)
+    if result.get("success"):
+        model_data = result.get("model") or {}
+        await speechpro_model_cache.aput(
+            text, get_speechpro_url(),
+            model_data.get("syll_ltrs", ""), model_data.get("syll_phns", ""), model_data.get("fst", ""),
+        )
+    return result, None
+
+
 @app.post("/api/speechpro/evaluate")
 async def speechpro_evaluate(
     text: str = Form(...),
     audio: UploadFile = File(...),
     syll_ltrs: str = Form(None),
     syll_phns: str = Form(None),
-    fst: str = Form(None)
+    fst: str = Form(None),
+    sentence_id: int = Form(None),
+    fst_hash: str = Form(None)
 ):
     """
     통합 발음 평가 API
@@ -2394,6 +2836,8 @@ async def speechpro_evaluate(
     Form Data:
         - text: 평가 대상 텍스트
         - audio: WAV 오디오 파일
+        - syll_ltrs/syll_phns/fst: 사전 계산 정보 (선택)
+        - sentence_id / fst_hash: 사전 계산 문장 참조 (선택, FST를 보내지 않고 서버에서 찾음)
     
     Response: {
         "gtp": {...},
@@ -2403,6 +2847,9 @@ async def speechpro_evaluate(
     }
     """
     try:
+        # SpeechPro 서킷이 열려 있으면 오디오 변환 전에 바로 503
+        speechpro_breaker.reject_if_open()
+
         # 오디오 파일 읽기
         audio_content_raw = await audio.read()
         
@@ -2420,13 +2867,16 @@ async def speechpro_evaluate(
                 content={"error": "audio file is required"}
             )
 
+        loop = asyncio.get_running_loop()
         try:
-            audio_content = _convert_audio_bytes_to_wav16(audio_content_raw)
+            audio_content = await loop.run_in_executor(None, _convert_audio_bytes_to_wav16, audio_content_raw)
         except Exception as conv_err:
             return JSONResponse(
                 status_code=400,
                 content={"error": f"audio convert failed: {conv_err}"}
             )
+        # 변환 후 원본 업로드는 더 이상 필요 없음 (요청당 메모리 절감)
+        del audio_content_raw
         
         # 1) 요청에 사전 계산 정보가 함께 왔다면 그대로 사용
         pre_syll_ltrs = syll_ltrs.strip() if syll_ltrs else None
@@ -2447,81 +2897,36 @@ async def speechpro_evaluate(
                 "fst": pre_fst,
                 "source": "client-precomputed"
             }
-        else:
-            print(f"[Evaluate] Searching for precomputed sentence match")
-            preset = find_precomputed_sentence(text)
+        elif sentence_id is not None or fst_hash:
+            preset = resolve_precomputed_reference(sentence_id, fst_hash)
+            # 참조한 문장이 평가 텍스트와 다르면 무시하고 텍스트로 다시 찾는다
+            if preset and preset.get("sentenceKr") != normalize_spaces(text):
+                print(f"[Evaluate] Referenced sentence does not match text, ignoring reference")
+                preset = None
             if preset:
-                print(f"[Evaluate] Found preset: {preset.get('sentence', '')}")
+                print(f"[Evaluate] Using referenced preset (sentence_id={sentence_id}, fst_hash={fst_hash})")
 
-        if preset and preset.get("fst"):
-            print(f"[Evaluate] Using preset for scoring")
-            request_id = f"preset_{preset.get('id', 'score')}"
+        response_data, score_result = await _speechpro_score_audio(text, audio_content, preset)
 
-            gtp_dict = {
-                "id": f"gtp_{request_id}",
-                "text": text,
-                "syll_ltrs": preset.get("syll_ltrs", ""),
-                "syll_phns": preset.get("syll_phns", ""),
-                "error_code": 0,
-            }
-            model_dict = {
-                "id": f"model_{request_id}",
-                "text": text,
-                "syll_ltrs": preset.get("syll_ltrs", ""),
-                "syll_phns": preset.get("syll_phns", ""),
-                "fst": preset.get("fst", ""),
-                "error_code": 0,
-            }
-
-            print(f"[Evaluate] Calling score API...")
-            score_result = call_speechpro_score(
-                text=text,
-                syll_ltrs=preset.get("syll_ltrs", ""),
-                syll_phns=preset.get("syll_phns", ""),
-                fst=preset.get("fst", ""),
-                audio_data=audio_content,
-                request_id=request_id,
+        # AI 피드백은 백그라운드 작업으로 생성 (점수는 바로 반환)
+        # 결과: GET /api/speechpro/feedback/{job_id} 또는 .../stream (SSE)
+        if score_result is not None and MODEL_BACKEND == "ollama":
+            feedback_job_id = feedback_jobs.submit(
+                lambda: _generate_pronunciation_feedback(text, score_result)
             )
+            print(f"[Evaluate] AI feedback job queued: {feedback_job_id}")
+            response_data["ai_feedback_job"] = feedback_job_id
+            response_data["ai_feedback_status"] = "pending"
 
-            print(f"[Evaluate] Score result: score={score_result.score}, error_code={score_result.error_code}")
-
-            if score_result.error_code != 0:
-                print(f"[Evaluate] Score error detected: {score_result.error_code}")
-                raise RuntimeError(f"Score 오류: error_code={score_result.error_code}")
-
-            # AI 피드백 생성
-            ai_feedback = None
-            if MODEL_BACKEND == "ollama":
-                try:
-                    ai_feedback = await _generate_pronunciation_feedback(text, score_result)
-                    print(f"[Evaluate] AI feedback generated: {ai_feedback[:100] if ai_feedback else 'None'}")
-                except Exception as fb_err:
-                    print(f"[Evaluate] AI feedback failed: {fb_err}")
-
-            print(f"[Evaluate] Success - returning response")
-            response_data = {
-                "gtp": gtp_dict,
-                "model": model_dict,
-                "score": score_result.to_dict(),
-                "overall_score": score_result.score,
-                "success": True,
-                "source": preset.get("source", "precomputed")
-            }
-            if ai_feedback:
-                response_data["ai_feedback"] = ai_feedback
-            
-            return JSONResponse(content=response_data)
-
-        # 2) 프리셋이 없으면 기존 전체 워크플로우 수행
-        print(f"[Evaluate] No preset found, using full workflow")
-        result = speechpro_full_workflow(text, audio_content)
-        return JSONResponse(content=result)
+        return JSONResponse(content=response_data)
     
     except ValueError as e:
         return JSONResponse(
             status_code=400,
             content={"error": str(e), "success": False}
         )
+    except SpeechProUnavailableError as e:
+        return _speechpro_unavailable_response(e)
     except RuntimeError as e:
         return JSONResponse(
             status_code=503,
@@ -2534,6 +2939,49 @@ async def speechpro_evaluate(
         )
 
 
+@app.get("/api/speechpro/feedback/{job_id}")
+async def speechpro_feedback(job_id: str, wait: float = 0):
+    """
+    발음 평가 AI 피드백 작업 조회
+
+    Query:
+        - wait: 완료될 때까지 최대 대기할 시간(초, 최대 30). 0이면 즉시 현재 상태 반환
+
+    Response: {"job_id", "status": "pending"|"done"|"empty"|"failed", "ai_feedback", "error", "elapsed"}
+    """
+    if wait > 0:
+        job = await feedback_jobs.wait(job_id, timeout=min(wait, 30))
+    else:
+        job = feedback_jobs.get(job_id)
+    if job is None:
+        return JSONResponse(status_code=404, content={"error": "feedback job not found"})
+    return JSONResponse(content=job)
+
+
+@app.get("/api/speechpro/feedback/{job_id}/stream")
+async def speechpro_feedback_stream(job_id: str):
+    """
+    발음 평가 AI 피드백 작업 구독 (SSE)
+
+    Events:
+        feedback - 작업이 끝나면 GET /api/speechpro/feedback/{job_id}와 같은 본문
+        error    - {"error": "..."} 작업이 없거나 60초 안에 끝나지 않음
+    """
+    if feedback_jobs.get(job_id) is None:
+        return JSONResponse(status_code=404, content={"error": "feedback job not found"})
+
+    async def event_source():
+        job = await feedback_jobs.wait(job_id, timeout=60)
+        if job is None:
+            yield _sse_event("error", {"error": "feedback job not found"})
+        elif job["status"] == "pending":
+            yield _sse_event("error", {"error": "feedback job timed out", "job_id": job_id})
+        else:
+            yield _sse_event("feedback", job)
+
+    return StreamingResponse(event_source(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+
 @app.get("/chatbot")
 def chatbot_page(request: Request):
     """AI 챗봇 페이지"""
@@ -2552,12 +3000,27 @@ def sentence_evaluation_page(request: Request):
     return templates.TemplateResponse("sentence-evaluation.html", {"request": request})
 
 
+CHATBOT_SYSTEM_PROMPT = """당신은 한국어 교육 AI 튜터입니다. 간결하고 명확하게 답변해주세요."""
+
+# 대화 세션 (이전 턴 기억, Ollama context 재사용)
+chat_sessions = ChatSessionStore()
+
+
 @app.post("/api/chatbot")
 async def chatbot_api(request: Request):
-    """EXAONE 기반 챗봇 API"""
+    """
+    EXAONE 기반 챗봇 API
+
+    Body: {"message": "...", "session_id": "..."(선택)}
+    session_id를 이어서 보내면 이전 대화를 기억한다 (응답의 session_id 사용)
+    """
     try:
-        data = await request.json()
-        user_message = data.get("message", "").strip()
+        try:
+            data = await request.json()
+        except Exception:
+            return JSONResponse(status_code=400, content={"error": "JSON body required"})
+        message = data.get("message") if isinstance(data, dict) else None
+        user_message = message.strip() if isinstance(message, str) else ""
         
         if not user_message:
             return JSONResponse(
@@ -2565,56 +3028,69 @@ async def chatbot_api(request: Request):
                 content={"error": "메시지를 입력해주세요."}
             )
         
-        # Call Ollama API (EXAONE)
-        system_prompt = """당신은 한국어 교육 AI 튜터입니다. 간결하고 명확하게 답변해주세요."""
-        
-        prompt = f"{system_prompt}\n\n질문: {user_message}"
-        
-        payload = {
-            "model": OLLAMA_MODEL,
-            "prompt": prompt,
-            "stream": False,
-            "temperature": 0.7
-        }
-        
-        print(f"[Chatbot] Sending request to Ollama API: {OLLAMA_URL}/api/generate")
-        print(f"[Chatbot] User message: {user_message}")
-        
-        response = requests.post(f"{OLLAMA_URL}/api/generate", json=payload, timeout=60)
-        
-        print(f"[Chatbot] Response status: {response.status_code}")
-        
-        if response.status_code != 200:
-            print(f"[Chatbot] Error response: {response.text[:200]}")
-            return JSONResponse(
-                status_code=500,
-                content={"error": "AI 서버 연결 오류"}
+        session = chat_sessions.get_or_create(data.get("session_id"))
+        async with session.lock:
+            # Ollama는 이전 context를 이어 받아 새 질문만 평가, Gemini는 최근 턴을 포함한 전체 프롬프트
+            prompt, context = chat_sessions.build_prompt(session, CHATBOT_SYSTEM_PROMPT, user_message, OLLAMA_MODEL)
+            ollama_args = dict(model=OLLAMA_MODEL, timeout=60, options={"temperature": 0.7}, priority="chatbot")
+            if context:
+                ollama_args["context"] = context
+            
+            print(f"[Chatbot] Sending request to Ollama API: {OLLAMA_URL}/api/generate")
+            print(f"[Chatbot] User message: {user_message} (session {session.id}, turn {len(session.turns) + 1})")
+            
+            result = await llm_router.generate(
+                "chatbot",
+                prompt,
+                [
+                    ("ollama", ollama_args),
+                    ("gemini", dict(
+                        model=GEMINI_MODEL, timeout=60,
+                        prompt=chat_sessions.full_prompt(session, CHATBOT_SYSTEM_PROMPT, user_message),
+                    )),
+                ],
+                available=_backend_available,
             )
+            
+            print(f"[Chatbot] Response status: {result.status}")
+            
+            if not result.ok:
+                print(f"[Chatbot] Error response: {(result.error or '')[:200]}")
+                return JSONResponse(
+                    status_code=500,
+                    content={"error": "AI 서버 연결 오류"}
+                )
+            
+            # Extract text from Ollama response
+            ai_response = result.text.strip()
+            if ai_response:
+                print(f"[Chatbot] AI response: {ai_response[:100]}... (prompt_eval_count={result.meta.get('prompt_eval_count')})")
+                chat_sessions.record(
+                    session, user_message, ai_response, OLLAMA_MODEL,
+                    result.meta.get("context") if result.backend == "ollama" else None,
+                )
+                return JSONResponse(content={
+                    "response": ai_response,
+                    "session_id": session.id,
+                    "success": True
+                })
         
-        result = response.json()
-        
-        # Extract text from Ollama response
-        if "response" in result:
-            ai_response = result["response"].strip()
-            print(f"[Chatbot] AI response: {ai_response[:100]}...")
-            return JSONResponse(content={
-                "response": ai_response,
-                "success": True
-            })
-        
-        print(f"[Chatbot] Failed to extract text from response: {result}")
+        print(f"[Chatbot] Failed to extract text from response: {result.meta}")
         return JSONResponse(
             status_code=500,
             content={"error": "AI 응답을 처리할 수 없습니다."}
         )
         
-    except requests.exceptions.Timeout:
+    except LLMOverloadedError as e:
+        print(f"[Chatbot] Queue full, retry after {e.retry_after}s")
+        return _overloaded_response(e)
+    except LLMTimeoutError:
         print("[Chatbot] Timeout error")
         return JSONResponse(
             status_code=504,
             content={"error": "AI 서버 응답 시간이 초과되었습니다."}
         )
-    except requests.exceptions.RequestException as e:
+    except LLMError as e:
         print(f"[Chatbot] Request error: {str(e)}")
         return JSONResponse(
             status_code=500,
@@ -2630,12 +3106,88 @@ async def chatbot_api(request: Request):
         )
 
 
+@app.delete("/api/chatbot/session/{session_id}")
+async def chatbot_reset_session(session_id: str):
+    """챗봇 대화 세션 초기화 (새 대화 시작)"""
+    return JSONResponse(content={"session_id": session_id, "deleted": chat_sessions.reset(session_id)})
+
+
+@app.post("/api/chatbot/stream")
+async def chatbot_stream(request: Request):
+    """
+    EXAONE 기반 챗봇 API (SSE 스트리밍)
+
+    Body: {"message": "...", "session_id": "..."(선택)}
+
+    Events:
+        token - {"text": "..."} 생성되는 즉시 전달되는 응답 조각
+        done  - {"response": "...", "session_id": "...", "success": true} 전체 응답
+        error - {"error": "..."}
+    """
+    try:
+        data = await request.json()
+    except Exception:
+        return JSONResponse(status_code=400, content={"error": "JSON body required"})
+    message = data.get("message") if isinstance(data, dict) else None
+    user_message = message.strip() if isinstance(message, str) else ""
+
+    if not user_message:
+        return JSONResponse(
+            status_code=400,
+            content={"error": "메시지를 입력해주세요."}
+        )
+
+    session = chat_sessions.get_or_create(data.get("session_id"))
+
+    # 응답 시작 전에 슬롯을 받아야 대기열 초과 시 429를 돌려줄 수 있다
+    try:
+        await admission.acquire("chatbot")
+    except LLMOverloadedError as e:
+        return _overloaded_response(e)
+
+    async def event_source():
+        acc = NDJSONAccumulator()
+        try:
+            async with session.lock:
+                prompt, context = chat_sessions.build_prompt(session, CHATBOT_SYSTEM_PROMPT, user_message, OLLAMA_MODEL)
+                extra = {"context": context} if context else {}
+                started = time.monotonic()
+                ok = False
+                try:
+                    async for piece in ollama_stream(
+                        prompt, OLLAMA_MODEL, timeout=60, options={"temperature": 0.7}, acc=acc, **extra
+                    ):
+                        yield _sse_event("token", {"text": piece})
+                    ok = True
+                finally:
+                    # 실패/클라이언트 연결 끊김도 ok=False로 기록
+                    llm_metrics.record("ollama", OLLAMA_MODEL, acc.metrics_meta(), time.monotonic() - started, ok=ok)
+                ai_response = acc.text.strip()
+                if ai_response:
+                    chat_sessions.record(session, user_message, ai_response, OLLAMA_MODEL, acc.final.get("context"))
+            yield _sse_event("done", {"response": ai_response, "session_id": session.id, "success": True})
+        except LLMTimeoutError:
+            yield _sse_event("error", {"error": "AI 서버 응답 시간이 초과되었습니다."})
+        except LLMError as e:
+            print(f"[Chatbot] Stream error: {str(e)}")
+            yield _sse_event("error", {"error": "AI 서버 연결 오류"})
+        except Exception as e:
+            print(f"[Chatbot] Unexpected stream error: {str(e)}")
+            yield _sse_event("error", {"error": f"오류가 발생했습니다: {str(e)}"})
+
+    return _SlotStreamingResponse(event_source(), "chatbot", media_type="text/event-stream", headers=SSE_HEADERS)
+
+
 @app.get("/api/speechpro/config")
 async def speechpro_config():
     """SpeechPro API 설정 조회"""
     return JSONResponse(content={
         "url": get_speechpro_url(),
-        "status": "configured"
+        "status": "degraded" if speechpro_breaker.state != "closed" else "configured",
+        "model_cache": await speechpro_model_cache.astats(),
+        "presets": get_precomputed_store().stats(),
+        # 서킷 브레이커 상태 (state != "closed"이면 degraded 배너 표시)
+        "breaker": speechpro_breaker.stats(),
     })
 
 
@@ -2654,6 +3206,8 @@ async def set_speechpro_config(data: dict = None):
             )
         
         set_speechpro_url(url)
+        # 새 서버이므로 이전 서버의 실패 기록은 버림
+        speechpro_breaker.reset()
         return JSONResponse(content={
             "url": get_speechpro_url(),
             "status": "updated"
@@ -2670,6 +3224,31 @@ async def set_speechpro_config(data: dict = None):
 # FluencyPro API (유창성 평가)
 # ============================================================================
 
+def _build_fluency_response(text: str, fluency_result: dict) -> dict:
+    """FluencyPro 결과 -> /api/fluencypro/analyze 응답 형식"""
+    # output 파싱
+    parsed_output = parse_fluency_output(fluency_result.get("output", ""))
+
+    return {
+        "success": True,
+        "text": text,
+        "total_reading_words": fluency_result.get("total_reading_words", 0),
+        "total_correct_words": fluency_result.get("total_correct_words", 0),
+        "total_duration": fluency_result.get("total_duration", 0.0),
+        "reading_words_per_unit": fluency_result.get("reading_words_per_unit", 0.0),
+        "correct_words_per_unit": fluency_result.get("correct_words_per_unit", 0.0),
+        "accuracy_rate": fluency_result.get("accuracy_rate", 0.0),
+        "recognized_text": parsed_output.get("recognized_text", ""),
+        "pauses": parsed_output.get("pauses", []),
+        "omitted_words": parsed_output.get("omitted_words", []),
+        "error_words": parsed_output.get("error_words", []),
+        "total_pauses": parsed_output.get("total_pauses", 0),
+        "total_omissions": parsed_output.get("total_omissions", 0),
+        "total_errors": parsed_output.get("total_errors", 0),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
 @app.post("/api/fluencypro/analyze")
 async def fluency_analyze(request: Request):
     """음성 유창성 분석 - FluencyPro API (실제 연동)"""
@@ -2700,28 +3279,7 @@ async def fluency_analyze(request: Request):
                 }
             )
 
-        # output 파싱
-        parsed_output = parse_fluency_output(fluency_result.get("output", ""))
-
-        # 응답 구성
-        response_data = {
-            "success": True,
-            "text": text,
-            "total_reading_words": fluency_result.get("total_reading_words", 0),
-            "total_correct_words": fluency_result.get("total_correct_words", 0),
-            "total_duration": fluency_result.get("total_duration", 0.0),
-            "reading_words_per_unit": fluency_result.get("reading_words_per_unit", 0.0),
-            "correct_words_per_unit": fluency_result.get("correct_words_per_unit", 0.0),
-            "accuracy_rate": fluency_result.get("accuracy_rate", 0.0),
-            "recognized_text": parsed_output.get("recognized_text", ""),
-            "pauses": parsed_output.get("pauses", []),
-            "omitted_words": parsed_output.get("omitted_words", []),
-            "error_words": parsed_output.get("error_words", []),
-            "total_pauses": parsed_output.get("total_pauses", 0),
-            "total_omissions": parsed_output.get("total_omissions", 0),
-            "total_errors": parsed_output.get("total_errors", 0),
-            "timestamp": datetime.now().isoformat()
-        }
+        response_data = _build_fluency_response(text, fluency_result)
 
         logger.info(f"FluencyPro analysis completed: accuracy={response_data['accuracy_rate']}%")
         return JSONResponse(content=response_data)
@@ -2737,6 +3295,131 @@ async def fluency_analyze(request: Request):
         )
 
 
+def _combined_fluency_data(fluency: dict, pcm_bytes: int) -> dict:
+    """analyze 응답에 get_combined_feedback이 쓰는 지표(fluency_score, speech_rate 등)를 더한다"""
+    syllables = len(re.findall(r"[가-힣]", fluency.get("text", "")))
+    duration = float(fluency.get("total_duration") or 0.0) or pcm_bytes / 16000.0  # 8kHz 16-bit
+    speaking_time = max(duration - sum(fluency.get("pauses", [])), 0.0)
+    return dict(
+        fluency,
+        fluency_score=fluency.get("accuracy_rate", 0.0),
+        speech_rate=round(syllables / duration, 2) if duration else 0.0,
+        articulation_rate=round(syllables / speaking_time, 2) if speaking_time else 0.0,
+        correct_syllables_rate=fluency.get("accuracy_rate", 0.0),
+        pause_count=fluency.get("total_pauses", 0),
+        audio_length_ms=int(pcm_bytes / 16),
+    )
+
+
+@app.post("/api/fluencypro/combined-evaluate")
+async def combined_evaluate(
+    text: str = Form(...),
+    audio: UploadFile = File(...)
+):
+    """
+    SpeechPro 발음 정확도 + FluencyPro 유창성 동시 평가 (오디오 한 번 업로드, 한 번 디코딩)
+
+    16k WAV로 한 번 변환한 뒤 SpeechPro에는 그대로, FluencyPro에는 8kHz PCM으로 내려서
+    두 서비스를 동시에 호출한다. 응답 시간은 두 서비스 중 느린 쪽과 같다.
+
+    Response:
+        {
+            "success": true,
+            "text": "...",
+            "fluency_data": {... /api/fluencypro/analyze 응답 + fluency_score, speech_rate, ...},
+            "speechpro_data": {"score": 85.5, "success": true, "source": "precomputed", ...},
+            "speechpro": {... /api/speechpro/evaluate 응답 ...},
+            "timing": {"decode_s", "speechpro_s", "fluency_s", "total_s"}
+        }
+        fluency_data/speechpro_data는 그대로 /api/fluencypro/combined-feedback에 보낼 수 있다.
+    """
+    started = time.time()
+    try:
+        text = text.strip()
+        audio_content_raw = await audio.read()
+        if not text or not audio_content_raw:
+            return JSONResponse(status_code=400, content={"error": "text and audio are required", "success": False})
+
+        loop = asyncio.get_running_loop()
+        try:
+            audio_content = await loop.run_in_executor(None, _convert_audio_bytes_to_wav16, audio_content_raw)
+        except Exception as conv_err:
+            return JSONResponse(status_code=400, content={"error": f"audio convert failed: {conv_err}", "success": False})
+        try:
+            pcm_data = await loop.run_in_executor(None, wav_to_pcm, audio_content)
+            del audio_content_raw
+        except Exception as e:
+            # WAV 형식이 예상과 다르면 FluencyPro 쪽에서 원본을 직접 변환
+            logger.warning(f"WAV -> PCM failed, falling back to FluencyPro conversion: {e}")
+            pcm_data = None
+        decoded_at = time.time()
+
+        async def timed(coro):
+            t0 = time.time()
+            try:
+                return await coro, time.time() - t0
+            except Exception as e:
+                return e, time.time() - t0
+
+        (speech_result, speech_s), (fluency_result, fluency_s) = await asyncio.gather(
+            timed(_speechpro_score_audio(text, audio_content)),
+            timed(call_fluencypro_analyze(text, b"" if pcm_data is not None else audio_content_raw, pcm_data=pcm_data)),
+        )
+
+        # SpeechPro
+        if isinstance(speech_result, Exception):
+            speechpro = {"success": False, "error": str(speech_result), "overall_score": 0.0}
+            if isinstance(speech_result, SpeechProUnavailableError):
+                speechpro.update(degraded=True, retry_after=speech_result.retry_after)
+        else:
+            speechpro = speech_result[0]
+        speechpro_data = {
+            "score": speechpro.get("overall_score", 0.0),
+            "success": bool(speechpro.get("success")),
+            "source": speechpro.get("source", "workflow"),
+        }
+        if not speechpro.get("success"):
+            speechpro_data["error"] = speechpro.get("error", "SpeechPro 평가에 실패했습니다.")
+
+        # FluencyPro
+        if isinstance(fluency_result, Exception):
+            fluency_result = {"success": False, "error": f"분석 중 오류 발생: {fluency_result}"}
+        if fluency_result.get("success"):
+            pcm_len = len(pcm_data) if pcm_data is not None else 0
+            fluency_data = _combined_fluency_data(_build_fluency_response(text, fluency_result), pcm_len)
+        else:
+            fluency_data = {"success": False, "error": fluency_result.get("error", "유창성 분석에 실패했습니다.")}
+
+        ok = speechpro_data["success"] or fluency_data["success"]
+        logger.info(
+            f"Combined evaluate: speechpro={speechpro_data['score']} ({speech_s:.2f}s), "
+            f"fluency={fluency_data.get('accuracy_rate')} ({fluency_s:.2f}s)"
+        )
+        return JSONResponse(
+            status_code=200 if ok else 503,
+            content={
+                "success": ok,
+                "text": text,
+                "fluency_data": fluency_data,
+                "speechpro_data": speechpro_data,
+                "speechpro": speechpro,
+                "timing": {
+                    "decode_s": round(decoded_at - started, 3),
+                    "speechpro_s": round(speech_s, 3),
+                    "fluency_s": round(fluency_s, 3),
+                    "total_s": round(time.time() - started, 3),
+                },
+            },
+        )
+
+    except Exception as e:
+        logger.error(f"Combined evaluate error: {e}", exc_info=True)
+        return JSONResponse(
+            status_code=500,
+            content={"success": False, "error": f"서버 오류: {str(e)}"}
+        )
+
+
 @app.post("/api/fluencypro/combined-feedback")
 async def get_combined_feedback(request: Request):
     """FluencyPro와 SpeechPro 결과를 종합하여 AI 피드백 생성"""
@@ -2789,27 +3472,12 @@ async def get_combined_feedback(request: Request):
             if not GEMINI_API_KEY:
                 return JSONResponse(status_code=400, content={"error": "GEMINI_API_KEY not configured"})
             
-            import google.generativeai as genai
-            genai.configure(api_key=GEMINI_API_KEY)
-            model = genai.GenerativeModel(GEMINI_MODEL)
-            
-            response = model.generate_content(prompt)
-            response_text = response.text
+            result = await llm_generate(prompt, backend="gemini", model=GEMINI_MODEL, timeout=60)
+            response_text = result.text
         
         elif MODEL_BACKEND == "ollama":
-            payload = {"model": OLLAMA_MODEL, "prompt": prompt}
-            resp = requests.post(f"{OLLAMA_URL}/api/generate", json=payload, stream=True, timeout=60)
-            
-            response_text = ""
-            for line in resp.iter_lines(decode_unicode=True):
-                if not line:
-                    continue
-                try:
-                    obj = json.loads(line)
-                    if isinstance(obj, dict):
-                        response_text += obj.get("response", "") or obj.get("text", "")
-                except Exception:
-                    response_text += line
+            result = await llm_generate(prompt, backend="ollama", model=OLLAMA_MODEL, timeout=60, priority="feedback")
+            response_text = result.text
         
         else:
             return JSONResponse(status_code=501, content={"error": "Backend not configured"})
@@ -2829,6 +3497,8 @@ async def get_combined_feedback(request: Request):
                 "encouragement": "계속 화이팅!"
             })
     
+    except LLMOverloadedError as e:
+        return _overloaded_response(e)
     except Exception as e:
         return JSONResponse(
             status_code=500,
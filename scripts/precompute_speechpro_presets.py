@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+SpeechPro GTP/FST 일괄 사전 계산 스크립트
+
+커리큘럼 데이터셋의 모든 연습 문장에 대해 GTP + Model을 미리 호출해
+data/sp_ko_generated.csv에 저장하고 사전 계산 저장소(data/sp_ko_questions.bin)를 다시 컴파일합니다.
+이후 평가 시에는 Score 호출 한 번만 하게 됩니다.
+
+- 대상: sentences.json(text), vocabulary.json(sentenceKr), speechpro-sentences.json(sentenceKr),
+  pronunciation-words.json(word)
+- 정규화 문장 해시가 이미 프리셋/생성 CSV에 있으면 건너뜀
+- 동시 호출 수 제한, 실패 시 재시도 후 다음 실행에서 이어서 처리 (결과는 한 건씩 바로 CSV에 기록)
+
+사용법:
+    python scripts/precompute_speechpro_presets.py [--concurrency 4] [--retries 3] [--limit N] [--dry-run]
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import base64
+import asyncio
+import argparse
+from typing import Dict, Iterable, List, Set, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.services.speechpro_service import (  # noqa: E402
+    normalize_spaces,
+    get_speechpro_url,
+    call_speechpro_gtp_async,
+    call_speechpro_model_async,
+    close_speechpro_session,
+)
+from backend.services.precomputed_sentence_store import (  # noqa: E402
+    SPEECHPRO_PRESET_CSV,
+    SPEECHPRO_GENERATED_CSV,
+    SPEECHPRO_PRESET_STORE,
+    build_preset_store,
+    text_hash,
+)
+
+
+# (데이터셋 파일, 문장 필드)
+DATASETS = [
+    ("sentences.json", "text"),
+    ("vocabulary.json", "sentenceKr"),
+    ("speechpro-sentences.json", "sentenceKr"),
+    ("pronunciation-words.json", "word"),
+]
+
+CSV_FIELDS = ["ko_id", "order", "sentence", "syll_ltrs", "syll_phns", "fst", "dataset"]
+
+
+def collect_sentences(data_dir: str = "data") -> List[Tuple[str, str]]:
+    """데이터셋별 (문장, 데이터셋 이름) 목록 (정규화 문장 기준 중복 제거)"""
+    seen: Set[str] = set()
+    sentences = []
+    for filename, field in DATASETS:
+        try:
+            with open(os.path.join(data_dir, filename), "r", encoding="utf-8") as f:
+                items = json.load(f)
+        except Exception as e:
+            print(f"Error loading {filename}: {e}")
+            continue
+        for item in items:
+            text = normalize_spaces(str(item.get(field) or "")) if isinstance(item, dict) else ""
+            if text and text not in seen:
+                seen.add(text)
+                sentences.append((text, filename))
+    return sentences
+
+
+def existing_hashes(csv_paths: Iterable[str]) -> Tuple[Set[str], int]:
+    """이미 저장된 문장 해시와 생성 CSV의 마지막 order"""
+    hashes: Set[str] = set()
+    last_order = 0
+    for path in csv_paths:
+        if not os.path.exists(path):
+            continue
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                if row.get("fst"):
+                    hashes.add(text_hash(row.get("sentence", "")))
+                if row.get("dataset"):
+                    try:
+                        last_order = max(last_order, int(row.get("order") or 0))
+                    except ValueError:
+                        pass
+    return hashes, last_order
+
+
+async def _precompute_one(text: str, retries: int) -> Dict[str, str]:
+    # 서버용 서킷 브레이커는 쓰지 않는다: 일괄 작업에서 연속 실패로 서킷이 열리면
+    # 아래 재시도 대기(1s, 2s...)보다 쿨다운이 길어 남은 문장이 모두 바로 실패한다
+    delay = 1.0
+    for attempt in range(1, retries + 1):
+        try:
+            gtp = await call_speechpro_gtp_async(text, breaker=None)
+            model = await call_speechpro_model_async(text, gtp.syll_ltrs, gtp.syll_phns, breaker=None)
+            if not model.fst:
+                raise RuntimeError("Model API returned empty fst")
+            base64.b64decode(model.fst, validate=True)
+            return {"syll_ltrs": model.syll_ltrs, "syll_phns": model.syll_phns, "fst": model.fst}
+        except Exception as e:
+            if attempt == retries:
+                raise
+            print(f"  재시도 {attempt}/{retries}: {text} ({e})")
+            await asyncio.sleep(delay)
+            delay *= 2
+    raise RuntimeError("unreachable")
+
+
+async def precompute(
+    pending: List[Tuple[str, str]],
+    out_path: str,
+    start_order: int,
+    concurrency: int,
+    retries: int,
+) -> Tuple[int, int]:
+    """pending 문장을 동시 호출 수 제한 하에 계산하고 끝나는 대로 out_path에 추가"""
+    semaphore = asyncio.Semaphore(concurrency)
+    new_file = not os.path.exists(out_path) or os.path.getsize(out_path) == 0
+    done = failed = 0
+    order = start_order
+
+    with open(out_path, "a", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        if new_file:
+            writer.writeheader()
+            f.flush()
+
+        async def worker(text: str, dataset: str):
+            nonlocal done, failed, order
+            async with semaphore:
+                try:
+                    result = await _precompute_one(text, retries)
+                except Exception as e:
+                    failed += 1
+                    print(f"✗ {text} ({dataset}): {e}")
+                    return
+            order += 1
+            writer.writerow({"ko_id": "", "order": order, "sentence": text, "dataset": dataset, **result})
+            f.flush()
+            done += 1
+            print(f"✓ [{done + failed}/{len(pending)}] {text}")
+
+        try:
+            await asyncio.gather(*(worker(text, dataset) for text, dataset in pending))
+        finally:
+            await close_speechpro_session()
+    return done, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="커리큘럼 문장의 SpeechPro GTP/FST 일괄 사전 계산")
+    parser.add_argument("--data-dir", default="data", help="데이터셋 디렉터리")
+    parser.add_argument("--out", default=SPEECHPRO_GENERATED_CSV, help="생성 결과 CSV")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 GTP/Model 호출 수")
+    parser.add_argument("--retries", type=int, default=3, help="문장당 시도 횟수")
+    parser.add_argument("--limit", type=int, default=0, help="이번 실행에서 처리할 최대 문장 수 (0: 전부)")
+    parser.add_argument("--dry-run", action="store_true", help="계산할 문장만 출력")
+    args = parser.parse_args()
+
+    sentences = collect_sentences(args.data_dir)
+    hashes, last_order = existing_hashes([SPEECHPRO_PRESET_CSV, args.out])
+    pending = [(text, dataset) for text, dataset in sentences if text_hash(text) not in hashes]
+    if args.limit:
+        pending = pending[:args.limit]
+
+    print(f"SpeechPro: {get_speechpro_url()}")
+    print(f"문장 {len(sentences)}개 중 사전 계산 필요 {len(pending)}개 (이미 있음 {len(sentences) - len(pending)}개)")
+    if args.dry_run:
+        for text, dataset in pending:
+            print(f"  {dataset}: {text}")
+        return
+
+    started = time.time()
+    done, failed = 0, 0
+    if pending:
+        done, failed = asyncio.run(precompute(pending, args.out, last_order, args.concurrency, args.retries))
+    print(f"완료 {done}개, 실패 {failed}개 ({time.time() - started:.1f}s)")
+
+    total = build_preset_store([SPEECHPRO_PRESET_CSV, args.out], SPEECHPRO_PRESET_STORE)
+    print(f"사전 계산 저장소 컴파일: {total}개 문장")
+    if failed:
+        print("실패한 문장은 다시 실행하면 이어서 처리합니다.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -601,15 +601,10 @@
       formData.append("text", text);
       formData.append("audio", audioBlob, "recording.wav");
 
-      if (
-        selectedSentence &&
-        selectedSentence.syll_ltrs &&
-        selectedSentence.syll_phns &&
-        selectedSentence.fst
-      ) {
-        formData.append("syll_ltrs", selectedSentence.syll_ltrs);
-        formData.append("syll_phns", selectedSentence.syll_phns);
-        formData.append("fst", selectedSentence.fst);
+      // 프리셋 문장은 FST 대신 참조(id, 해시)만 전송
+      if (selectedSentence && selectedSentence.fst_hash) {
+        formData.append("sentence_id", selectedSentence.id);
+        formData.append("fst_hash", selectedSentence.fst_hash);
       }
 
       const response = await fetch("/api/speechpro/evaluate", {
@@ -689,7 +684,7 @@
       console.log(
         "loadSentencesData() called - fetching from /api/speechpro/sentences"
       );
-      const response = await fetch("/api/speechpro/sentences");
+      const response = await fetch("/api/speechpro/sentences?blobs=false");
       console.log("Response received:", response);
 
       if (!response.ok) {